@@ -1,4 +1,8 @@
-"""Lancement du serveur FastAPI SmartCity Explorer."""
+"""Lancement du serveur FastAPI SmartCity Explorer.
+
+WORKERS > 1 (ou 0 : un par CPU) : workers préforkés partageant un snapshot
+des données (`backend.launcher`). Sinon un seul processus uvicorn.
+"""
 
 import uvicorn
 
@@ -7,10 +11,15 @@ from backend.core.config import get_settings
 
 def main():
     settings = get_settings()
+    if settings.workers != 1 and not settings.debug:
+        from backend.launcher import serve
+
+        serve()
+        return
     uvicorn.run(
-        "backend.main:app",
-        host="0.0.0.0",
-        port=8000,
+        "backend.app:app",
+        host=settings.host,
+        port=settings.port,
         reload=settings.debug,
     )
 
@@ -0,0 +1,140 @@
+"""Dépendances FastAPI partagées entre les routers."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Path, Request
+from pydantic import BaseModel
+
+from backend.api.responses import JSON, encode_list, encode_one
+from backend.core.config import get_settings
+from backend.core.deadline import remaining_ms
+from backend.core.snapshot import get_snapshot
+from backend.db.mongo import OWNER_FIELD, bounded, get_mongo_db
+from backend.db.neo4j import get_neo4j_driver
+from backend.repositories.loaders import Loaders
+
+IDS_DESCRIPTION = "Liste d'ids séparés par des virgules : ne retourne que ces éléments (une seule requête groupée)."
+
+_default_owner: str | None = None
+
+
+# ── Profil (propriétaire des données) ──────────────────────────
+
+def profile_path(profile: str = Path(description="Id du profil (nœud `Person`) dont on lit le portfolio.")) -> str:
+    """Déclare `{profile}` dans l'OpenAPI des routes préfixées par `/{profile}`."""
+    return profile
+
+
+async def _resolve_default_owner() -> str:
+    """Profil des routes sans préfixe : `default_profile`, sinon le premier profil en base (mis en cache)."""
+    global _default_owner
+    if _default_owner is None:
+        configured = get_settings().default_profile
+        if configured:
+            _default_owner = configured
+        else:
+            doc = await get_mongo_db()["personal_infos"].find_one(
+                {}, {"_id": 0, "id": 1}, sort=[("_id", 1)], max_time_ms=remaining_ms(),
+            )
+            if doc is None:
+                raise HTTPException(status_code=404, detail="Aucun profil trouvé")
+            _default_owner = doc["id"]
+    return _default_owner
+
+
+async def get_owner(request: Request) -> str:
+    """Id du profil servi : segment `/{profile}` de l'URL, ou profil par défaut."""
+    profile = request.path_params.get("profile")
+    if profile is not None:
+        return profile
+    return await _resolve_default_owner()
+
+
+def get_loaders(request: Request, owner: str = Depends(get_owner)) -> Loaders:
+    """Loaders de la requête courante (créés au premier usage, cache limité à la requête)."""
+    loaders = getattr(request.state, "loaders", None)
+    if loaders is None:
+        loaders = Loaders(get_mongo_db(), get_neo4j_driver(), owner)
+        request.state.loaders = loaders
+    return loaders
+
+
+# ── Chargements ────────────────────────────────────────────────
+
+
+def parse_ids(ids: str) -> list[str]:
+    """Découpe `?ids=a,b,c` en liste sans doublon (ordre conservé)."""
+    parsed = list(dict.fromkeys(part.strip() for part in ids.split(",") if part.strip()))
+    limit = get_settings().max_ids_per_request
+    if len(parsed) > limit:
+        raise HTTPException(status_code=400, detail=f"Trop d'ids demandés (maximum {limit})")
+    return parsed
+
+
+@lru_cache(maxsize=None)
+def projection(model: type[BaseModel]) -> dict[str, int]:
+    """Projection MongoDB réduite aux champs du modèle.
+
+    Les documents sont stockés sous forme canonique par le seed (noms de
+    champs du modèle, dates natives) : la lecture se limite à cette projection.
+    """
+    return {"_id": 0, **{name: 1 for name in model.model_fields}}
+
+
+def find_owned(owner: str, collection: str, model: type[BaseModel]):
+    """Curseur sur tous les documents d'un profil (index `owner_id_1_id_1`), borné par la deadline."""
+    return bounded(get_mongo_db()[collection].find({OWNER_FIELD: owner}, projection(model)))
+
+
+def snapshot_key(owner: str, collection: str, fmt: str = JSON) -> str:
+    return f"{owner}/{collection}" if fmt == JSON else f"{owner}/{collection}.{fmt}"
+
+
+def from_snapshot(owner: str, collection: str, fmt: str = JSON) -> Optional[bytes]:
+    """Corps pré-encodé en `fmt` depuis le snapshot partagé (mode multi-workers), sinon None."""
+    snapshot = get_snapshot()
+    return snapshot.get(snapshot_key(owner, collection, fmt)) if snapshot is not None else None
+
+
+async def find_all(owner: str, collection: str, model: type[BaseModel], not_found: str, fmt: str = JSON) -> bytes:
+    """Charge tous les documents d'un profil dans une collection, encodés en `fmt` (404 si aucun)."""
+    body = from_snapshot(owner, collection, fmt)
+    if body is not None:
+        return body
+    docs = await find_owned(owner, collection, model).to_list()
+    if not docs:
+        raise HTTPException(status_code=404, detail=not_found)
+    return encode_list(model, docs, fmt)
+
+
+async def load_by_ids(
+    loaders: Loaders,
+    collection: str,
+    model: type[BaseModel],
+    ids: str,
+    not_found: str,
+    fmt: str = JSON,
+) -> bytes:
+    """Charge plusieurs documents par id en une requête ; les ids inconnus sont ignorés."""
+    docs = await loaders.collection(collection).load_many(parse_ids(ids))
+    found = [doc for doc in docs if doc is not None]
+    if not found:
+        raise HTTPException(status_code=404, detail=not_found)
+    return encode_list(model, found, fmt)
+
+
+async def load_one(
+    loaders: Loaders,
+    collection: str,
+    model: type[BaseModel],
+    item_id: str,
+    not_found: str,
+    fmt: str = JSON,
+) -> bytes:
+    doc: Optional[dict] = await loaders.collection(collection).load(item_id)
+    if doc is None:
+        raise HTTPException(status_code=404, detail=not_found)
+    return encode_one(model, doc, fmt)
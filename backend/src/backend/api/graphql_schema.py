@@ -0,0 +1,262 @@
+"""Schéma GraphQL — types calqués sur `shared/src/schemas.py`.
+
+Les champs de relation (projet → technologies / compétences, expérience →
+compétences, certification → compétences, compétence → catégorie) passent
+par les loaders de la requête : une requête Neo4j groupée puis une requête
+`$in` MongoDB par champ et par niveau, quel que soit le nombre de parents.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Optional
+
+from graphql import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLID,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLScalarType,
+    GraphQLSchema,
+    GraphQLString,
+)
+from pydantic import BaseModel
+
+from backend.api.dependencies import projection
+from backend.core.assets import with_asset_urls
+from backend.core.deadline import remaining_ms
+from backend.db.mongo import OWNER_FIELD, bounded
+from backend.models import (
+    Certification,
+    Experience,
+    Hobby,
+    ParcoursScolaire,
+    PersonalInfo,
+    Projet,
+    Skill,
+    Techno,
+)
+from backend.repositories.loaders import Loaders
+
+
+def _serialize_date(value: Any) -> str:
+    return value.isoformat()
+
+
+def _parse_date(value: Any) -> date:
+    return date.fromisoformat(value)
+
+
+GraphQLDate = GraphQLScalarType(
+    name="Date",
+    description="Date ISO 8601 (AAAA-MM-JJ).",
+    serialize=_serialize_date,
+    parse_value=_parse_date,
+)
+
+
+# ── Résolution via les loaders ─────────────────────────────────
+
+def _loaders(info: GraphQLResolveInfo) -> Loaders:
+    return info.context["loaders"]
+
+
+async def _all(info: GraphQLResolveInfo, collection: str, model: type[BaseModel]) -> list[BaseModel]:
+    loaders = _loaders(info)
+    docs = await bounded(loaders.db[collection].find({OWNER_FIELD: loaders.owner}, projection(model))).to_list()
+    return [model.model_validate(with_asset_urls(doc), by_alias=False, by_name=True) for doc in docs]
+
+
+async def _by_ids(
+    info: GraphQLResolveInfo,
+    collection: str,
+    model: type[BaseModel],
+    ids: list[str],
+) -> list[BaseModel]:
+    docs = await _loaders(info).collection(collection).load_many(ids)
+    return [
+        model.model_validate(with_asset_urls(doc), by_alias=False, by_name=True)
+        for doc in docs
+        if doc is not None
+    ]
+
+
+def _list_resolver(collection: str, model: type[BaseModel]):
+    async def resolve(root: Any, info: GraphQLResolveInfo, ids: Optional[list[str]] = None):
+        if ids is not None:
+            return await _by_ids(info, collection, model, ids)
+        return await _all(info, collection, model)
+    return resolve
+
+
+def _item_resolver(collection: str, model: type[BaseModel]):
+    async def resolve(root: Any, info: GraphQLResolveInfo, id: str):
+        found = await _by_ids(info, collection, model, [id])
+        return found[0] if found else None
+    return resolve
+
+
+def _related_resolver(
+    source: str,
+    rel_type: str,
+    target: str,
+    collection: str,
+    model: type[BaseModel],
+):
+    async def resolve(parent: BaseModel, info: GraphQLResolveInfo):
+        related_ids = await _loaders(info).relation(source, rel_type, target).load(parent.id)
+        return await _by_ids(info, collection, model, related_ids or [])
+    return resolve
+
+
+async def _resolve_category(skill: Skill, info: GraphQLResolveInfo) -> Optional[dict]:
+    names = await _loaders(info).relation("Skill", "BELONGS_TO", "Category", prop="nom").load(skill.id)
+    # Sans nœud Category dans le graphe, on retombe sur le champ texte du document.
+    nom = names[0] if names else skill.category
+    return {"nom": nom} if nom else None
+
+
+async def _resolve_personal_info(root: Any, info: GraphQLResolveInfo) -> Optional[PersonalInfo]:
+    loaders = _loaders(info)
+    doc = await loaders.db["personal_infos"].find_one(
+        {OWNER_FIELD: loaders.owner}, projection(PersonalInfo), max_time_ms=remaining_ms(),
+    )
+    return PersonalInfo.model_validate(doc, by_alias=False, by_name=True) if doc is not None else None
+
+
+# ── Types ──────────────────────────────────────────────────────
+
+_IDS_ARG = {"ids": GraphQLArgument(GraphQLList(GraphQLNonNull(GraphQLID)))}
+_ID_ARG = {"id": GraphQLArgument(GraphQLNonNull(GraphQLID))}
+
+ContactType = GraphQLObjectType("Contact", lambda: {
+    "liens_linkedin": GraphQLField(GraphQLString),
+    "telephone": GraphQLField(GraphQLString),
+    "email": GraphQLField(GraphQLString),
+})
+
+PersonalInfoType = GraphQLObjectType("PersonalInfo", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLString),
+    "prenom": GraphQLField(GraphQLString),
+    "contact": GraphQLField(ContactType),
+    "description": GraphQLField(GraphQLString),
+})
+
+CategoryType = GraphQLObjectType("Category", lambda: {
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+})
+
+SkillType = GraphQLObjectType("Skill", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "category": GraphQLField(CategoryType, resolve=_resolve_category),
+    "description": GraphQLField(GraphQLString),
+})
+
+TechnoType = GraphQLObjectType("Techno", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "image": GraphQLField(GraphQLString),
+})
+
+ProjetType = GraphQLObjectType("Projet", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "date_debut": GraphQLField(GraphQLDate),
+    "date_fin": GraphQLField(GraphQLDate),
+    "description": GraphQLField(GraphQLString),
+    "images": GraphQLField(GraphQLList(GraphQLNonNull(GraphQLString))),
+    "entreprise": GraphQLField(GraphQLString),
+    "collaborateurs": GraphQLField(GraphQLList(GraphQLNonNull(GraphQLString))),
+    "lien_github": GraphQLField(GraphQLString),
+    "status": GraphQLField(GraphQLString),
+    "technologies": GraphQLField(
+        GraphQLList(GraphQLNonNull(TechnoType)),
+        resolve=_related_resolver("Project", "USES_TECHNOLOGY", "Technology", "technologies", Techno),
+    ),
+    "skills": GraphQLField(
+        GraphQLList(GraphQLNonNull(SkillType)),
+        resolve=_related_resolver("Project", "REQUIRES_SKILL", "Skill", "skills", Skill),
+    ),
+})
+
+ExperienceType = GraphQLObjectType("Experience", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "description": GraphQLField(GraphQLString),
+    "image": GraphQLField(GraphQLString),
+    "company": GraphQLField(GraphQLString),
+    "type_de_poste": GraphQLField(GraphQLString),
+    "date_debut": GraphQLField(GraphQLDate),
+    "date_fin": GraphQLField(GraphQLDate),
+    "role": GraphQLField(GraphQLString),
+    "skills": GraphQLField(
+        GraphQLList(GraphQLNonNull(SkillType)),
+        resolve=_related_resolver("Experience", "APPLIED_SKILL", "Skill", "skills", Skill),
+    ),
+})
+
+ParcoursScolaireType = GraphQLObjectType("ParcoursScolaire", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "school_name": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "degree": GraphQLField(GraphQLString),
+    "description": GraphQLField(GraphQLString),
+    "start_year": GraphQLField(GraphQLInt),
+    "end_year": GraphQLField(GraphQLInt),
+    "grade": GraphQLField(GraphQLString),
+})
+
+CertificationType = GraphQLObjectType("Certification", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "image": GraphQLField(GraphQLString),
+    "description": GraphQLField(GraphQLString),
+    "obtention_date": GraphQLField(GraphQLDate),
+    "skills": GraphQLField(
+        GraphQLList(GraphQLNonNull(SkillType)),
+        resolve=_related_resolver("Certification", "VALIDATES_SKILL", "Skill", "skills", Skill),
+    ),
+})
+
+HobbyType = GraphQLObjectType("Hobby", lambda: {
+    "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+    "nom": GraphQLField(GraphQLNonNull(GraphQLString)),
+    "description": GraphQLField(GraphQLString),
+})
+
+
+def _collection_fields(
+    names: tuple[str, str],
+    item_type: GraphQLObjectType,
+    collection: str,
+    model: type[BaseModel],
+) -> dict[str, GraphQLField]:
+    """Champ liste (`projets(ids: [...])`) + champ unitaire (`projet(id: ...)`)."""
+    list_name, item_name = names
+    return {
+        list_name: GraphQLField(
+            GraphQLList(GraphQLNonNull(item_type)),
+            args=_IDS_ARG,
+            resolve=_list_resolver(collection, model),
+        ),
+        item_name: GraphQLField(item_type, args=_ID_ARG, resolve=_item_resolver(collection, model)),
+    }
+
+
+QueryType = GraphQLObjectType("Query", lambda: {
+    "personal_info": GraphQLField(PersonalInfoType, resolve=_resolve_personal_info),
+    **_collection_fields(("projets", "projet"), ProjetType, "projects", Projet),
+    **_collection_fields(("experiences", "experience"), ExperienceType, "experiences", Experience),
+    **_collection_fields(("skills", "skill"), SkillType, "skills", Skill),
+    **_collection_fields(("technologies", "technology"), TechnoType, "technologies", Techno),
+    **_collection_fields(("hobbies", "hobby"), HobbyType, "hobbies", Hobby),
+    **_collection_fields(("parcours_scolaire", "parcours"), ParcoursScolaireType, "educations", ParcoursScolaire),
+    **_collection_fields(("certifications", "certification"), CertificationType, "certifications", Certification),
+})
+
+schema = GraphQLSchema(query=QueryType)
@@ -0,0 +1,209 @@
+"""Réponses API — sérialisation des listes (JSON, MessagePack, CBOR en bloc ou flux NDJSON).
+
+Le chemin JSON valide tous les documents en un seul appel `TypeAdapter`
+puis les encode directement en octets (sérialiseur Rust de pydantic-core).
+Les routes renvoient ces octets tels quels : FastAPI ne repasse pas par
+`response_model` (pas de seconde validation ni d'encodeur JSON Python).
+
+Les documents sont canoniques en base (noms de champs, dates natives) : la
+validation se fait par nom de champ (`by_name`), sans résolution d'alias ni
+parsing de dates ; les alias ne servent qu'à l'encodage de sortie.
+
+Formats binaires négociés par `Accept: application/msgpack` ou
+`application/cbor` (dépendances optionnelles `msgpack` / `cbor2`, extra
+`wire`) : encodés depuis les mêmes données validées (`dump_python`), dates
+natives — CBOR : tag 100 (jours) pour une date, tag 1 pour un datetime ;
+MessagePack : extension timestamp (une date à minuit UTC). Sans la
+bibliothèque, la requête reçoit du JSON.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from motor.motor_asyncio import AsyncIOMotorCursor
+from pydantic import BaseModel, TypeAdapter
+
+from backend.core.assets import with_asset_urls
+from backend.core.config import get_settings
+
+try:
+    import msgpack
+except ImportError:  # msgpack est optionnel : sans lui, `Accept: application/msgpack` reçoit du JSON
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # idem pour cbor2 et `Accept: application/cbor`
+    cbor2 = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# ── Formats de réponse ─────────────────────────────────────────
+
+JSON, MSGPACK, CBOR = "json", "msgpack", "cbor"
+
+# Formats disponibles (bibliothèque installée) → type MIME de la réponse.
+MEDIA_TYPES: dict[str, str] = {JSON: "application/json"}
+if msgpack is not None:
+    MEDIA_TYPES[MSGPACK] = "application/msgpack"
+if cbor2 is not None:
+    MEDIA_TYPES[CBOR] = "application/cbor"
+
+_ACCEPTED: dict[str, str] = {
+    "application/json": JSON,
+    "application/msgpack": MSGPACK,
+    "application/x-msgpack": MSGPACK,
+    "application/vnd.msgpack": MSGPACK,
+    "application/cbor": CBOR,
+}
+
+# Présent quand une partie de la réponse vient des données de repli (dépendance en panne).
+DEGRADED_HEADER = "X-Degraded"
+
+
+class EncodedResponse(Response):
+    """Réponse dont le corps est déjà encodé dans le format négocié (`wire_format`)."""
+
+    def __init__(self, content: bytes, fmt: str = JSON, headers: Optional[dict[str, str]] = None):
+        # Le corps dépend de `Accept` : les caches HTTP doivent en tenir compte.
+        super().__init__(content, headers={"Vary": "Accept", **(headers or {})}, media_type=MEDIA_TYPES[fmt])
+
+
+def _quality(params: str) -> float:
+    for param in params.split(";"):
+        name, _, value = param.partition("=")
+        if name.strip() == "q":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 1.0
+
+
+def wire_format(request: Request) -> str:
+    """Format de réponse demandé par `Accept` (meilleur `q` parmi les formats disponibles), JSON par défaut."""
+    accept = request.headers.get("accept")
+    if not accept:
+        return JSON
+    best, best_q = JSON, 0.0
+    for part in accept.split(","):
+        media, _, params = part.partition(";")
+        fmt = _ACCEPTED.get(media.strip().lower())
+        if fmt is None or fmt not in MEDIA_TYPES:
+            continue
+        q = _quality(params)
+        if q > best_q:
+            best, best_q = fmt, q
+    return best
+
+
+@lru_cache(maxsize=None)
+def _adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # MongoDB renvoie des datetimes naïfs en UTC.
+        return msgpack.Timestamp.from_datetime(value if value.tzinfo else value.replace(tzinfo=timezone.utc))
+    if isinstance(value, date):
+        return msgpack.Timestamp.from_datetime(datetime.combine(value, time(), tzinfo=timezone.utc))
+    raise TypeError(f"Type non encodable en MessagePack : {type(value).__name__}")
+
+
+def _dump(adapter: TypeAdapter, value: Any, fmt: str) -> bytes:
+    if fmt == JSON:
+        return adapter.dump_json(value, by_alias=True)
+    data = adapter.dump_python(value, by_alias=True)  # dates et datetimes restent natifs
+    if fmt == MSGPACK:
+        return msgpack.packb(data, default=_msgpack_default)
+    return cbor2.dumps(data, timezone=timezone.utc, datetime_as_timestamp=True)
+
+
+def _validate(model: type[BaseModel], docs: list[dict] | dict) -> tuple[TypeAdapter, Any]:
+    if isinstance(docs, list):
+        adapter = _adapter(list[model])
+        docs = [with_asset_urls(doc) for doc in docs]
+    else:
+        adapter = _adapter(model)
+        docs = with_asset_urls(docs)
+    return adapter, adapter.validate_python(docs, by_alias=False, by_name=True)
+
+
+def encode_list(model: type[BaseModel], docs: list[dict], fmt: str = JSON) -> bytes:
+    """Documents MongoDB → `fmt` (alias conservés, URLs d'images hashées), validés en bloc."""
+    return _dump(*_validate(model, docs), fmt)
+
+
+def encode_one(model: type[BaseModel], doc: dict, fmt: str = JSON) -> bytes:
+    return _dump(*_validate(model, doc), fmt)
+
+
+def encode_formats(model: type[BaseModel], docs: list[dict] | dict) -> dict[str, bytes]:
+    """Un document ou une liste encodés dans chaque format disponible, validés une seule fois."""
+    adapter, value = _validate(model, docs)
+    return {fmt: _dump(adapter, value, fmt) for fmt in MEDIA_TYPES}
+
+
+def degraded_headers(degraded: bool, source: str = "neo4j") -> dict[str, str]:
+    return {DEGRADED_HEADER: source} if degraded else {}
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Le client a-t-il demandé explicitement un flux NDJSON (`Accept: application/x-ndjson`) ?"""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def _iter_ndjson(
+    first: dict,
+    cursor: AsyncIOMotorCursor,
+    model: type[BaseModel],
+    enrich: Optional[Callable[[dict], dict]],
+) -> AsyncIterator[bytes]:
+    """Valide et émet chaque document dès qu'il arrive du curseur.
+
+    Le générateur n'avance que lorsque le serveur a fini d'envoyer la ligne
+    précédente : un client lent ralentit la lecture du curseur (backpressure)
+    au lieu de faire grossir un tampon en mémoire.
+    """
+    def encode(doc: dict) -> bytes:
+        if enrich is not None:
+            doc = enrich(doc)
+        doc = with_asset_urls(doc)
+        validated = model.model_validate(doc, by_alias=False, by_name=True)
+        return validated.model_dump_json(by_alias=True).encode() + b"\n"
+
+    try:
+        yield encode(first)
+        async for doc in cursor:
+            yield encode(doc)
+    finally:
+        await cursor.close()
+
+
+async def ndjson_response(
+    cursor: AsyncIOMotorCursor,
+    model: type[BaseModel],
+    not_found: str,
+    enrich: Optional[Callable[[dict], dict]] = None,
+) -> StreamingResponse:
+    """Diffuse un curseur Motor en NDJSON, une ligne par document.
+
+    Le premier document est lu avant d'ouvrir le flux pour conserver le 404
+    des routes JSON lorsque la collection est vide. La mémoire consommée
+    dépend de la taille des lots (`stream_batch_size`), pas de la collection.
+    `enrich` permet d'ajouter des champs au document brut avant validation.
+    """
+    cursor.batch_size(get_settings().stream_batch_size)
+    first = await anext(cursor, None)
+    if first is None:
+        await cursor.close()
+        raise HTTPException(status_code=404, detail=not_found)
+    return StreamingResponse(
+        _iter_ndjson(first, cursor, model, enrich), media_type=NDJSON_MEDIA_TYPE, headers={"Vary": "Accept"},
+    )
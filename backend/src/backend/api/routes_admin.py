@@ -0,0 +1,61 @@
+"""Routes API — Administration (profils de requêtes).
+
+Protégées par `Authorization: Bearer <profiler_secret>` ; inexistantes (404)
+si aucun secret n'est configuré.
+"""
+
+from __future__ import annotations
+
+import hmac
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from backend.core.config import get_settings
+from backend.core.profiler import get_profile_store, to_collapsed, to_speedscope
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def require_admin(authorization: Optional[str] = Header(None)) -> None:
+    secret = get_settings().profiler_secret
+    if not secret:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if authorization is None or not hmac.compare_digest(authorization, f"Bearer {secret}"):
+        raise HTTPException(status_code=401, detail="Jeton d'administration invalide")
+
+
+@router.get(
+    "/profiles",
+    summary="Profils de requêtes enregistrés",
+    description="Liste des requêtes profilées (du plus récent au plus ancien) : durée, nombre d'échantillons, attentes MongoDB / Neo4j.",
+    dependencies=[Depends(require_admin)],
+)
+async def list_profiles():
+    return get_profile_store().list()
+
+
+@router.get(
+    "/profiles/{profile_id}",
+    summary="Profil d'une requête",
+    description=(
+        "Télécharge un profil (id renvoyé dans l'en-tête `X-Profile-Id` de la requête profilée) : "
+        "`collapsed` (flamegraph.pl, speedscope) ou `speedscope` (https://www.speedscope.app)."
+    ),
+    dependencies=[Depends(require_admin)],
+    responses={404: {"description": "Profil inconnu ou expiré."}},
+)
+async def get_profile(
+    profile_id: str,
+    format: Literal["collapsed", "speedscope"] = Query("speedscope", description="Format de sortie."),
+):
+    data = get_profile_store().load(profile_id)
+    if data is None:
+        raise HTTPException(status_code=404, detail="Profil introuvable")
+    if format == "collapsed":
+        return PlainTextResponse(to_collapsed(data))
+    return JSONResponse(
+        to_speedscope(data),
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'},
+    )
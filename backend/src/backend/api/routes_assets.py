@@ -0,0 +1,44 @@
+"""Routes API — Images statiques (noms hashés, cache immuable)."""
+
+from __future__ import annotations
+
+import mimetypes
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from backend.core.assets import get_asset_manifest, get_assets_dir, get_served_files
+
+router = APIRouter(prefix="/assets", tags=["assets"])
+
+# Le nom contient le hash du contenu : le fichier ne change jamais à URL constante.
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/avif", ".avif")
+
+
+@router.get(
+    "/manifest.json",
+    summary="Manifeste des images",
+    description="Associe chaque image référencée dans les documents à son URL hashée et à ses variantes (miniatures, WebP, AVIF).",
+)
+async def get_manifest():
+    return get_asset_manifest()
+
+
+@router.get(
+    "/{filename}",
+    summary="Image hashée",
+    description=(
+        "Sert une image produite par `build_assets`. Réponse cacheable indéfiniment "
+        "(`Cache-Control: immutable`), requêtes `Range` supportées, envoi zéro-copie "
+        "si le serveur ASGI supporte l'extension `http.response.pathsend`."
+    ),
+    response_class=FileResponse,
+    responses={404: {"description": "Fichier absent du manifeste."}},
+)
+async def get_asset(filename: str):
+    if filename not in get_served_files():
+        raise HTTPException(status_code=404, detail="Asset introuvable")
+    return FileResponse(get_assets_dir() / filename, headers={"Cache-Control": IMMUTABLE_CACHE})
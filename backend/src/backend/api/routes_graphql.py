@@ -0,0 +1,309 @@
+"""Routes API — GraphQL (requêtes à la carte sur MongoDB + Neo4j).
+
+Protections :
+- profondeur et complexité maximales vérifiées à la validation ;
+- requêtes persistées (protocole APQ) : le client envoie le hash SHA-256
+  de la requête, le document déjà parsé et validé est réutilisé.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from inspect import isawaitable
+from typing import Any, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValidationRule,
+    execute,
+    get_named_type,
+    is_list_type,
+    parse,
+    specified_rules,
+    validate,
+)
+from graphql.type import get_nullable_type
+
+from backend.api.dependencies import get_loaders
+from backend.api.graphql_schema import schema
+from backend.api.responses import degraded_headers
+from backend.core.config import get_settings
+from backend.repositories.loaders import Loaders
+
+router = APIRouter(tags=["graphql"])
+
+
+# ── Limites de profondeur / complexité ─────────────────────────
+
+def _measure(
+    selection_set: Optional[SelectionSetNode],
+    parent_type: Any,
+    fragments: dict[str, FragmentDefinitionNode],
+    memo: dict[tuple[str, str], tuple[int, int]],
+    path: frozenset[str] = frozenset(),
+) -> tuple[int, int]:
+    """Retourne (profondeur, coût) d'une sélection, relatifs au champ qui la porte.
+
+    Chaque champ coûte 1 ; la sélection d'un champ liste est multipliée par
+    `graphql_list_factor`, ce qui reflète le nombre de documents à charger.
+    Un fragment est mesuré une fois par type parent (`memo`) ; un fragment
+    déjà présent sur le chemin (`path`) n'est pas suivi : le cycle est refusé
+    par `NoFragmentCyclesRule`.
+    """
+    if selection_set is None or not isinstance(parent_type, GraphQLObjectType):
+        return 0, 0
+
+    factor = get_settings().graphql_list_factor
+    max_depth, cost = 0, 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            field = parent_type.fields.get(selection.name.value)
+            if field is None:
+                continue
+            sub_depth, sub_cost = _measure(
+                selection.selection_set,
+                get_named_type(field.type),
+                fragments,
+                memo,
+                path,
+            )
+            multiplier = factor if is_list_type(get_nullable_type(field.type)) else 1
+            max_depth = max(max_depth, 1 + sub_depth)
+            cost += 1 + multiplier * sub_cost
+            continue
+
+        if isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            fragment = fragments.get(name)
+            if fragment is None or name in path:
+                continue
+            key = (name, parent_type.name)
+            if key not in memo:
+                memo[key] = _measure(fragment.selection_set, parent_type, fragments, memo, path | {name})
+            sub_depth, sub_cost = memo[key]
+        elif isinstance(selection, InlineFragmentNode):
+            sub_depth, sub_cost = _measure(selection.selection_set, parent_type, fragments, memo, path)
+        else:
+            continue
+        max_depth = max(max_depth, sub_depth)
+        cost += sub_cost
+    return max_depth, cost
+
+
+class QueryLimitsRule(ValidationRule):
+    """Refuse les requêtes trop profondes ou trop coûteuses avant exécution."""
+
+    def enter_document(self, node: DocumentNode, *_args: Any) -> None:
+        settings = get_settings()
+        fragments = {
+            definition.name.value: definition
+            for definition in node.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+        root = self.context.schema.query_type
+        memo: dict[tuple[str, str], tuple[int, int]] = {}
+        for definition in node.definitions:
+            if not isinstance(definition, OperationDefinitionNode):
+                continue
+            depth, cost = _measure(definition.selection_set, root, fragments, memo)
+            if depth > settings.graphql_max_depth:
+                self.report_error(GraphQLError(
+                    f"Profondeur de requête {depth} > maximum autorisé {settings.graphql_max_depth}",
+                    definition,
+                ))
+            if cost > settings.graphql_max_complexity:
+                self.report_error(GraphQLError(
+                    f"Complexité de requête {cost} > maximum autorisée {settings.graphql_max_complexity}",
+                    definition,
+                ))
+
+
+_RULES = [*specified_rules, QueryLimitsRule]
+
+
+# ── Requêtes persistées (APQ) ──────────────────────────────────
+
+class PersistedQueries:
+    """Cache LRU `sha256 → document parsé et validé`."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._documents: OrderedDict[str, DocumentNode] = OrderedDict()
+
+    def get(self, sha256: str) -> Optional[DocumentNode]:
+        document = self._documents.get(sha256)
+        if document is not None:
+            self._documents.move_to_end(sha256)
+        return document
+
+    def put(self, sha256: str, document: DocumentNode) -> None:
+        self._documents[sha256] = document
+        self._documents.move_to_end(sha256)
+        while len(self._documents) > self.max_entries:
+            self._documents.popitem(last=False)
+
+
+_persisted: PersistedQueries | None = None
+
+
+def get_persisted_queries() -> PersistedQueries:
+    global _persisted
+    if _persisted is None:
+        _persisted = PersistedQueries(get_settings().graphql_persisted_max_entries)
+    return _persisted
+
+
+def _error(message: str, status_code: int = 400, code: Optional[str] = None) -> JSONResponse:
+    error: dict[str, Any] = {"message": message}
+    if code is not None:
+        error["extensions"] = {"code": code}
+    return JSONResponse(status_code=status_code, content={"errors": [error]})
+
+
+def _check_params(query: Any, variables: Any, operation_name: Any, extensions: Any) -> Optional[JSONResponse]:
+    """Vérifie le type des paramètres de la requête (JSON valide mais mal formé → 400)."""
+    for name, value, expected, message in (
+        ("query", query, str, "chaîne attendue"),
+        ("operationName", operation_name, str, "chaîne attendue"),
+        ("variables", variables, dict, "objet JSON attendu"),
+        ("extensions", extensions, dict, "objet JSON attendu"),
+    ):
+        if value is not None and not isinstance(value, expected):
+            return _error(f"Champ '{name}' : {message}")
+    persisted = (extensions or {}).get("persistedQuery")
+    if persisted is not None and not (
+        isinstance(persisted, dict) and isinstance(persisted.get("sha256Hash", ""), str)
+    ):
+        return _error("Champ 'extensions.persistedQuery' invalide")
+    return None
+
+
+def _compile(query: Optional[str], extensions: dict, graphql_schema: GraphQLSchema) -> DocumentNode | JSONResponse:
+    """Parse + valide la requête, ou la récupère depuis le cache des requêtes persistées."""
+    persisted = extensions.get("persistedQuery") or {}
+    sha256 = persisted.get("sha256Hash")
+    store = get_persisted_queries()
+
+    if sha256 and query is None:
+        document = store.get(sha256)
+        if document is None:
+            return _error("PersistedQueryNotFound", status_code=200, code="PERSISTED_QUERY_NOT_FOUND")
+        return document
+
+    if query is None:
+        return _error("Champ 'query' manquant")
+    if sha256 and hashlib.sha256(query.encode()).hexdigest() != sha256:
+        return _error("Le hash fourni ne correspond pas à la requête", code="PERSISTED_QUERY_HASH_MISMATCH")
+
+    try:
+        document = parse(query)
+    except GraphQLError as exc:
+        return JSONResponse(status_code=400, content={"errors": [exc.formatted]})
+    errors = validate(graphql_schema, document, _RULES)
+    if errors:
+        return JSONResponse(status_code=400, content={"errors": [e.formatted for e in errors]})
+
+    if sha256:
+        store.put(sha256, document)
+    return document
+
+
+async def _run(
+    query: Any,
+    variables: Any,
+    operation_name: Any,
+    extensions: Any,
+    loaders: Loaders,
+) -> JSONResponse:
+    invalid = _check_params(query, variables, operation_name, extensions)
+    if invalid is not None:
+        return invalid
+    document = _compile(query, extensions or {}, schema)
+    if isinstance(document, JSONResponse):
+        return document
+
+    result = execute(
+        schema,
+        document,
+        variable_values=variables,
+        operation_name=operation_name,
+        context_value={"loaders": loaders},
+    )
+    if isawaitable(result):
+        # Exécution synchrone (introspection, `__typename`) si aucun resolver asynchrone n'est appelé.
+        result = await result
+    content: dict[str, Any] = {"data": result.data}
+    if result.errors:
+        content["errors"] = [e.formatted for e in result.errors]
+    if loaders.degraded:
+        # Relations servies depuis les dernières données connues (Neo4j indisponible).
+        content["extensions"] = {"degraded": ["neo4j"]}
+    return JSONResponse(content=content, headers=degraded_headers(loaders.degraded))
+
+
+def _json_param(request: Request, name: str) -> Any:
+    raw = request.query_params.get(name)
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Paramètre '{name}' : JSON invalide")
+
+
+# ── Routes ─────────────────────────────────────────────────────
+
+@router.post(
+    "/graphql",
+    summary="Requête GraphQL",
+    description=(
+        "Exécute une requête GraphQL (`query`, `variables`, `operationName`). "
+        "Supporte les requêtes persistées via `extensions.persistedQuery.sha256Hash`."
+    ),
+)
+async def graphql_post(request: Request, loaders: Loaders = Depends(get_loaders)):
+    try:
+        body = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Corps JSON invalide")
+    if not isinstance(body, dict):
+        raise HTTPException(status_code=400, detail="Corps JSON invalide")
+    return await _run(
+        body.get("query"),
+        body.get("variables"),
+        body.get("operationName"),
+        body.get("extensions"),
+        loaders,
+    )
+
+
+@router.get(
+    "/graphql",
+    summary="Requête GraphQL (GET, requêtes persistées)",
+    description=(
+        "Variante GET, utile avec les requêtes persistées : "
+        "`?extensions={\"persistedQuery\":{\"version\":1,\"sha256Hash\":\"...\"}}` "
+        "produit une URL courte et cacheable."
+    ),
+)
+async def graphql_get(request: Request, loaders: Loaders = Depends(get_loaders)):
+    return await _run(
+        request.query_params.get("query"),
+        _json_param(request, "variables"),
+        request.query_params.get("operationName"),
+        _json_param(request, "extensions"),
+        loaders,
+    )
@@ -4,9 +4,23 @@ from __future__ import annotations
 
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
-from backend.db.mongo import get_mongo_db
+from backend.api.dependencies import (
+    IDS_DESCRIPTION,
+    find_all,
+    find_owned,
+    from_snapshot,
+    get_loaders,
+    get_owner,
+    load_by_ids,
+    load_one,
+    projection,
+)
+from backend.api.responses import EncodedResponse, encode_one, ndjson_response, wants_ndjson, wire_format
+from backend.core.deadline import remaining_ms
+from backend.core.singleflight import coalesce
+from backend.db.mongo import OWNER_FIELD, get_mongo_db
 from backend.models import (
     Certification,
     Contact,
@@ -18,6 +32,7 @@ from backend.models import (
     Skill,
     Techno,
 )
+from backend.repositories.loaders import Loaders
 
 router = APIRouter(prefix="/personal-infos", tags=["personal-infos"])
 
@@ -32,12 +47,21 @@ router = APIRouter(prefix="/personal-infos", tags=["personal-infos"])
     response_description="Document unique contenant les informations personnelles.",
     responses={404: {"description": "Aucune information personnelle trouvée en base de données."}},
 )
-async def get_personal_infos():
+async def get_personal_infos(request: Request, owner: str = Depends(get_owner), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await coalesce(request, lambda: _load_personal_infos(owner, fmt), fmt), fmt)
+
+
+async def _load_personal_infos(owner: str, fmt: str) -> bytes:
+    body = from_snapshot(owner, "personal_infos", fmt)
+    if body is not None:
+        return body
     db = get_mongo_db()
-    doc = await db["personal_infos"].find_one({}, {"_id": 0})
+    doc = await db["personal_infos"].find_one(
+        {OWNER_FIELD: owner}, projection(PersonalInfo), max_time_ms=remaining_ms(),
+    )
     if doc is None:
         raise HTTPException(status_code=404, detail="Aucune info personnelle trouvée")
-    return PersonalInfo.model_validate(doc)
+    return encode_one(PersonalInfo, doc, fmt)
 
 
 # ── Certifications ─────────────────────────────────────────────
@@ -50,9 +74,27 @@ async def get_personal_infos():
     response_description="Liste des certifications avec nom, image, description et date d'obtention.",
     responses={404: {"description": "Aucune certification trouvée en base de données."}},
 )
-async def get_certifications():
-    db = get_mongo_db()
-    docs = await db["certifications"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucune certification trouvée")
-    return [Certification.model_validate(doc) for doc in docs]
+async def get_certifications(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "certifications", Certification, ids, "Aucune certification trouvée", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "certifications", Certification)
+        return await ndjson_response(cursor, Certification, "Aucune certification trouvée")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "certifications", Certification, "Aucune certification trouvée", fmt), fmt), fmt)
+
+
+@router.get(
+    "/certifications/{certification_id}",
+    response_model=Certification,
+    summary="Détail d'une certification",
+    description="Retourne une certification par son id depuis MongoDB.",
+    responses={404: {"description": "Aucune certification ne correspond à cet id."}},
+)
+async def get_certification(certification_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await load_one(loaders, "certifications", Certification, certification_id, "Certification introuvable", fmt), fmt)
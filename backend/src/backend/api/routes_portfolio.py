@@ -2,11 +2,52 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+import asyncio
+import json
+from dataclasses import asdict
+from typing import Literal, Optional
 
-from backend.db.mongo import get_mongo_db
-from backend.db.neo4j import get_neo4j_driver
-from backend.models import Experience, Hobby, ParcoursScolaire, Projet, ProjetDetail, Skill, Techno
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+
+from backend.api.dependencies import (
+    IDS_DESCRIPTION,
+    find_all,
+    find_owned,
+    from_snapshot,
+    get_loaders,
+    get_owner,
+    load_by_ids,
+    load_one,
+    parse_ids,
+)
+from backend.api.responses import (
+    EncodedResponse,
+    degraded_headers,
+    encode_list,
+    encode_one,
+    ndjson_response,
+    wants_ndjson,
+    wire_format,
+)
+from backend.core.deadline import remaining_ms
+from backend.core.singleflight import coalesce
+from backend.db.mongo import ANALYTICS_COLLECTION, OWNER_FIELD, get_mongo_db
+from backend.db.neo4j import bounded_query, call_graph, get_neo4j_driver
+from backend.models import (
+    Experience,
+    Hobby,
+    ParcoursScolaire,
+    PortfolioAnalytics,
+    Projet,
+    ProjetDetail,
+    Skill,
+    Suggestion,
+    Techno,
+    TimelinePage,
+)
+from backend.repositories.loaders import Loaders
+from backend.repositories.suggest import SuggestEntry, get_suggest_indexes
+from backend.repositories.timeline import parse_cursor, read_timeline
 
 router = APIRouter(prefix="/portfolio", tags=["portfolio"])
 
@@ -21,12 +62,30 @@ router = APIRouter(prefix="/portfolio", tags=["portfolio"])
     response_description="Liste des compétences avec id, nom, catégorie et description.",
     responses={404: {"description": "Aucune compétence trouvée en base de données."}},
 )
-async def get_skills():
-    db = get_mongo_db()
-    docs = await db["skills"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucun skill trouvé")
-    return [Skill.model_validate(doc) for doc in docs]
+async def get_skills(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "skills", Skill, ids, "Aucun skill trouvé", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "skills", Skill)
+        return await ndjson_response(cursor, Skill, "Aucun skill trouvé")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "skills", Skill, "Aucun skill trouvé", fmt), fmt), fmt)
+
+
+@router.get(
+    "/skills/{skill_id}",
+    response_model=Skill,
+    summary="Détail d'une compétence",
+    description="Retourne une compétence par son id depuis MongoDB.",
+    responses={404: {"description": "Aucune compétence ne correspond à cet id."}},
+)
+async def get_skill(skill_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await load_one(loaders, "skills", Skill, skill_id, "Compétence introuvable", fmt), fmt)
 
 
 # ── Projets ─────────────────────────────────────────────────────
@@ -39,12 +98,19 @@ async def get_skills():
     response_description="Liste des projets avec nom, dates, description, entreprise et collaborateurs.",
     responses={404: {"description": "Aucun projet trouvé en base de données."}},
 )
-async def get_projets():
-    db = get_mongo_db()
-    docs = await db["projects"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucun projet trouvé")
-    return [Projet.model_validate(doc) for doc in docs]
+async def get_projets(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "projects", Projet, ids, "Aucun projet trouvé", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "projects", Projet)
+        return await ndjson_response(cursor, Projet, "Aucun projet trouvé")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "projects", Projet, "Aucun projet trouvé", fmt), fmt), fmt)
 
 
 @router.get(
@@ -58,41 +124,112 @@ async def get_projets():
     response_description="Liste des projets avec technologies et compétences agrégées depuis Neo4j.",
     responses={404: {"description": "Aucun projet trouvé en base de données."}},
 )
-async def get_projets_details():
-    db = get_mongo_db()
-    docs = await db["projects"].find({}, {"_id": 0}).to_list()
+async def get_projets_details(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        docs = await _load_projets_details(loaders, parse_ids(ids))
+        if not docs:
+            raise HTTPException(status_code=404, detail="Aucun projet trouvé")
+        return EncodedResponse(encode_list(ProjetDetail, docs, fmt), fmt, headers=degraded_headers(loaders.degraded))
+    if wants_ndjson(request):
+        tech_map, skill_map, degraded = await _fetch_project_links(owner)
+        cursor = find_owned(owner, "projects", Projet)
+        response = await ndjson_response(
+            cursor,
+            ProjetDetail,
+            "Aucun projet trouvé",
+            enrich=lambda doc: {
+                **doc,
+                "technologies": tech_map.get(doc.get("nom"), []),
+                "skills": skill_map.get(doc.get("nom"), []),
+            },
+        )
+        response.headers.update(degraded_headers(degraded))
+        return response
+    body, degraded = await coalesce(request, lambda: _load_all_projets_details(owner, fmt), fmt)
+    return EncodedResponse(body, fmt, headers=degraded_headers(degraded))
+
+
+async def _load_all_projets_details(owner: str, fmt: str) -> tuple[bytes, bool]:
+    docs = await find_owned(owner, "projects", Projet).to_list()
     if not docs:
         raise HTTPException(status_code=404, detail="Aucun projet trouvé")
 
-    # Récupérer les technologies et compétences liées depuis Neo4j
-    driver = get_neo4j_driver()
-    async with driver.session() as session:
-        tech_result = await session.run("""
-            MATCH (p:Project)-[:USES_TECHNOLOGY]->(t:Technology)
-            RETURN p.nom AS projet, collect(t.nom) AS technologies
-        """)
-        tech_records = [r async for r in tech_result]
-
-        skill_result = await session.run("""
-            MATCH (p:Project)-[:REQUIRES_SKILL]->(s:Skill)
-            RETURN p.nom AS projet, collect(s.nom) AS skills
-        """)
-        skill_records = [r async for r in skill_result]
-
-    tech_map = {r["projet"]: r["technologies"] for r in tech_records}
-    skill_map = {r["projet"]: r["skills"] for r in skill_records}
-
-    # Fusionner MongoDB + Neo4j
-    projets = []
+    tech_map, skill_map, degraded = await _fetch_project_links(owner)
+
+    # Fusionner MongoDB + Neo4j, puis valider / encoder en bloc
     for doc in docs:
-        projet = Projet.model_validate(doc)
-        projets.append(ProjetDetail(
-            **projet.model_dump(),
-            technologies=tech_map.get(projet.nom, []),
-            skills=skill_map.get(projet.nom, []),
-        ))
+        doc["technologies"] = tech_map.get(doc.get("nom"), [])
+        doc["skills"] = skill_map.get(doc.get("nom"), [])
+    return encode_list(ProjetDetail, docs, fmt), degraded
+
+
+async def _fetch_project_links(owner: str) -> tuple[dict[str, list[str]], dict[str, list[str]], bool]:
+    """Technologies et compétences liées à chaque projet (par nom) d'un profil depuis Neo4j.
+
+    Les requêtes partent du nœud `Person` du profil : seuls ses projets sont
+    parcourus, quel que soit le nombre de profils dans le graphe.
+
+    Si Neo4j est indisponible (ou le circuit ouvert), retourne les derniers
+    liens connus et `degraded=True` au lieu d'échouer.
+    """
+    async def query() -> dict[str, dict[str, list[str]]]:
+        driver = get_neo4j_driver()
+        async with driver.session() as session:
+            tech_result = await session.run(bounded_query("""
+                MATCH (:Person {id: $owner})-[:CREATED]->(p:Project)-[:USES_TECHNOLOGY]->(t:Technology)
+                RETURN p.nom AS projet, collect(t.nom) AS technologies
+            """), owner=owner)
+            tech_records = [r async for r in tech_result]
+
+            skill_result = await session.run(bounded_query("""
+                MATCH (:Person {id: $owner})-[:CREATED]->(p:Project)-[:REQUIRES_SKILL]->(s:Skill)
+                RETURN p.nom AS projet, collect(s.nom) AS skills
+            """), owner=owner)
+            skill_records = [r async for r in skill_result]
 
-    return projets
+        return {
+            "technologies": {r["projet"]: r["technologies"] for r in tech_records},
+            "skills": {r["projet"]: r["skills"] for r in skill_records},
+        }
+
+    links, degraded = await call_graph(f"{owner}:project_links_by_name", query)
+    return links.get("technologies", {}), links.get("skills", {}), degraded
+
+
+@router.get(
+    "/projets/{projet_id}",
+    response_model=ProjetDetail,
+    summary="Détail d'un projet enrichi (MongoDB + Neo4j)",
+    description=(
+        "Retourne un projet par son id, enrichi avec ses technologies et compétences "
+        "(une requête groupée MongoDB et une requête Neo4j par tick)."
+    ),
+    responses={404: {"description": "Aucun projet ne correspond à cet id."}},
+)
+async def get_projet(projet_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    docs = await _load_projets_details(loaders, [projet_id])
+    if not docs:
+        raise HTTPException(status_code=404, detail="Projet introuvable")
+    return EncodedResponse(encode_one(ProjetDetail, docs[0], fmt), fmt, headers=degraded_headers(loaders.degraded))
+
+
+async def _load_projets_details(loaders: Loaders, ids: list[str]) -> list[dict]:
+    """Projets + liens Neo4j chargés par id via les loaders (ids inconnus ignorés)."""
+    docs, links = await asyncio.gather(
+        loaders.collection("projects").load_many(ids),
+        loaders.project_links.load_many(ids),
+    )
+    return [
+        {**doc, **(link or {})}
+        for doc, link in zip(docs, links)
+        if doc is not None
+    ]
 
 
 # ── Technologies ────────────────────────────────────────────────
@@ -105,12 +242,30 @@ async def get_projets_details():
     response_description="Liste des technologies avec id, nom et image.",
     responses={404: {"description": "Aucune technologie trouvée en base de données."}},
 )
-async def get_technologies():
-    db = get_mongo_db()
-    docs = await db["technologies"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucune technologie trouvée")
-    return [Techno.model_validate(doc) for doc in docs]
+async def get_technologies(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "technologies", Techno, ids, "Aucune technologie trouvée", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "technologies", Techno)
+        return await ndjson_response(cursor, Techno, "Aucune technologie trouvée")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "technologies", Techno, "Aucune technologie trouvée", fmt), fmt), fmt)
+
+
+@router.get(
+    "/technologies/{techno_id}",
+    response_model=Techno,
+    summary="Détail d'une technologie",
+    description="Retourne une technologie par son id depuis MongoDB.",
+    responses={404: {"description": "Aucune technologie ne correspond à cet id."}},
+)
+async def get_technology(techno_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await load_one(loaders, "technologies", Techno, techno_id, "Technologie introuvable", fmt), fmt)
 
 
 # ── Hobbies ─────────────────────────────────────────────────────
@@ -123,12 +278,30 @@ async def get_technologies():
     response_description="Liste des hobbies avec id, nom et description.",
     responses={404: {"description": "Aucun hobby trouvé en base de données."}},
 )
-async def get_hobbies():
-    db = get_mongo_db()
-    docs = await db["hobbies"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucun hobby trouvé")
-    return [Hobby.model_validate(doc) for doc in docs]
+async def get_hobbies(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "hobbies", Hobby, ids, "Aucun hobby trouvé", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "hobbies", Hobby)
+        return await ndjson_response(cursor, Hobby, "Aucun hobby trouvé")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "hobbies", Hobby, "Aucun hobby trouvé", fmt), fmt), fmt)
+
+
+@router.get(
+    "/hobbies/{hobby_id}",
+    response_model=Hobby,
+    summary="Détail d'un hobby",
+    description="Retourne un loisir par son id depuis MongoDB.",
+    responses={404: {"description": "Aucun hobby ne correspond à cet id."}},
+)
+async def get_hobby(hobby_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await load_one(loaders, "hobbies", Hobby, hobby_id, "Hobby introuvable", fmt), fmt)
 
 
 # ── Expériences ─────────────────────────────────────────────────
@@ -141,12 +314,30 @@ async def get_hobbies():
     response_description="Liste des expériences avec nom, entreprise, rôle, dates et description.",
     responses={404: {"description": "Aucune expérience trouvée en base de données."}},
 )
-async def get_experiences():
-    db = get_mongo_db()
-    docs = await db["experiences"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucune expérience trouvée")
-    return [Experience.model_validate(doc) for doc in docs]
+async def get_experiences(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "experiences", Experience, ids, "Aucune expérience trouvée", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "experiences", Experience)
+        return await ndjson_response(cursor, Experience, "Aucune expérience trouvée")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "experiences", Experience, "Aucune expérience trouvée", fmt), fmt), fmt)
+
+
+@router.get(
+    "/experiences/{experience_id}",
+    response_model=Experience,
+    summary="Détail d'une expérience professionnelle",
+    description="Retourne une expérience professionnelle par son id depuis MongoDB.",
+    responses={404: {"description": "Aucune expérience ne correspond à cet id."}},
+)
+async def get_experience(experience_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await load_one(loaders, "experiences", Experience, experience_id, "Expérience introuvable", fmt), fmt)
 
 
 # ── Parcours scolaire ──────────────────────────────────────────
@@ -159,9 +350,119 @@ async def get_experiences():
     response_description="Liste des formations avec école, diplôme, années et description.",
     responses={404: {"description": "Aucun parcours scolaire trouvé en base de données."}},
 )
-async def get_parcours_scolaire():
-    db = get_mongo_db()
-    docs = await db["educations"].find({}, {"_id": 0}).to_list()
-    if not docs:
-        raise HTTPException(status_code=404, detail="Aucun parcours scolaire trouvé")
-    return [ParcoursScolaire.model_validate(doc) for doc in docs]
+async def get_parcours_scolaire(
+    request: Request,
+    ids: Optional[str] = Query(None, description=IDS_DESCRIPTION),
+    owner: str = Depends(get_owner),
+    loaders: Loaders = Depends(get_loaders),
+    fmt: str = Depends(wire_format),
+):
+    if ids is not None:
+        return EncodedResponse(await load_by_ids(loaders, "educations", ParcoursScolaire, ids, "Aucun parcours scolaire trouvé", fmt), fmt)
+    if wants_ndjson(request):
+        cursor = find_owned(owner, "educations", ParcoursScolaire)
+        return await ndjson_response(cursor, ParcoursScolaire, "Aucun parcours scolaire trouvé")
+    return EncodedResponse(await coalesce(request, lambda: find_all(owner, "educations", ParcoursScolaire, "Aucun parcours scolaire trouvé", fmt), fmt), fmt)
+
+
+@router.get(
+    "/parcours-scolaire/{parcours_id}",
+    response_model=ParcoursScolaire,
+    summary="Détail d'une formation",
+    description="Retourne une formation du parcours scolaire par son id depuis MongoDB.",
+    responses={404: {"description": "Aucune formation ne correspond à cet id."}},
+)
+async def get_parcours(parcours_id: str, loaders: Loaders = Depends(get_loaders), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await load_one(loaders, "educations", ParcoursScolaire, parcours_id, "Formation introuvable", fmt), fmt)
+
+
+# ── Analytics ──────────────────────────────────────────────────
+
+@router.get(
+    "/analytics",
+    response_model=PortfolioAnalytics,
+    summary="Statistiques par technologie et compétence",
+    description=(
+        "Années d'usage (périodes fusionnées), nombre de projets et d'expériences, dernière utilisation "
+        "et co-occurrences de chaque technologie / compétence. Vue précalculée au seed "
+        "(`python -m backend.scripts.analytics` pour la recalculer) : une seule lecture par requête."
+    ),
+    responses={404: {"description": "Statistiques non calculées pour ce profil."}},
+)
+async def get_analytics(request: Request, owner: str = Depends(get_owner), fmt: str = Depends(wire_format)):
+    return EncodedResponse(await coalesce(request, lambda: _load_analytics(owner, fmt), fmt), fmt)
+
+
+async def _load_analytics(owner: str, fmt: str) -> bytes:
+    body = from_snapshot(owner, ANALYTICS_COLLECTION, fmt)
+    if body is not None:
+        return body
+    doc = await get_mongo_db()[ANALYTICS_COLLECTION].find_one(
+        {OWNER_FIELD: owner}, {"_id": 0, OWNER_FIELD: 0}, max_time_ms=remaining_ms(),
+    )
+    if doc is None:
+        raise HTTPException(status_code=404, detail="Statistiques non calculées pour ce profil")
+    return encode_one(PortfolioAnalytics, doc, fmt)
+
+
+# ── Timeline ───────────────────────────────────────────────────
+
+@router.get(
+    "/timeline",
+    response_model=TimelinePage,
+    summary="Frise chronologique",
+    description=(
+        "Expériences, projets, formations et certifications fusionnés par date décroissante. "
+        "Pagination par clé : passer le champ `next` de la page dans `before` pour la page suivante."
+    ),
+    responses={400: {"description": "Curseur `before` invalide."}},
+)
+async def get_timeline(
+    before: Optional[str] = Query(None, description="Curseur `date|id` : entrées strictement antérieures (champ `next`)."),
+    limit: int = Query(20, ge=1, le=100, description="Nombre d'entrées de la page."),
+    owner: str = Depends(get_owner),
+    fmt: str = Depends(wire_format),
+):
+    try:
+        bound = parse_cursor(before) if before is not None else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Curseur 'before' invalide (attendu : date|id)")
+    page = await read_timeline(get_mongo_db(), owner, bound, limit)
+    return EncodedResponse(encode_one(TimelinePage, page, fmt), fmt)
+
+
+# ── Suggestions ────────────────────────────────────────────────
+
+SUGGEST_SOURCES = (("technologies", Techno, "technology"), ("skills", Skill, "skill"))
+
+
+@router.get(
+    "/suggest",
+    response_model=list[Suggestion],
+    summary="Autocomplétion des compétences et technologies",
+    description=(
+        "Suggestions pour une saisie partielle : préfixe du nom ou d'un mot du nom, catégorie, "
+        "fautes de frappe tolérées ; insensible aux accents et à la casse. Index en mémoire, "
+        "sans accès base par frappe."
+    ),
+)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Saisie de l'utilisateur."),
+    type: Optional[Literal["technology", "skill"]] = Query(None, description="Restreint à un type."),
+    limit: int = Query(10, ge=1, le=50, description="Nombre maximal de suggestions."),
+    owner: str = Depends(get_owner),
+    fmt: str = Depends(wire_format),
+):
+    index = await get_suggest_indexes().get(owner, lambda: _suggest_entries(owner))
+    entries = index.search(q, {type} if type is not None else None, limit)
+    return EncodedResponse(encode_list(Suggestion, [asdict(e) for e in entries], fmt), fmt)
+
+
+async def _suggest_entries(owner: str) -> list[SuggestEntry]:
+    """Compétences et technologies du profil, depuis le snapshot partagé sinon MongoDB."""
+    entries: list[SuggestEntry] = []
+    for collection, model, kind in SUGGEST_SOURCES:
+        body = from_snapshot(owner, collection)
+        docs = json.loads(body) if body is not None else await find_owned(owner, collection, model).to_list()
+        entries.extend(SuggestEntry(doc["id"], doc["nom"], kind, doc.get("category", "")) for doc in docs)
+    return entries
@@ -4,14 +4,23 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from pymongo.errors import ExecutionTimeout
 
+from backend.api.dependencies import profile_path
+from backend.api.routes_admin import router as admin_router
+from backend.api.routes_assets import router as assets_router
+from backend.api.routes_graphql import router as graphql_router
 from backend.api.routes_personal_infos import router as personal_infos_router
 from backend.api.routes_portfolio import router as portfolio_router
+from backend.core.admission import AdmissionMiddleware
 from backend.core.config import get_settings
+from backend.core.deadline import DeadlineExceeded, DeadlineMiddleware, deadline_response
+from backend.core.fallback import get_graph_fallback
 from backend.core.logging import setup_logging
+from backend.core.profiler import ProfilerMiddleware
 from backend.db.neo4j import close_neo4j
 from backend.models import HealthResponse
 
@@ -20,6 +29,7 @@ from backend.models import HealthResponse
 async def lifespan(app: FastAPI):
     setup_logging()
     yield
+    await get_graph_fallback().flush()
     await close_neo4j()
 
 
@@ -32,6 +42,15 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Admission control — refuse vite (429 / 503) plutôt que d'empiler les requêtes
+app.add_middleware(AdmissionMiddleware)
+
+# Deadline par requête (attente en file d'admission comprise) — 504 à l'expiration
+app.add_middleware(DeadlineMiddleware)
+
+# Profilage à la demande (en-tête X-Profile signé ou échantillonnage) — inactif par défaut
+app.add_middleware(ProfilerMiddleware)
+
 # CORS — permet au frontend d'appeler l'API
 app.add_middleware(
     CORSMiddleware,
@@ -51,6 +70,13 @@ async def not_implemented_handler(request: Request, exc: NotImplementedError):
     )
 
 
+@app.exception_handler(DeadlineExceeded)
+@app.exception_handler(ExecutionTimeout)
+async def deadline_handler(request: Request, exc: Exception):
+    """Budget de la requête épuisé (deadline ou `maxTimeMS` MongoDB) → 504."""
+    return deadline_response()
+
+
 @app.exception_handler(Exception)
 async def generic_error_handler(request: Request, exc: Exception):
     """Catch-all : erreurs non gérées → 500 propre."""
@@ -66,6 +92,13 @@ async def generic_error_handler(request: Request, exc: Exception):
 # ── Routes ─────────────────────────────────────────────────────
 app.include_router(personal_infos_router)
 app.include_router(portfolio_router)
+app.include_router(graphql_router)
+app.include_router(assets_router)
+app.include_router(admin_router)
+
+# Multi-profil : les mêmes routes sous `/{profile}/...` (sans préfixe : profil par défaut)
+for profile_router in (personal_infos_router, portfolio_router, graphql_router):
+    app.include_router(profile_router, prefix="/{profile}", dependencies=[Depends(profile_path)])
 
 
 @app.get("/health", response_model=HealthResponse, tags=["system"])
@@ -0,0 +1,219 @@
+"""Contrôle d'admission — limites de concurrence, token buckets et délestage adaptatif.
+
+Quand MongoDB ou Neo4j ralentissent, mieux vaut refuser vite (503 +
+`Retry-After`) que d'empiler des milliers de coroutines en attente :
+- chaque route a un nombre maximal de requêtes simultanées et une file
+  d'attente bornée (taille et durée) ;
+- chaque client a un token bucket (429 s'il dépasse son débit) ;
+- délestage adaptatif façon CoDel : si le temps passé en file reste
+  au-dessus de la cible pendant tout un intervalle, les nouvelles requêtes
+  qui devraient attendre sont refusées immédiatement jusqu'au retour sous la cible.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from backend.core.config import Settings, get_settings
+
+
+class RouteLimiter:
+    """Sémaphore équitable (FIFO) avec file bornée et détection de file persistante."""
+
+    def __init__(self, limit: int, settings: Settings):
+        self.limit = limit
+        self.max_queue = settings.admission_max_queue
+        self.max_wait = settings.admission_max_queue_ms / 1000
+        self.target = settings.admission_target_queue_ms / 1000
+        self.interval = settings.admission_shed_interval_ms / 1000
+        self.active = 0
+        self.shedding = False
+        self._above_since: Optional[float] = None
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> bool:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self._observe(0.0)
+            return True
+        if self.shedding or len(self._waiters) >= self.max_queue:
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.monotonic()
+        try:
+            await asyncio.wait_for(waiter, self.max_wait)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # Le créneau a été transmis juste avant l'expiration : on le rend.
+                self.release()
+            self._forget(waiter)
+            self._observe(self.max_wait)
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Le créneau a été transmis au moment où le client est parti : on le rend.
+                self.release()
+            self._forget(waiter)
+            raise
+        self._observe(time.monotonic() - start)
+        return True
+
+    def release(self) -> None:
+        # Le créneau passe directement au premier client en attente (active inchangé).
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _forget(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _observe(self, queue_delay: float) -> None:
+        now = time.monotonic()
+        if queue_delay < self.target:
+            self._above_since = None
+            self.shedding = False
+        elif self._above_since is None:
+            self._above_since = now
+        elif now - self._above_since >= self.interval:
+            self.shedding = True
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Consomme un jeton ; retourne 0 si accepté, sinon le délai (s) avant le prochain jeton."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+# Gabarit commun aux chemins sans route (404) : un seul limiteur, quel que soit le nombre d'URL inconnues.
+UNMATCHED = "<unmatched>"
+
+
+class RouteTemplates:
+    """Chemin « gabarit » de la route (`/portfolio/skills/{skill_id}`), pour configurer par route et non par URL."""
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._templates: OrderedDict[str, str] = OrderedDict()
+
+    def get(self, scope: Scope) -> str:
+        key = f"{scope['method']} {scope['path']}"
+        template = self._templates.get(key)
+        if template is not None:
+            return template
+        template = UNMATCHED
+        for route in getattr(scope.get("app"), "routes", []):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                template = getattr(route, "path", template)
+                break
+        self._templates[key] = template
+        if len(self._templates) > self.max_entries:
+            self._templates.popitem(last=False)
+        return template
+
+
+class AdmissionMiddleware:
+    """Middleware ASGI : le créneau est libéré une fois la réponse entièrement envoyée."""
+
+    def __init__(self, app: ASGIApp, max_clients: int = 10_000, max_templates: int = 4096):
+        self.app = app
+        self.max_clients = max_clients
+        self._limiters: dict[str, RouteLimiter] = {}
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._templates = RouteTemplates(max_templates)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = get_settings()
+        if (
+            scope["type"] != "http"
+            or not settings.admission_enabled
+            or scope["path"] in settings.admission_exempt_paths
+            or scope["path"].startswith(tuple(settings.admission_exempt_prefixes))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        wait = self._bucket(scope, settings).take()
+        if wait > 0:
+            await _reject(send, 429, "Trop de requêtes, réessayez plus tard", math.ceil(wait))
+            return
+
+        limiter = self._limiter(scope, settings)
+        if not await limiter.acquire():
+            await _reject(send, 503, "Service surchargé, réessayez plus tard", settings.admission_retry_after_s)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    def _client_id(self, scope: Scope, settings: Settings) -> str:
+        if settings.admission_trust_forwarded_for:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    return value.decode("latin-1").split(",")[0].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    def _bucket(self, scope: Scope, settings: Settings) -> TokenBucket:
+        client = self._client_id(scope, settings)
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = TokenBucket(settings.admission_client_rate, settings.admission_client_burst)
+            self._buckets[client] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        return bucket
+
+    def _limiter(self, scope: Scope, settings: Settings) -> RouteLimiter:
+        template = self._templates.get(scope)
+        limiter = self._limiters.get(template)
+        if limiter is None:
+            limit = settings.admission_route_concurrency.get(template, settings.admission_max_concurrency)
+            limiter = RouteLimiter(limit, settings)
+            self._limiters[template] = limiter
+        return limiter
+
+
+async def _reject(send: Send, status: int, detail: str, retry_after: int) -> None:
+    body = json.dumps({"detail": detail}, ensure_ascii=False).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(retry_after, 1)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
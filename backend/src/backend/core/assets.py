@@ -0,0 +1,61 @@
+"""Assets statiques — manifeste des images hashées produit par `build_assets`.
+
+Le manifeste associe chaque nom d'image référencé dans les documents
+(`aws_sa.png`, `icon_react.svg`...) à son URL hashée et à ses variantes
+(miniatures, WebP / AVIF). Sans manifeste, les noms sont renvoyés tels quels.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from backend.core.config import get_settings
+
+MANIFEST_NAME = "manifest.json"
+
+
+def get_assets_dir() -> Path:
+    return Path(get_settings().assets_build_dir)
+
+
+@lru_cache
+def get_asset_manifest() -> dict[str, dict]:
+    """Manifeste `nom d'origine → {url, variants}` (vide si le build n'a pas été lancé)."""
+    path = get_assets_dir() / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache
+def get_served_files() -> frozenset[str]:
+    """Noms de fichiers servis par `/assets` : uniquement ceux listés dans le manifeste."""
+    names = set()
+    for entry in get_asset_manifest().values():
+        for url in (entry["url"], *entry.get("variants", {}).values()):
+            names.add(url.rsplit("/", 1)[-1])
+    return frozenset(names)
+
+
+def asset_url(name: str) -> str:
+    entry = get_asset_manifest().get(name)
+    return entry["url"] if entry else name
+
+
+def with_asset_urls(doc: dict) -> dict:
+    """Remplace `image` / `images` par leurs URLs hashées (copie, le document source reste intact)."""
+    if not get_asset_manifest():
+        return doc
+    image = doc.get("image")
+    images = doc.get("images")
+    if not image and not images:
+        return doc
+    doc = dict(doc)
+    if image:
+        doc["image"] = asset_url(image)
+    if images:
+        doc["images"] = [asset_url(name) for name in images]
+    return doc
@@ -0,0 +1,94 @@
+"""Circuit breaker — échec rapide quand une dépendance (Neo4j) est lente ou indisponible.
+
+- fermé : les appels passent ; `failure_threshold` échecs consécutifs ouvrent le circuit ;
+- ouvert : les appels échouent immédiatement (`CircuitOpenError`) pendant `reset_timeout` ;
+- semi-ouvert : un seul appel de test passe ; succès → fermé, échec → ouvert à nouveau.
+
+Chaque appel est borné par `call_timeout` : une base qui ne répond plus
+compte comme un échec au lieu de bloquer la requête. L'appelant peut imposer
+un délai plus court (deadline de la requête) : son expiration n'est alors pas
+imputée à la dépendance.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger("backend")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Le circuit est ouvert : l'appel n'a pas été tenté."""
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        call_timeout: float = 2.0,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.call_timeout = call_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    async def call(self, fn: Callable[[], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        limit = self.call_timeout if timeout is None else min(timeout, self.call_timeout)
+        self._before_call()
+        try:
+            result = await asyncio.wait_for(fn(), limit)
+        except asyncio.CancelledError:
+            self._probing = False
+            raise
+        except TimeoutError:
+            if limit < self.call_timeout:
+                self._probing = False
+                raise
+            self._on_failure()
+            raise
+        except Exception:
+            self._on_failure()
+            raise
+        self._on_success()
+        return result
+
+    def _before_call(self) -> None:
+        if self.state == CLOSED:
+            return
+        if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return
+        raise CircuitOpenError(f"Circuit {self.name} ouvert")
+
+    def _on_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info("Circuit %s refermé", self.name)
+        self.state = CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def _on_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning("Circuit %s ouvert après %d échec(s)", self.name, self.failures)
+            self.state = OPEN
+            self._opened_at = time.monotonic()
@@ -19,6 +19,26 @@ class Settings(BaseSettings):
     app_version: str = "0.1.0"
     debug: bool = False
 
+    # ── Serveur ────────────────────────────────────────────────
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1  # > 1 : workers préforkés + snapshot partagé (backend.launcher), 0 : un par CPU
+    snapshot_dir: str = "build/snapshot"
+    snapshot_refresh_s: float = 60.0  # 0 : snapshot construit une seule fois au démarrage
+
+    # ── Deadlines ──────────────────────────────────────────────
+    # Budget d'une requête, appliqué à MongoDB (maxTimeMS) et Neo4j (timeout de transaction) ; 0 : aucun
+    request_timeout_ms: int = 5000
+    route_timeout_ms: dict[str, int] = {}  # ex: {"/portfolio/projets/details": 8000}
+
+    # ── Profilage à la demande ─────────────────────────────────
+    profiler_enabled: bool = False
+    profiler_secret: str = ""  # clé HMAC de l'en-tête X-Profile et jeton des routes /admin ("" : désactivés)
+    profiler_sample_rate: float = 0.0  # part des requêtes profilées sans en-tête (ex: 0.001)
+    profiler_interval_ms: float = 5.0
+    profiler_dir: str = "build/profiles"
+    profiler_max_profiles: int = 200
+
     # ── MongoDB ────────────────────────────────────────────────
     mongo_url: str = "mongodb://localhost:27017"
     mongo_db: str = "smartcity"
@@ -27,6 +47,64 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str = "password"
+    neo4j_call_timeout_s: float = 2.0
+    neo4j_breaker_failure_threshold: int = 5
+    neo4j_breaker_reset_timeout_s: float = 30.0
+    graph_fallback_file: str = "build/graph_fallback.json"  # "" : repli en mémoire uniquement
+    graph_fallback_flush_s: float = 5.0  # délai de regroupement des écritures du fichier de repli
+    graph_fallback_max_namespaces: int = 4096
+    graph_fallback_max_keys: int = 10_000  # par espace de noms
+
+    # ── Multi-profil ───────────────────────────────────────────
+    # Profil servi par les routes sans préfixe `/{profile}` ("" : premier profil en base)
+    default_profile: str = ""
+
+    # ── Streaming ──────────────────────────────────────────────
+    stream_batch_size: int = 100
+
+    # ── Lookups par id ─────────────────────────────────────────
+    max_ids_per_request: int = 100
+
+    # ── Single-flight ──────────────────────────────────────────
+    # > 0 : sert le dernier résultat (s'il a moins de N secondes) pendant un recalcul
+    singleflight_stale_ttl: float = 0.0
+    singleflight_max_entries: int = 1024
+
+    # ── Analytics ──────────────────────────────────────────────
+    # Taille bornée du document par profil (limite de 16 Mo de MongoDB)
+    analytics_max_items: int = 500  # technologies / compétences les plus utilisées
+    analytics_max_pairs: int = 5000  # co-occurrences les plus fréquentes entre ces entrées
+
+    # ── Suggestions (autocomplétion) ───────────────────────────
+    suggest_refresh_s: float = 60.0  # âge maximal d'un index avant reconstruction en arrière-plan
+
+    # ── GraphQL ────────────────────────────────────────────────
+    graphql_max_depth: int = 6
+    graphql_max_complexity: int = 5000
+    graphql_list_factor: int = 10
+    graphql_persisted_max_entries: int = 1000
+
+    # ── Assets (images) ────────────────────────────────────────
+    assets_source_dir: str = "datasets/images"
+    assets_build_dir: str = "build/assets"
+    assets_url_prefix: str = "/assets"
+    assets_thumbnail_widths: list[int] = [160, 480]
+    assets_formats: list[str] = ["webp", "avif"]
+
+    # ── Admission control ──────────────────────────────────────
+    admission_enabled: bool = True
+    admission_max_concurrency: int = 64  # requêtes simultanées par route
+    admission_route_concurrency: dict[str, int] = {}  # ex: {"/portfolio/projets/details": 16}
+    admission_max_queue: int = 128
+    admission_max_queue_ms: int = 200
+    admission_target_queue_ms: int = 20
+    admission_shed_interval_ms: int = 500
+    admission_retry_after_s: int = 1
+    admission_client_rate: float = 20.0  # jetons / seconde par client
+    admission_client_burst: int = 40
+    admission_trust_forwarded_for: bool = False
+    admission_exempt_paths: list[str] = ["/health", "/docs", "/redoc", "/openapi.json"]
+    admission_exempt_prefixes: list[str] = ["/assets/"]  # fichiers statiques immuables (images)
 
 
 @lru_cache
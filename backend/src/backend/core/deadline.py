@@ -0,0 +1,140 @@
+"""Deadlines de requête — budget de temps propagé jusqu'aux bases de données.
+
+Chaque requête HTTP reçoit une échéance absolue (`request_timeout_ms`, ou
+`route_timeout_ms` pour la route, réduite par l'en-tête client
+`X-Request-Timeout-Ms`), placée dans une variable de contexte. Les accès
+aux bases la lisent au moment de l'appel :
+- MongoDB : `maxTimeMS` sur les curseurs (`backend.db.mongo.bounded`) ;
+- Neo4j : timeout de transaction des requêtes Cypher (`backend.db.neo4j.bounded_query`).
+Le budget restant diminue donc d'un appel à l'autre : une requête qui a déjà
+consommé 4 s sur 5 ne laisse qu'une seconde à la suivante. Une requête
+bloquée est interrompue côté serveur et libère sa connexion du pool.
+
+Un calcul partagé entre requêtes (single-flight) s'exécute avec le budget
+serveur de la route (`shared_context`), jamais avec celui réduit par un
+client : chaque requête en attente applique ensuite sa propre échéance.
+
+À l'expiration, le client reçoit un 504 propre (tant que la réponse n'a pas
+commencé ; un flux NDJSON déjà ouvert n'est borné que par `maxTimeMS`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.admission import RouteTemplates
+from backend.core.config import Settings, get_settings
+
+TIMEOUT_HEADER = b"x-request-timeout-ms"
+DEADLINE_DETAIL = "Délai de traitement de la requête dépassé"
+
+# Échéance (horloge `time.monotonic`) de la requête en cours ; None : pas de limite.
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+# Budget serveur de la route en secondes (sans l'en-tête client) ; None : pas de limite.
+_route_budget: ContextVar[Optional[float]] = ContextVar("route_budget", default=None)
+
+
+class DeadlineExceeded(Exception):
+    """Le budget de temps de la requête est épuisé."""
+
+
+def remaining() -> Optional[float]:
+    """Secondes restantes avant l'échéance (None sans deadline) ; lève `DeadlineExceeded` si elle est passée."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded(DEADLINE_DETAIL)
+    return left
+
+
+def remaining_ms() -> Optional[int]:
+    """Budget restant en millisecondes entières (au moins 1), pour `maxTimeMS`."""
+    left = remaining()
+    return None if left is None else max(1, int(left * 1000))
+
+
+def expired() -> bool:
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def shared_context() -> contextvars.Context:
+    """Contexte d'un calcul partagé : copie du contexte courant, échéance = maintenant + budget serveur de la route."""
+    context = contextvars.copy_context()
+    budget = _route_budget.get()
+    context.run(_deadline.set, None if budget is None else time.monotonic() + budget)
+    return context
+
+
+def deadline_response() -> JSONResponse:
+    return JSONResponse(status_code=504, content={"detail": DEADLINE_DETAIL})
+
+
+class DeadlineMiddleware:
+    """Middleware ASGI : fixe l'échéance de la requête et répond 504 si elle expire avant la réponse."""
+
+    def __init__(self, app: ASGIApp, max_templates: int = 4096):
+        self.app = app
+        self._templates = RouteTemplates(max_templates)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        route_budget, budget = self._budget(scope, get_settings())
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        started = False
+        timeout = asyncio.timeout(budget)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+                # La réponse est partie : le corps (flux) n'est plus interrompu ici.
+                timeout.reschedule(None)
+            await send(message)
+
+        token = _deadline.set(time.monotonic() + budget)
+        route_token = _route_budget.set(route_budget)
+        try:
+            async with timeout:
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            if not timeout.expired() or started:
+                raise
+            await deadline_response()(scope, receive, send)
+        finally:
+            _route_budget.reset(route_token)
+            _deadline.reset(token)
+
+    def _budget(self, scope: Scope, settings: Settings) -> tuple[Optional[float], Optional[float]]:
+        """(budget serveur de la route, budget de la requête) en secondes.
+
+        Le budget de la requête est celui de la route, réduit par l'en-tête client (qui ne peut pas l'allonger).
+        """
+        budget_ms = settings.request_timeout_ms
+        if settings.route_timeout_ms:
+            budget_ms = settings.route_timeout_ms.get(self._templates.get(scope), budget_ms)
+        route_budget = budget_ms / 1000 if budget_ms > 0 else None
+        for name, value in scope["headers"]:
+            if name == TIMEOUT_HEADER:
+                try:
+                    requested = int(value)
+                except ValueError:
+                    break
+                if requested > 0:
+                    budget_ms = min(budget_ms, requested) if budget_ms > 0 else requested
+                break
+        return route_budget, (budget_ms / 1000 if budget_ms > 0 else None)
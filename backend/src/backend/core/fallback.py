@@ -0,0 +1,162 @@
+"""Magasin local des dernières données valides (repli quand une dépendance est en panne).
+
+Les données sont gardées en mémoire et, si `graph_fallback_file` est
+configuré, recopiées dans un fichier JSON pour survivre aux redémarrages.
+Les écritures sont regroupées : une modification programme une sauvegarde
+`graph_fallback_flush_s` secondes plus tard, exécutée dans un thread (hors
+boucle asyncio) ; les modifications suivantes rejoignent la même sauvegarde.
+Chaque processus écrit dans son propre fichier temporaire avant le
+remplacement atomique : les workers préforkés ne s'écrasent pas.
+
+La taille est bornée : au plus `graph_fallback_max_namespaces` espaces de
+noms et `graph_fallback_max_keys` clés par espace, les moins récemment mis
+à jour étant oubliés en premier.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from backend.core.config import get_settings
+
+logger = logging.getLogger("backend")
+
+_MISSING = object()
+
+
+class LastGoodStore:
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        flush_delay: float = 5.0,
+        max_namespaces: int = 4096,
+        max_keys: int = 10_000,
+    ):
+        self.path = path
+        self.flush_delay = flush_delay
+        self.max_namespaces = max_namespaces
+        self.max_keys = max_keys
+        self._data: Optional[OrderedDict[str, OrderedDict[str, Any]]] = None
+        self._dirty = False
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    def get(self, namespace: str) -> dict[str, Any]:
+        return self._load().get(namespace, {})
+
+    def update(self, namespace: str, values: dict[str, Any]) -> None:
+        """Fusionne `values` dans l'espace de noms ; programme une sauvegarde si quelque chose a changé."""
+        data = self._load()
+        current = data.get(namespace)
+        if current is None:
+            current = data[namespace] = OrderedDict()
+        data.move_to_end(namespace)
+        changed = False
+        for key, value in values.items():
+            if current.get(key, _MISSING) != value:
+                current[key] = value
+                changed = True
+            current.move_to_end(key)
+        while len(current) > self.max_keys:
+            current.popitem(last=False)
+        while len(data) > self.max_namespaces:
+            data.popitem(last=False)
+        if changed:
+            self._dirty = True
+            self._schedule()
+
+    async def flush(self) -> None:
+        """Écrit immédiatement les modifications en attente (arrêt de l'application)."""
+        if self._flushing is not None:
+            await self._flushing
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._dirty and self.path is not None:
+            await self._write()
+
+    def _schedule(self) -> None:
+        if self.path is None or self._flush_handle is not None or self._flushing is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:  # appel hors boucle (script) : écriture directe
+            self._dirty = False
+            _write_json(self.path, self._snapshot())
+            return
+        self._flush_handle = loop.call_later(self.flush_delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        self._flush_handle = None
+        self._flushing = asyncio.get_running_loop().create_task(self._write())
+        self._flushing.add_done_callback(self._flushed)
+
+    def _flushed(self, _task: asyncio.Task) -> None:
+        self._flushing = None
+        if self._dirty:  # modifié pendant l'écriture
+            self._schedule()
+
+    async def _write(self) -> None:
+        self._dirty = False
+        # Copie sur la boucle (les valeurs sont remplacées, jamais modifiées en place), sérialisation dans un thread.
+        await asyncio.to_thread(_write_json, self.path, self._snapshot())
+
+    def _snapshot(self) -> dict[str, dict[str, Any]]:
+        return {namespace: dict(values) for namespace, values in self._load().items()}
+
+    def _load(self) -> OrderedDict[str, OrderedDict[str, Any]]:
+        if self._data is None:
+            self._data = OrderedDict()
+            if self.path is not None and self.path.exists():
+                try:
+                    with open(self.path, encoding="utf-8") as f:
+                        stored = json.load(f)
+                    self._data = OrderedDict((ns, OrderedDict(values)) for ns, values in stored.items())
+                except (OSError, ValueError, AttributeError) as exc:
+                    logger.warning("Fallback illisible (%s) : %s", self.path, exc)
+        return self._data
+
+
+def _write_json(path: Path, data: dict[str, dict[str, Any]]) -> None:
+    tmp: Optional[str] = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Fichier temporaire propre au processus (workers préforkés), puis remplacement atomique.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False,
+        ) as f:
+            tmp = f.name
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Impossible d'écrire le fallback (%s) : %s", path, exc)
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+_store: LastGoodStore | None = None
+
+
+def get_graph_fallback() -> LastGoodStore:
+    """Magasin des derniers enrichissements Neo4j valides (singleton)."""
+    global _store
+    if _store is None:
+        settings = get_settings()
+        path = settings.graph_fallback_file
+        _store = LastGoodStore(
+            Path(path) if path else None,
+            settings.graph_fallback_flush_s,
+            settings.graph_fallback_max_namespaces,
+            settings.graph_fallback_max_keys,
+        )
+    return _store
@@ -0,0 +1,383 @@
+"""Profilage à la demande — échantillonnage des piles d'une requête, export flame graph.
+
+Activé par `profiler_enabled`. Une requête est profilée si :
+- elle porte un en-tête `X-Profile` signé avec `profiler_secret` (voir
+  `profile_header`, valable pour un chemin et jusqu'à une date d'expiration) :
+      python -c "from backend.core.profiler import profile_header; print(profile_header('/portfolio/skills'))"
+- ou elle est tirée au sort (`profiler_sample_rate`).
+
+Pendant une requête profilée, un thread échantillonne toutes les
+`profiler_interval_ms` les tâches asyncio de la requête (tâche principale
+et tâches filles, qui héritent de son contexte) :
+- tâche en cours d'exécution : pile du thread de la boucle (`sys._current_frames`) ;
+- tâche suspendue : chaîne des `await` de sa coroutine, terminée par `[await]`.
+Le temps passé à attendre MongoDB (durée des commandes, via un listener
+pymongo) et Neo4j (appels `call_graph`) est totalisé à part.
+
+Le profil est écrit dans `profiler_dir` (JSON, depuis un thread : la boucle
+n'attend pas le disque), son id renvoyé dans l'en-tête `X-Profile-Id`, et il
+est téléchargeable depuis `/admin/profiles/{id}` au format « collapsed
+stacks » (flamegraph.pl, speedscope) ou speedscope.
+
+Hors requête profilée, le coût se limite à la lecture d'une variable de
+contexte : aucun thread ne tourne.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Optional
+
+from pymongo import monitoring
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.config import Settings, get_settings
+
+logger = logging.getLogger("backend")
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+_PROFILE_ID = re.compile(r"^\d{13}-[0-9a-f]{8}$")
+
+_active: ContextVar[Optional[Profile]] = ContextVar("profile", default=None)
+
+
+# ── Profil d'une requête ───────────────────────────────────────
+
+class Profile:
+    """Piles échantillonnées (« collapsed » : `a;b;c` → nombre d'échantillons) et attentes des bases."""
+
+    def __init__(self, method: str, path: str, interval: float):
+        self.id = f"{int(time.time() * 1000):013d}-{secrets.token_hex(4)}"
+        self.method = method
+        self.path = path
+        self.interval = interval
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.stacks: Counter[str] = Counter()
+        self.awaits: dict[str, list[float]] = {}  # nom → [appels, secondes]
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        return f"{self.method} {self.path}"
+
+    def add_sample(self, stack: str) -> None:
+        with self._lock:
+            self.stacks[stack] += 1
+
+    def add_await(self, name: str, seconds: float) -> None:
+        with self._lock:
+            entry = self.awaits.setdefault(name, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "id": self.id,
+                "method": self.method,
+                "path": self.path,
+                "started_at": self.started_at,
+                "duration_ms": round(self.duration * 1000, 3),
+                "interval_ms": self.interval * 1000,
+                "samples": sum(self.stacks.values()),
+                "awaits": {
+                    name: {"calls": int(calls), "ms": round(seconds * 1000, 3)}
+                    for name, (calls, seconds) in self.awaits.items()
+                },
+                "stacks": dict(self.stacks),
+            }
+
+
+def record_await(name: str, seconds: float) -> None:
+    """Ajoute un temps d'attente (base de données) au profil de la requête courante, s'il y en a un."""
+    profile = _active.get()
+    if profile is not None:
+        profile.add_await(name, seconds)
+
+
+class MongoCommandTimer(monitoring.CommandListener):
+    """Durée des commandes MongoDB, imputée au profil de la requête.
+
+    Motor exécute pymongo dans un pool de threads en copiant le contexte :
+    le listener y voit la variable de contexte de la requête.
+    """
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        pass
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        record_await(f"mongo.{event.command_name}", event.duration_micros / 1e6)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        record_await(f"mongo.{event.command_name}", event.duration_micros / 1e6)
+
+
+# ── Échantillonnage ────────────────────────────────────────────
+
+@lru_cache(maxsize=8192)
+def _label(code: CodeType) -> str:
+    filename = code.co_filename
+    for marker in ("site-packages/", "/src/"):
+        index = filename.rfind(marker)
+        if index >= 0:
+            filename = filename[index + len(marker):]
+            break
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _thread_stack(frame: Optional[FrameType]) -> list[str]:
+    """Pile d'un thread (de l'extérieur vers l'intérieur), sans la mécanique de la boucle asyncio."""
+    frames: list[CodeType] = []
+    while frame is not None:
+        frames.append(frame.f_code)
+        frame = frame.f_back
+    frames.reverse()
+    for index in range(len(frames) - 1, -1, -1):
+        if frames[index].co_filename.endswith(os.path.join("asyncio", "events.py")):
+            frames = frames[index + 1:]
+            break
+    return [_label(code) for code in frames]
+
+
+def _await_stack(coro: Any) -> list[str]:
+    """Chaîne des `await` d'une coroutine suspendue (de l'extérieur vers l'intérieur)."""
+    labels: list[str] = []
+    while coro is not None:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            break
+        labels.append(_label(frame.f_code))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    labels.append("[await]")
+    return labels
+
+
+class Sampler:
+    """Thread d'échantillonnage, démarré tant qu'au moins une requête est profilée."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._profiles: set[Profile] = set()
+        self._stop: Optional[threading.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread = 0
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.add(profile)
+            if self._stop is None:
+                self._loop = asyncio.get_running_loop()
+                self._loop_thread = threading.get_ident()
+                self._stop = threading.Event()
+                threading.Thread(
+                    target=self._run, args=(self._stop, profile.interval), name="profiler", daemon=True,
+                ).start()
+
+    def remove(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles.discard(profile)
+            if not self._profiles and self._stop is not None:
+                self._stop.set()
+                self._stop = None
+
+    def _run(self, stop: threading.Event, interval: float) -> None:
+        while not stop.wait(interval):
+            with self._lock:
+                profiles = set(self._profiles)
+            if profiles:
+                try:
+                    self._sample(profiles)
+                except Exception:  # un échantillon perdu ne doit pas arrêter le thread
+                    logger.debug("Échantillon de profilage ignoré", exc_info=True)
+
+    def _sample(self, profiles: set[Profile]) -> None:
+        loop = self._loop
+        running = asyncio.current_task(loop)
+        for task in asyncio.all_tasks(loop):
+            profile = task.get_context().get(_active)
+            if profile not in profiles:
+                continue
+            if task is running:
+                stack = _thread_stack(sys._current_frames().get(self._loop_thread))
+            else:
+                stack = _await_stack(task.get_coro())
+            profile.add_sample(";".join([profile.root, *stack]))
+
+
+_sampler: Sampler | None = None
+
+
+def get_sampler() -> Sampler:
+    global _sampler
+    if _sampler is None:
+        _sampler = Sampler()
+    return _sampler
+
+
+# ── Stockage et formats ────────────────────────────────────────
+
+class ProfileStore:
+    """Profils sauvegardés en JSON dans un dossier (partagé par les workers), les plus anciens supprimés."""
+
+    def __init__(self, directory: Path, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def save(self, profile: Profile) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{profile.id}.json"
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(profile.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp, path)
+            for old in self._paths()[:-self.max_profiles]:
+                old.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Impossible d'écrire le profil %s : %s", profile.id, exc)
+
+    def list(self) -> list[dict[str, Any]]:
+        """Métadonnées des profils, du plus récent au plus ancien (sans les piles)."""
+        summaries = []
+        for path in reversed(self._paths()):
+            data = self._read(path)
+            if data is not None:
+                data.pop("stacks", None)
+                summaries.append(data)
+        return summaries
+
+    def load(self, profile_id: str) -> Optional[dict[str, Any]]:
+        if not _PROFILE_ID.match(profile_id):
+            return None
+        return self._read(self.directory / f"{profile_id}.json")
+
+    def _paths(self) -> list[Path]:
+        return sorted(self.directory.glob("*.json")) if self.directory.exists() else []
+
+    @staticmethod
+    def _read(path: Path) -> Optional[dict[str, Any]]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+
+_store: ProfileStore | None = None
+
+
+def get_profile_store() -> ProfileStore:
+    global _store
+    if _store is None:
+        settings = get_settings()
+        _store = ProfileStore(Path(settings.profiler_dir), settings.profiler_max_profiles)
+    return _store
+
+
+def to_collapsed(data: dict[str, Any]) -> str:
+    """Format « collapsed stacks » : une ligne `frame;frame;frame nombre` par pile."""
+    return "".join(f"{stack} {count}\n" for stack, count in data["stacks"].items())
+
+
+def to_speedscope(data: dict[str, Any]) -> dict[str, Any]:
+    """Format de fichier speedscope (profil échantillonné, poids en millisecondes)."""
+    frames: dict[str, int] = {}
+    samples: list[list[int]] = []
+    weights: list[float] = []
+    for stack, count in data["stacks"].items():
+        samples.append([frames.setdefault(name, len(frames)) for name in stack.split(";")])
+        weights.append(count * data["interval_ms"])
+    name = f"{data['method']} {data['path']} ({data['id']})"
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "portfolio-backend",
+        "shared": {"frames": [{"name": frame} for frame in frames]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
+
+
+# ── Déclenchement ──────────────────────────────────────────────
+
+def _signature(secret: str, expires: int, path: str) -> str:
+    return hmac.new(secret.encode(), f"{expires}:{path}".encode(), hashlib.sha256).hexdigest()
+
+
+def profile_header(path: str, ttl: int = 300, secret: Optional[str] = None) -> str:
+    """Valeur d'en-tête `X-Profile` autorisant le profilage de `path` pendant `ttl` secondes."""
+    expires = int(time.time()) + ttl
+    return f"{expires}.{_signature(secret or get_settings().profiler_secret, expires, path)}"
+
+
+def _valid_signature(value: str, path: str, secret: str) -> bool:
+    expires, _, signature = value.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(secret, int(expires), path))
+
+
+class ProfilerMiddleware:
+    """Middleware ASGI : profile les requêtes signées ou tirées au sort."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        settings = get_settings()
+        if scope["type"] != "http" or not settings.profiler_enabled or not self._triggered(scope, settings):
+            await self.app(scope, receive, send)
+            return
+
+        profile = Profile(scope["method"], scope["path"], settings.profiler_interval_ms / 1000)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (PROFILE_ID_HEADER, profile.id.encode())]
+            await send(message)
+
+        sampler = get_sampler()
+        token = _active.set(profile)
+        sampler.add(profile)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profile.duration = time.perf_counter() - start
+            sampler.remove(profile)
+            _active.reset(token)
+            # Sérialisation, écriture et purge du dossier dans un thread : la boucle n'est pas bloquée.
+            await asyncio.to_thread(get_profile_store().save, profile)
+
+    @staticmethod
+    def _triggered(scope: Scope, settings: Settings) -> bool:
+        if settings.profiler_secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return _valid_signature(value.decode("latin-1"), scope["path"], settings.profiler_secret)
+        return settings.profiler_sample_rate > 0 and random.random() < settings.profiler_sample_rate
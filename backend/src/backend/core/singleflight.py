@@ -0,0 +1,113 @@
+"""Single-flight — coalescence des requêtes identiques concurrentes.
+
+Quand plusieurs requêtes identiques (même route, mêmes paramètres) arrivent
+en même temps, une seule exécute le calcul ; les autres attendent son
+résultat au lieu de relancer leurs propres requêtes MongoDB / Neo4j.
+
+Le calcul partagé tourne avec le budget serveur de la route
+(`backend.core.deadline.shared_context`) ; chaque appelant n'attend que
+jusqu'à sa propre échéance. Un client qui demande un délai très court
+(`X-Request-Timeout-Ms`) n'échoue donc que pour lui-même.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from fastapi import Request
+
+from backend.core.config import get_settings
+from backend.core.deadline import DEADLINE_DETAIL, DeadlineExceeded, remaining, shared_context
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Partage un calcul en cours entre tous les appelants d'une même clé.
+
+    Le calcul tourne dans sa propre tâche : si le client qui l'a déclenché se
+    déconnecte, la tâche n'est pas annulée et les autres appelants reçoivent
+    quand même le résultat. Avec `stale_ttl > 0`, le dernier résultat connu
+    (s'il a moins de `stale_ttl` secondes) est servi immédiatement pendant
+    qu'un nouveau calcul est en cours.
+    """
+
+    def __init__(self, stale_ttl: float = 0.0, max_entries: int = 1024):
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._last: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._run(key, fn), context=shared_context())
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        else:
+            stale = self._fresh_enough(key)
+            if stale is not None:
+                return stale
+        # Chaque appelant attend selon sa propre échéance ; le calcul continue pour les autres.
+        timeout = asyncio.timeout(remaining())
+        try:
+            async with timeout:
+                return await asyncio.shield(task)
+        except TimeoutError:
+            if not timeout.expired():
+                raise  # erreur du calcul lui-même
+            raise DeadlineExceeded(DEADLINE_DETAIL) from None
+
+    async def _run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        try:
+            result = await fn()
+            if self.stale_ttl > 0:
+                self._remember(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def _fresh_enough(self, key: str) -> Optional[Any]:
+        entry = self._last.get(key)
+        if entry is None or time.monotonic() - entry[0] > self.stale_ttl:
+            return None
+        return entry[1]
+
+    def _remember(self, key: str, result: Any) -> None:
+        self._last[key] = (time.monotonic(), result)
+        self._last.move_to_end(key)
+        while len(self._last) > self.max_entries:
+            self._last.popitem(last=False)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # Évite le warning "exception was never retrieved" si tous les appelants sont partis.
+    if not task.cancelled():
+        task.exception()
+
+
+def request_key(request: Request, variant: str = "") -> str:
+    """Clé de coalescence : chemin + paramètres de requête triés (+ variante hors URL, ex. format négocié)."""
+    params = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    key = f"{request.url.path}?{params}"
+    return f"{key}#{variant}" if variant else key
+
+
+_flights: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Retourne l'instance partagée (singleton), configurée depuis les settings."""
+    global _flights
+    if _flights is None:
+        settings = get_settings()
+        _flights = SingleFlight(settings.singleflight_stale_ttl, settings.singleflight_max_entries)
+    return _flights
+
+
+async def coalesce(request: Request, fn: Callable[[], Awaitable[T]], variant: str = "") -> T:
+    """Exécute `fn` une seule fois pour toutes les requêtes identiques concurrentes (même `variant`)."""
+    return await get_single_flight().do(request_key(request, variant), fn)
@@ -0,0 +1,147 @@
+"""Snapshot partagé — réponses pré-encodées lues par tous les workers via mmap.
+
+Le lanceur multi-workers (`backend.launcher`) écrit périodiquement un fichier
+contenant les réponses déjà encodées de chaque profil (JSON, plus MessagePack
+et CBOR si disponibles), puis incrémente un compteur de génération placé en
+mémoire partagée. Chaque worker projette le fichier courant en mémoire (`mmap`,
+lecture seule) : les pages sont celles du cache du noyau, partagées entre tous
+les workers au lieu d'être dupliquées.
+
+Format du fichier : blocs de données bout à bout, puis un index JSON
+`clé → [offset, longueur]`, puis un pied fixe (offset et taille de l'index, magic).
+
+Sans lanceur (uvicorn seul, Vercel), aucun snapshot n'est attaché : les routes
+lisent directement MongoDB.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger("backend")
+
+MAGIC = b"PFSNAP01"
+_FOOTER = struct.Struct("<QQ8s")
+
+
+def snapshot_path(directory: Path, generation: int) -> Path:
+    return directory / f"snapshot-{generation}.bin"
+
+
+class SnapshotWriter:
+    """Écrit un snapshot en flux (mémoire constante), publié atomiquement par `commit()`."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._tmp = path.with_suffix(".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp, "wb")
+        self._index: dict[str, tuple[int, int]] = {}
+        self._offset = 0
+
+    def add(self, key: str, data: bytes) -> None:
+        self._file.write(data)
+        self._index[key] = (self._offset, len(data))
+        self._offset += len(data)
+
+    def commit(self) -> None:
+        index = json.dumps(self._index, separators=(",", ":")).encode()
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(self._offset, len(index), MAGIC))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> SnapshotWriter:
+        return self
+
+    def __exit__(self, exc_type, *_exc) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+class SnapshotReader:
+    """Accès en lecture seule à un fichier de snapshot projeté en mémoire."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        index_offset, index_length, magic = _FOOTER.unpack_from(self._mm, len(self._mm) - _FOOTER.size)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"Snapshot invalide : {path}")
+        self._index: dict[str, list[int]] = json.loads(self._mm[index_offset:index_offset + index_length])
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._mm[offset:offset + length]
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+class SharedSnapshot:
+    """Snapshot courant d'un worker, suivi via le compteur de génération partagé.
+
+    `generation` est une valeur en mémoire partagée (créée par le parent avant
+    le fork) : 0 tant qu'aucun snapshot n'a été publié. Un changement de
+    génération est détecté à la lecture suivante, sans signal ni verrou.
+    """
+
+    def __init__(self, directory: Path, generation: Any):
+        self.directory = directory
+        self.generation = generation
+        self._seen = 0
+        self._reader: Optional[SnapshotReader] = None
+
+    def get(self, key: str) -> Optional[bytes]:
+        generation = self.generation.value
+        if generation != self._seen:
+            self._switch(generation)
+        return self._reader.get(key) if self._reader is not None else None
+
+    def _switch(self, generation: int) -> None:
+        self._seen = generation
+        try:
+            reader = SnapshotReader(snapshot_path(self.directory, generation))
+        except (OSError, ValueError) as exc:
+            # On garde le snapshot précédent plutôt que de retomber sur MongoDB.
+            logger.warning("Snapshot %d illisible : %s", generation, exc)
+            return
+        if self._reader is not None:
+            self._reader.close()
+        self._reader = reader
+
+
+_shared: SharedSnapshot | None = None
+
+
+def attach(directory: Path, generation: Any) -> SharedSnapshot:
+    """Active le snapshot partagé (appelé par le lanceur avant de forker les workers)."""
+    global _shared
+    _shared = SharedSnapshot(directory, generation)
+    return _shared
+
+
+def get_snapshot() -> Optional[SharedSnapshot]:
+    """Snapshot partagé du processus, ou None hors mode multi-workers."""
+    return _shared
@@ -2,17 +2,75 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
 
 from backend.core.config import get_settings
+from backend.core.deadline import remaining_ms
+from backend.core.profiler import MongoCommandTimer
 
 _client: AsyncIOMotorClient | None = None
 
+# Champ propriétaire : id du `Person` (profil) auquel appartient chaque document.
+OWNER_FIELD = "owner_id"
+
+# Collections d'un portfolio, toutes cloisonnées par `owner_id`.
+PORTFOLIO_COLLECTIONS = (
+    "personal_infos",
+    "projects",
+    "experiences",
+    "educations",
+    "certifications",
+    "skills",
+    "hobbies",
+    "technologies",
+)
+
+
+# Vue matérialisée des statistiques d'un profil (un document par `owner_id`).
+ANALYTICS_COLLECTION = "analytics"
+
+# Champ de tri chronologique des collections (date BSON native, année pour le parcours scolaire).
+DATE_FIELDS = {
+    "projects": "date_debut",
+    "experiences": "date_debut",
+    "educations": "start_year",
+    "certifications": "obtention_date",
+}
+
 
 def get_mongo_db() -> AsyncIOMotorDatabase:
     """Retourne la base MongoDB (singleton). À compléter : créer le client Motor avec settings.mongo_url, retourner client[settings.mongo_db]."""
     global _client
     settings = get_settings()
     if _client is None:
-        _client = AsyncIOMotorClient(settings.mongo_url)
+        _client = AsyncIOMotorClient(settings.mongo_url, event_listeners=[MongoCommandTimer()])
     return _client[settings.mongo_db]
+
+
+def bounded(cursor):
+    """Borne le curseur par le budget restant de la requête (`maxTimeMS`), s'il y en a un."""
+    budget = remaining_ms()
+    return cursor if budget is None else cursor.max_time_ms(budget)
+
+
+async def ensure_indexes(db: Optional[AsyncIOMotorDatabase] = None) -> None:
+    """Index composés menés par `owner_id` (idempotent).
+
+    `(owner_id, id)` pour les listes et les accès par id, `(owner_id, date, id)`
+    pour les tris chronologiques (l'id départage les dates égales lors de la
+    pagination). Toute lecture d'un profil devient un parcours d'index borné
+    à ce profil : son coût ne dépend pas du nombre de profils hébergés.
+    """
+    db = db if db is not None else get_mongo_db()
+    for name in PORTFOLIO_COLLECTIONS:
+        await db[name].create_index(
+            [(OWNER_FIELD, ASCENDING), ("id", ASCENDING)],
+            unique=True,
+            name="owner_id_1_id_1",
+        )
+    for name, field in DATE_FIELDS.items():
+        await db[name].create_index([(OWNER_FIELD, ASCENDING), (field, DESCENDING), ("id", DESCENDING)])
+    await db[ANALYTICS_COLLECTION].create_index(OWNER_FIELD, unique=True)
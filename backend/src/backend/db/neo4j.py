@@ -2,11 +2,38 @@
 
 from __future__ import annotations
 
-from neo4j import AsyncGraphDatabase, AsyncDriver
+import logging
+import time
+from typing import Any, Awaitable, Callable
 
+from neo4j import AsyncGraphDatabase, AsyncDriver, Query
+from neo4j.exceptions import DriverError, Neo4jError
+
+from backend.core.circuit_breaker import CircuitBreaker, CircuitOpenError
 from backend.core.config import get_settings
+from backend.core.deadline import DeadlineExceeded, expired, remaining
+from backend.core.fallback import get_graph_fallback
+from backend.core.profiler import record_await
 
 _driver: AsyncDriver | None = None
+_breaker: CircuitBreaker | None = None
+
+# Erreurs après lesquelles on bascule sur les données de repli.
+GRAPH_ERRORS = (CircuitOpenError, Neo4jError, DriverError, OSError, TimeoutError)
+
+logger = logging.getLogger("backend")
+
+# Relations qui rattachent chaque nœud au `Person` de son profil : les requêtes
+# partent de ce nœud (index sur `Person.id`) au lieu de parcourir tout un label.
+PERSON_RELATIONS = {
+    "Project": "CREATED",
+    "Experience": "WORKED_AT",
+    "Education": "STUDIED_AT",
+    "Certification": "CERTIFIED_IN",
+    "Skill": "MASTER",
+    "Hobby": "PRACTICES",
+    "Technology": "KNOWS",
+}
 
 
 def get_neo4j_driver() -> AsyncDriver:
@@ -18,6 +45,64 @@ def get_neo4j_driver() -> AsyncDriver:
     return _driver
 
 
+def get_neo4j_breaker() -> CircuitBreaker:
+    """Circuit breaker partagé par tous les appels d'enrichissement Neo4j (singleton)."""
+    global _breaker
+    settings = get_settings()
+    if _breaker is None:
+        _breaker = CircuitBreaker(
+            "neo4j",
+            failure_threshold=settings.neo4j_breaker_failure_threshold,
+            reset_timeout=settings.neo4j_breaker_reset_timeout_s,
+            call_timeout=settings.neo4j_call_timeout_s,
+        )
+    return _breaker
+
+
+def bounded_query(text: str) -> Query:
+    """Requête Cypher dont le timeout de transaction est le budget restant de la requête HTTP."""
+    return Query(text, timeout=remaining())
+
+
+async def call_graph(
+    namespace: str,
+    query: Callable[[], Awaitable[dict[str, Any]]],
+) -> tuple[dict[str, Any], bool]:
+    """Exécute une requête d'enrichissement derrière le circuit breaker.
+
+    Retourne `(résultat, dégradé)`. Si Neo4j est en panne, lent ou si le
+    circuit est ouvert, le résultat est le dernier connu pour `namespace`
+    (éventuellement vide) et `dégradé` vaut True : pas d'erreur, pas d'attente.
+    L'appel est aussi borné par la deadline de la requête : si c'est elle qui
+    expire, `DeadlineExceeded` est levée (504) au lieu du repli.
+    """
+    fallback = get_graph_fallback()
+    start = time.perf_counter()
+    try:
+        result = await get_neo4j_breaker().call(query, timeout=remaining())
+    except GRAPH_ERRORS as exc:
+        record_await("neo4j", time.perf_counter() - start)
+        if expired():
+            raise DeadlineExceeded("Deadline dépassée pendant l'appel Neo4j") from exc
+        # Circuit ouvert : déjà signalé à l'ouverture, inutile de journaliser chaque requête.
+        log = logger.debug if isinstance(exc, CircuitOpenError) else logger.warning
+        log("Neo4j indisponible, repli sur '%s' : %r", namespace, exc)
+        return fallback.get(namespace), True
+    record_await("neo4j", time.perf_counter() - start)
+    fallback.update(namespace, result)
+    return result, False
+
+
+async def ensure_graph_indexes(driver: AsyncDriver) -> None:
+    """Contrainte d'unicité sur `Person.id` (point d'ancrage) et index `(owner_id, id)` par label."""
+    async with driver.session() as session:
+        await session.run("CREATE CONSTRAINT person_id IF NOT EXISTS FOR (n:Person) REQUIRE n.id IS UNIQUE")
+        for label in PERSON_RELATIONS:
+            await session.run(
+                f"CREATE INDEX {label.lower()}_owner_id IF NOT EXISTS FOR (n:{label}) ON (n.owner_id, n.id)"
+            )
+
+
 async def close_neo4j() -> None:
     global _driver
     if _driver is not None:
@@ -0,0 +1,250 @@
+"""Lanceur de production — workers uvicorn préforkés et snapshot partagé.
+
+Usage: python -m backend.launcher (ou backend/build.py avec WORKERS > 1)
+
+1. Le parent importe l'application (modules, schémas, adaptateurs pydantic)
+   puis gèle le GC : ces pages restent partagées en copy-on-write par les workers.
+2. Un processus fils lit MongoDB et écrit le snapshot des réponses
+   pré-encodées (`backend.core.snapshot`) ; le parent le publie en
+   incrémentant le compteur de génération en mémoire partagée.
+3. Le parent ouvre le socket d'écoute et forke N workers qui acceptent tous
+   sur ce socket ; un worker qui meurt est relancé.
+4. Toutes les `snapshot_refresh_s` secondes, un nouveau snapshot est construit
+   de la même façon ; les workers basculent dessus à leur requête suivante.
+
+Le parent n'ouvre aucune connexion et ne démarre aucun thread : il peut
+forker à tout moment sans hériter d'un état incohérent (verrous, sockets).
+Linux / macOS uniquement (`os.fork`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from multiprocessing.sharedctypes import RawValue
+from pathlib import Path
+from typing import Optional
+
+import uvicorn
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pydantic import BaseModel
+
+from backend.api.dependencies import projection, snapshot_key
+from backend.api.responses import encode_formats, encode_list
+from backend.app import app
+from backend.core.config import get_settings
+from backend.core.logging import setup_logging
+from backend.core.snapshot import SnapshotWriter, attach, snapshot_path
+from backend.db.mongo import ANALYTICS_COLLECTION, OWNER_FIELD
+from backend.models import (
+    Certification,
+    Experience,
+    Hobby,
+    ParcoursScolaire,
+    PersonalInfo,
+    PortfolioAnalytics,
+    Projet,
+    Skill,
+    Techno,
+)
+
+logger = logging.getLogger("backend")
+
+# Listes servies depuis le snapshot (mêmes encodages que `find_all`).
+SNAPSHOT_COLLECTIONS: dict[str, type[BaseModel]] = {
+    "skills": Skill,
+    "projects": Projet,
+    "technologies": Techno,
+    "hobbies": Hobby,
+    "experiences": Experience,
+    "educations": ParcoursScolaire,
+    "certifications": Certification,
+}
+
+
+# ── Construction du snapshot (processus fils) ──────────────────
+
+def _add(writer: SnapshotWriter, owner: str, collection: str, encoded: dict[str, bytes]) -> None:
+    for fmt, body in encoded.items():
+        writer.add(snapshot_key(owner, collection, fmt), body)
+
+
+async def _add_collection(writer: SnapshotWriter, db: AsyncIOMotorDatabase, collection: str,
+                          model: type[BaseModel]) -> None:
+    """Une entrée par profil ; le curseur suit l'index (owner_id, id), un profil en mémoire à la fois."""
+    cursor = db[collection].find({}, {**projection(model), OWNER_FIELD: 1}).sort([(OWNER_FIELD, 1), ("id", 1)])
+    owner: Optional[str] = None
+    docs: list[dict] = []
+    async for doc in cursor:
+        doc_owner = doc.pop(OWNER_FIELD)
+        if doc_owner != owner and docs:
+            _add(writer, owner, collection, encode_formats(model, docs))
+            docs = []
+        owner = doc_owner
+        docs.append(doc)
+    if docs:
+        _add(writer, owner, collection, encode_formats(model, docs))
+
+
+async def build_snapshot(path: Path) -> None:
+    settings = get_settings()
+    client = AsyncIOMotorClient(settings.mongo_url)
+    try:
+        db = client[settings.mongo_db]
+        with SnapshotWriter(path) as writer:
+            for collection, model in SNAPSHOT_COLLECTIONS.items():
+                await _add_collection(writer, db, collection, model)
+            async for doc in db["personal_infos"].find({}, {**projection(PersonalInfo), OWNER_FIELD: 1}):
+                _add(writer, doc.pop(OWNER_FIELD), "personal_infos", encode_formats(PersonalInfo, doc))
+            async for doc in db[ANALYTICS_COLLECTION].find({}, {"_id": 0}):
+                _add(writer, doc.pop(OWNER_FIELD), ANALYTICS_COLLECTION, encode_formats(PortfolioAnalytics, doc))
+    finally:
+        client.close()
+
+
+def _spawn_builder(path: Path) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            asyncio.run(build_snapshot(path))
+        except Exception:
+            logger.exception("Construction du snapshot impossible")
+            code = 1
+        os._exit(code)
+    return pid
+
+
+# ── Workers ────────────────────────────────────────────────────
+
+def _bind(host: str, port: int) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _spawn_worker(sock: socket.socket) -> int:
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        code = 0
+        try:
+            uvicorn.Server(uvicorn.Config(app, log_config=None)).run(sockets=[sock])
+        except Exception:
+            logger.exception("Worker %d arrêté sur erreur", os.getpid())
+            code = 1
+        os._exit(code)
+    return pid
+
+
+def _warm_up() -> None:
+    """Construit avant le fork ce que chaque worker construirait sinon pour lui seul."""
+    for model in SNAPSHOT_COLLECTIONS.values():
+        encode_list(model, [])  # adaptateur pydantic mis en cache
+    app.openapi()
+
+
+# ── Parent ─────────────────────────────────────────────────────
+
+class Launcher:
+    def __init__(self, workers: int):
+        settings = get_settings()
+        self.settings = settings
+        self.workers = workers
+        self.directory = Path(settings.snapshot_dir)
+        self.generation = RawValue("Q", 0)
+        self.pids: set[int] = set()
+        self.builder: Optional[tuple[int, int]] = None  # (pid, génération en construction)
+        self.stopping = False
+
+    def run(self) -> None:
+        attach(self.directory, self.generation)
+        _warm_up()
+
+        pid = _spawn_builder(snapshot_path(self.directory, 1))
+        _, status = os.waitpid(pid, 0)
+        self._built(1, status)
+
+        gc.freeze()
+        sock = _bind(self.settings.host, self.settings.port)
+        for _ in range(self.workers):
+            self.pids.add(_spawn_worker(sock))
+        logger.info("%d workers sur %s:%d", self.workers, self.settings.host, self.settings.port)
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        refresh = self.settings.snapshot_refresh_s
+        next_refresh = time.monotonic() + refresh
+        try:
+            while not self.stopping:
+                self._reap(sock)
+                if refresh > 0 and self.builder is None and time.monotonic() >= next_refresh:
+                    generation = self.generation.value + 1
+                    self.builder = (_spawn_builder(snapshot_path(self.directory, generation)), generation)
+                    next_refresh = time.monotonic() + refresh
+                time.sleep(0.5)
+        finally:
+            self._shutdown()
+            sock.close()
+
+    def _stop(self, *_args) -> None:
+        self.stopping = True
+
+    def _reap(self, sock: socket.socket) -> None:
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            if self.builder is not None and pid == self.builder[0]:
+                self._built(self.builder[1], status)
+                self.builder = None
+            elif pid in self.pids:
+                self.pids.discard(pid)
+                if not self.stopping:
+                    logger.warning("Worker %d terminé (statut %d), relance", pid, status)
+                    self.pids.add(_spawn_worker(sock))
+
+    def _built(self, generation: int, status: int) -> None:
+        if os.waitstatus_to_exitcode(status) != 0:
+            logger.warning("Snapshot %d non publié : les workers gardent le précédent", generation)
+            return
+        self.generation.value = generation
+        # Les workers encore sur l'ancienne génération gardent leur mmap valide même après suppression.
+        for path in self.directory.glob("snapshot-*.bin"):
+            if path != snapshot_path(self.directory, generation):
+                path.unlink(missing_ok=True)
+        logger.info("Snapshot %d publié", generation)
+
+    def _shutdown(self) -> None:
+        for pid in self.pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in list(self.pids) + ([self.builder[0]] if self.builder else []):
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+
+
+def serve(workers: Optional[int] = None) -> None:
+    setup_logging()
+    settings = get_settings()
+    Launcher(workers or settings.workers or os.cpu_count() or 1).run()
+
+
+if __name__ == "__main__":
+    serve()
@@ -1,6 +1,7 @@
 """Pydantic models — réexporte les schemas partagés."""
 
 from shared.schemas import (  # noqa: F401
+    AnalyticsItem,
     Certification,
     City,
     CityDetail,
@@ -12,6 +13,7 @@ from shared.schemas import (  # noqa: F401
     Hobby,
     ParcoursScolaire,
     PersonalInfo,
+    PortfolioAnalytics,
     Projet,
     ProjetDetail,
     RecommendationItem,
@@ -21,10 +23,14 @@ from shared.schemas import (  # noqa: F401
     ReviewsResponse,
     ScoreCategory,
     Skill,
+    Suggestion,
     Techno,
+    TimelineItem,
+    TimelinePage,
 )
 
 __all__ = [
+    "AnalyticsItem",
     "Certification",
     "City",
     "CityDetail",
@@ -36,6 +42,7 @@ __all__ = [
     "Hobby",
     "ParcoursScolaire",
     "PersonalInfo",
+    "PortfolioAnalytics",
     "Projet",
     "ProjetDetail",
     "RecommendationItem",
@@ -45,5 +52,8 @@ __all__ = [
     "ReviewsResponse",
     "ScoreCategory",
     "Skill",
+    "Suggestion",
     "Techno",
+    "TimelineItem",
+    "TimelinePage",
 ]
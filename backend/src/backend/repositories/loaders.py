@@ -0,0 +1,182 @@
+"""Loaders par lot — regroupement des accès par id (style DataLoader).
+
+Tous les `load()` émis pendant un même tour de boucle asyncio sont
+regroupés en une seule requête (`$in` côté MongoDB, `IN $ids` côté Neo4j),
+dédupliqués, puis mis en cache pour la durée de vie du loader (une requête HTTP).
+Chaque requête groupée est bornée par la deadline de la requête HTTP.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, Optional, TypeVar
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from neo4j import AsyncDriver
+
+from backend.db.mongo import OWNER_FIELD, bounded
+from backend.db.neo4j import PERSON_RELATIONS, bounded_query, call_graph
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class DataLoader(Generic[K, V]):
+    """Regroupe les clés demandées dans le même tick en un seul appel à `batch_fn`.
+
+    `batch_fn` reçoit la liste des clés (sans doublon) et retourne un dict
+    clé → valeur ; une clé absente du dict se résout à `None`.
+    """
+
+    def __init__(self, batch_fn: Callable[[list[K]], Awaitable[dict[K, V]]]):
+        self._batch_fn = batch_fn
+        self._cache: dict[K, asyncio.Future] = {}
+        self._queue: list[K] = []
+        # Requêtes groupées en cours : référence gardée jusqu'à leur fin (la boucle ne garde qu'une référence faible).
+        self._tasks: set[asyncio.Task] = set()
+
+    def load(self, key: K) -> Awaitable[Optional[V]]:
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        self._queue.append(key)
+        if len(self._queue) == 1:
+            # Premier appel du tick : on laisse les autres coroutines prêtes
+            # ajouter leurs clés avant de lancer la requête groupée.
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[Optional[V]]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._run(keys))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, keys: list[K]) -> None:
+        try:
+            results = await self._batch_fn(keys)
+        except Exception as exc:
+            for key in keys:
+                # Pas de mise en cache des échecs : un nouvel appel relancera la requête.
+                future = self._cache.pop(key)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key in keys:
+            future = self._cache[key]
+            if not future.done():
+                future.set_result(results.get(key))
+
+
+class Loaders:
+    """Ensemble des loaders d'une requête (un cache par collection / relation).
+
+    Toutes les lectures sont limitées au profil `owner` : filtre `owner_id`
+    côté MongoDB, requêtes ancrées sur le nœud `Person` du profil côté Neo4j.
+    Les requêtes Neo4j passent par le circuit breaker : en cas de panne, les
+    derniers liens connus sont servis et `degraded` passe à True.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, driver: AsyncDriver, owner: str):
+        self.db = db
+        self.driver = driver
+        self.owner = owner
+        self._collections: dict[str, DataLoader[str, dict]] = {}
+        self._project_links: Optional[DataLoader[str, dict]] = None
+        self._relations: dict[tuple[str, str, str, str], DataLoader[str, list]] = {}
+        self.degraded = False
+
+    def collection(self, name: str) -> DataLoader[str, dict]:
+        """Loader des documents d'une collection MongoDB, indexés par leur champ `id`."""
+        loader = self._collections.get(name)
+        if loader is None:
+            loader = DataLoader(lambda ids: self._find_by_ids(name, ids))
+            self._collections[name] = loader
+        return loader
+
+    @property
+    def project_links(self) -> DataLoader[str, dict]:
+        """Loader des technologies et compétences liées à un projet (graphe Neo4j)."""
+        if self._project_links is None:
+            self._project_links = DataLoader(self._find_project_links)
+        return self._project_links
+
+    def relation(
+        self,
+        source: str,
+        rel_type: str,
+        target: str,
+        prop: str = "id",
+    ) -> DataLoader[str, list]:
+        """Loader `id source → [prop des cibles]` pour une relation du graphe.
+
+        Une seule requête Neo4j par tick, quel que soit le nombre de nœuds
+        sources demandés. Les labels et types viennent du code, jamais du client.
+        """
+        key = (source, rel_type, target, prop)
+        loader = self._relations.get(key)
+        if loader is None:
+            loader = DataLoader(lambda ids: self._find_related(source, rel_type, target, prop, ids))
+            self._relations[key] = loader
+        return loader
+
+    async def _find_by_ids(self, name: str, ids: list[str]) -> dict[str, dict]:
+        docs = await bounded(self.db[name].find(
+            {OWNER_FIELD: self.owner, "id": {"$in": ids}}, {"_id": 0},
+        )).to_list()
+        return {doc["id"]: doc for doc in docs}
+
+    async def _find_project_links(self, ids: list[str]) -> dict[str, dict[str, Any]]:
+        async def query() -> dict[str, dict[str, Any]]:
+            async with self.driver.session() as session:
+                result = await session.run(bounded_query("""
+                    MATCH (:Person {id: $owner})-[:CREATED]->(p:Project)
+                    WHERE p.id IN $ids
+                    OPTIONAL MATCH (p)-[:USES_TECHNOLOGY]->(t:Technology)
+                    WITH p, collect(DISTINCT t.nom) AS technologies
+                    OPTIONAL MATCH (p)-[:REQUIRES_SKILL]->(s:Skill)
+                    RETURN p.id AS id, technologies, collect(DISTINCT s.nom) AS skills
+                """), owner=self.owner, ids=ids)
+                records = [r async for r in result]
+            return {
+                r["id"]: {"technologies": r["technologies"], "skills": r["skills"]}
+                for r in records
+            }
+
+        return await self._graph("project_links", ids, query)
+
+    async def _find_related(
+        self,
+        source: str,
+        rel_type: str,
+        target: str,
+        prop: str,
+        ids: list[str],
+    ) -> dict[str, list]:
+        async def query() -> dict[str, list]:
+            async with self.driver.session() as session:
+                result = await session.run(bounded_query(f"""
+                    MATCH (:Person {{id: $owner}})-[:{PERSON_RELATIONS[source]}]->(n:{source})
+                    WHERE n.id IN $ids
+                    MATCH (n)-[:{rel_type}]->(t:{target})
+                    RETURN n.id AS id, collect(DISTINCT t.{prop}) AS related
+                """), owner=self.owner, ids=ids)
+                records = [r async for r in result]
+            return {r["id"]: r["related"] for r in records}
+
+        return await self._graph(f"{source}-{rel_type}-{target}.{prop}", ids, query)
+
+    async def _graph(self, namespace: str, ids: list[str], query: Callable[[], Awaitable[dict]]) -> dict:
+        # Repli cloisonné par profil : un profil ne voit jamais les liens d'un autre.
+        result, degraded = await call_graph(f"{self.owner}:{namespace}", query)
+        if degraded:
+            self.degraded = True
+            return {key: result[key] for key in ids if key in result}
+        return result
@@ -39,8 +39,12 @@ class MongoRepository:
     # 2. Projets
     # ---------------------------------------------------------
     async def get_projects(self) -> List[dict]:
-        """Récupère tous les projets, triés par date de début (récent en premier)."""
-        cursor = self.col_projects.find().sort("date début", -1)
+        """Récupère tous les projets, triés par date de début (récent en premier).
+
+        `date_debut` est une date BSON native (seed canonique) : tri chronologique
+        réel, et non lexicographique sur des chaînes.
+        """
+        cursor = self.col_projects.find().sort("date_debut", -1)
         projects = []
         async for doc in cursor:
             projects.append(self._format_doc(doc))
@@ -0,0 +1,268 @@
+"""Autocomplétion des compétences et technologies — index en mémoire par profil.
+
+Chaque profil a son index, construit une fois depuis le snapshot partagé ou
+MongoDB puis interrogé sans aucun accès base :
+- normalisation : accents et casse supprimés, ponctuation → espace
+  (« React.js » → `react js`, clé compacte `reactjs`) ;
+- arbre de préfixes (trie) sur le nom complet, la clé compacte, chaque mot
+  du nom et la catégorie ;
+- index de trigrammes sur les noms pour les fautes de frappe : seuls les
+  `TYPO_CANDIDATES` candidats partageant le plus de trigrammes avec la
+  saisie sont comparés par distance d'édition bornée.
+Classement : préfixe du nom > préfixe d'un mot du nom > préfixe de la
+catégorie > faute de frappe (par distance), puis noms courts d'abord.
+La recherche des fautes de frappe est sautée quand les préfixes remplissent
+déjà la page : elles ne pourraient pas y figurer.
+
+L'index est construit dans un thread (hors boucle asyncio) et reconstruit
+en tâche de fond quand le snapshot change de génération ou qu'il a plus de
+`suggest_refresh_s` secondes ; l'ancien reste servi pendant la reconstruction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import logging
+import re
+import time
+import unicodedata
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from backend.core.config import get_settings
+from backend.core.singleflight import get_single_flight
+from backend.core.snapshot import get_snapshot
+
+logger = logging.getLogger("backend")
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Rangs de correspondance (le plus petit d'abord).
+NAME_PREFIX, WORD_PREFIX, CATEGORY_PREFIX, TYPO = range(4)
+
+# Candidats aux fautes de frappe comparés par distance d'édition, au plus.
+TYPO_CANDIDATES = 64
+
+
+def fold(text: str) -> str:
+    """Minuscules sans accents, ponctuation remplacée par des espaces."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _NON_ALNUM.sub(" ", stripped.casefold()).strip()
+
+
+def bounded_distance(a: str, b: str, limit: int) -> Optional[int]:
+    """Distance de Levenshtein si elle est ≤ `limit`, sinon None (calcul limité à la bande diagonale)."""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i] + [limit + 1] * len(b)
+        row_min = i
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            # Comparaisons en ligne plutôt que `min()` : boucle la plus chaude de l'autocomplétion.
+            cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if previous[j - 1] + (ca != b[j - 1]) < cost:
+                cost = previous[j - 1] + (ca != b[j - 1])
+            current[j] = cost
+            if cost < row_min:
+                row_min = cost
+        if row_min > limit:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+def max_typos(length: int) -> int:
+    return 0 if length < 3 else 1 if length <= 5 else 2
+
+
+def _trigrams(key: str) -> set[str]:
+    padded = f"  {key}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class SuggestEntry:
+    id: str
+    nom: str
+    type: str
+    category: str = ""
+
+
+class _Node:
+    __slots__ = ("children", "ranks")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.ranks: dict[int, int] = {}  # entrée → meilleur rang des clés passant par ce nœud
+
+
+class SuggestIndex:
+    def __init__(self, entries: list[SuggestEntry]):
+        self.entries = entries
+        self._root = _Node()
+        self._trigrams: dict[str, set[int]] = {}
+        self._names: list[list[str]] = []  # clés de nom de chaque entrée (pour la distance d'édition)
+        for index, entry in enumerate(entries):
+            name = fold(entry.nom)
+            words = name.split()
+            names = list(dict.fromkeys([name, name.replace(" ", ""), *words]))
+            self._names.append(names)
+            self._insert(name, index, NAME_PREFIX)
+            self._insert(name.replace(" ", ""), index, NAME_PREFIX)
+            for word in words[1:]:
+                self._insert(word, index, WORD_PREFIX)
+            category = fold(entry.category)
+            for key in (category, *category.split()):
+                self._insert(key, index, CATEGORY_PREFIX)
+            for key in names:
+                for gram in _trigrams(key):
+                    self._trigrams.setdefault(gram, set()).add(index)
+
+    def _insert(self, key: str, index: int, rank: int) -> None:
+        if not key:
+            return
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+            if rank < node.ranks.get(index, rank + 1):
+                node.ranks[index] = rank
+
+    def _prefix(self, query: str) -> dict[int, int]:
+        node = self._root
+        for char in query:
+            node = node.children.get(char)
+            if node is None:
+                return {}
+        return node.ranks
+
+    def _typos(self, query: str, exclude: dict[int, int], types: Optional[set[str]]) -> dict[int, int]:
+        """Entrées dont un nom commence par `query` à `max_typos` modifications près → distance."""
+        limit = max_typos(len(query))
+        if limit == 0:
+            return {}
+        grams = _trigrams(query)
+        # Chaque modification détruit au plus 3 trigrammes de la saisie.
+        needed = max(1, len(grams) - 3 * limit)
+        shared = Counter(index for gram in grams for index in self._trigrams.get(gram, ()))
+        candidates = heapq.nlargest(
+            TYPO_CANDIDATES,
+            (
+                (count, -index) for index, count in shared.items()
+                if count >= needed and index not in exclude and self._accepts(index, types)
+            ),
+        )
+        # Les noms partagent souvent leurs préfixes (« python 12 », « python 13 ») : une distance par préfixe.
+        distances: dict[str, Optional[int]] = {}
+        found: dict[int, int] = {}
+        for _count, negative in candidates:
+            index = -negative
+            best: Optional[int] = None
+            for key in self._names[index]:
+                for size in range(max(1, len(query) - limit), min(len(key), len(query) + limit) + 1):
+                    prefix = key[:size]
+                    if prefix not in distances:
+                        distances[prefix] = bounded_distance(query, prefix, limit)
+                    distance = distances[prefix]
+                    if distance is not None and (best is None or distance < best):
+                        best = distance
+            if best is not None:
+                found[index] = best
+        return found
+
+    def _accepts(self, index: int, types: Optional[set[str]]) -> bool:
+        return types is None or self.entries[index].type in types
+
+    def search(self, text: str, types: Optional[set[str]] = None, limit: int = 10) -> list[SuggestEntry]:
+        query = fold(text)
+        if not query:
+            return []
+        matches = {index: (rank, 0) for index, rank in self._prefix(query).items() if self._accepts(index, types)}
+        compact = query.replace(" ", "")
+        if compact != query:
+            for index, rank in self._prefix(compact).items():
+                if self._accepts(index, types):
+                    matches.setdefault(index, (rank, 0))
+        if len(matches) < limit:
+            for index, distance in self._typos(compact, matches, types).items():
+                matches[index] = (TYPO, distance)
+
+        ranked = heapq.nsmallest(
+            limit,
+            (
+                (rank, distance, len(self.entries[index].nom), self.entries[index].nom.casefold(), index)
+                for index, (rank, distance) in matches.items()
+            ),
+        )
+        return [self.entries[row[4]] for row in ranked]
+
+
+# ── Index par profil ───────────────────────────────────────────
+
+def _generation() -> int:
+    snapshot = get_snapshot()
+    return snapshot.generation.value if snapshot is not None else 0
+
+
+class SuggestIndexes:
+    """Index de chaque profil (LRU), reconstruits en arrière-plan quand les données changent."""
+
+    def __init__(self, max_age: float, max_profiles: int = 1024):
+        self.max_age = max_age
+        self.max_profiles = max_profiles
+        self._indexes: OrderedDict[str, tuple[float, int, SuggestIndex]] = OrderedDict()
+        # Reconstructions en cours : référence gardée jusqu'à leur fin (la boucle ne garde qu'une référence faible).
+        self._rebuilds: dict[str, asyncio.Task] = {}
+
+    async def get(self, owner: str, load: Callable[[], Awaitable[list[SuggestEntry]]]) -> SuggestIndex:
+        entry = self._indexes.get(owner)
+        if entry is None:
+            return await self._build(owner, load)
+        built_at, generation, index = entry
+        self._indexes.move_to_end(owner)
+        stale = generation != _generation() or time.monotonic() - built_at > self.max_age
+        if stale and owner not in self._rebuilds:
+            # Contexte vierge : la reconstruction ne dépend pas de la deadline de la requête qui la déclenche.
+            task = asyncio.get_running_loop().create_task(self._build(owner, load), context=contextvars.Context())
+            self._rebuilds[owner] = task
+            task.add_done_callback(lambda task: self._rebuilt(owner, task))
+        return index
+
+    def _rebuilt(self, owner: str, task: asyncio.Task) -> None:
+        self._rebuilds.pop(owner, None)
+        _log_failure(task)
+
+    async def _build(self, owner: str, load: Callable[[], Awaitable[list[SuggestEntry]]]) -> SuggestIndex:
+        async def build() -> SuggestIndex:
+            generation = _generation()
+            entries = await load()
+            index = await asyncio.to_thread(SuggestIndex, entries)
+            self._indexes[owner] = (time.monotonic(), generation, index)
+            self._indexes.move_to_end(owner)
+            while len(self._indexes) > self.max_profiles:
+                self._indexes.popitem(last=False)
+            return index
+
+        # Une seule construction à la fois par profil.
+        return await get_single_flight().do(f"suggest:{owner}", build)
+
+
+def _log_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Reconstruction de l'index de suggestions impossible : %r", task.exception())
+
+
+_indexes: SuggestIndexes | None = None
+
+
+def get_suggest_indexes() -> SuggestIndexes:
+    global _indexes
+    if _indexes is None:
+        _indexes = SuggestIndexes(get_settings().suggest_refresh_s)
+    return _indexes
@@ -0,0 +1,154 @@
+"""Frise chronologique — fusion en flux des collections datées d'un profil.
+
+Expériences, projets, formations et certifications sont lus chacun par un
+curseur trié par date décroissante (index `(owner_id, date, id)`) et limité
+à la taille de la page ; un tas fusionne les têtes de curseurs (k-way merge).
+Une page de N entrées lit au plus N + 1 documents par collection, quelle que
+soit la taille du portfolio.
+
+Pagination par clé : la page suivante est demandée avec `before=date|id`
+(champ `next` de la page), soit les entrées strictement antérieures dans
+l'ordre (date, id) décroissant — stable même si des documents sont ajoutés.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from typing import Any, Optional
+
+from motor.motor_asyncio import AsyncIOMotorCursor, AsyncIOMotorDatabase
+
+from backend.db.mongo import DATE_FIELDS, OWNER_FIELD, bounded
+
+
+@dataclass(frozen=True)
+class TimelineSource:
+    type: str
+    collection: str
+    nom: str
+    organisation: Optional[str] = None
+    end: Optional[str] = None
+    yearly: bool = False  # champ de date = année entière (parcours scolaire)
+
+    @property
+    def field(self) -> str:
+        return DATE_FIELDS[self.collection]
+
+    def to_date(self, value: Any, end: bool = False) -> Optional[date]:
+        if value is None:
+            return None
+        if self.yearly:
+            return date(value, 12, 31) if end else date(value, 1, 1)
+        return value.date() if isinstance(value, datetime) else value
+
+    def query(self, owner: str, before: Optional[tuple[date, str]]) -> dict:
+        """Filtre des entrées antérieures à `before` (toutes celles qui ont une date si None)."""
+        field = self.field
+        if before is None:
+            return {OWNER_FIELD: owner, field: {"$type": "number" if self.yearly else "date"}}
+        day, item_id = before
+        if self.yearly:
+            if (day.month, day.day) != (1, 1):
+                # Le 1er janvier de l'année de `day` est strictement antérieur.
+                return {OWNER_FIELD: owner, field: {"$lte": day.year}}
+            bound: Any = day.year
+        else:
+            bound = datetime.combine(day, time(), tzinfo=timezone.utc)  # dates stockées à minuit UTC
+        return {
+            OWNER_FIELD: owner,
+            "$or": [{field: {"$lt": bound}}, {field: bound, "id": {"$lt": item_id}}],
+        }
+
+    def projection(self) -> dict[str, int]:
+        fields = ["id", self.field, self.nom, "description", self.organisation, self.end]
+        return {"_id": 0, **{f: 1 for f in fields if f is not None}}
+
+    def to_item(self, doc: dict) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "id": doc["id"],
+            "date": self.to_date(doc[self.field]),
+            "end_date": self.to_date(doc.get(self.end), end=True) if self.end else None,
+            "nom": doc.get(self.nom) or "",
+            "organisation": (doc.get(self.organisation) or "") if self.organisation else "",
+            "description": doc.get("description", ""),
+        }
+
+
+SOURCES = (
+    TimelineSource("experience", "experiences", "nom", "company", "date_fin"),
+    TimelineSource("project", "projects", "nom", "entreprise", "date_fin"),
+    TimelineSource("education", "educations", "degree", "school_name", "end_year", yearly=True),
+    TimelineSource("certification", "certifications", "nom"),
+)
+
+
+def format_cursor(item: dict[str, Any]) -> str:
+    return f"{item['date'].isoformat()}|{item['id']}"
+
+
+def parse_cursor(value: str) -> tuple[date, str]:
+    """`2024-01-10|<id>` → (date, id) ; ValueError si le format est invalide."""
+    day, sep, item_id = value.partition("|")
+    if not sep or not item_id:
+        raise ValueError(value)
+    return date.fromisoformat(day), item_id
+
+
+class _Head:
+    """Tête d'un curseur dans le tas ; ordre inversé : la plus récente sort en premier."""
+
+    __slots__ = ("source", "cursor", "item")
+
+    def __init__(self, source: TimelineSource, cursor: AsyncIOMotorCursor, doc: dict):
+        self.source = source
+        self.cursor = cursor
+        self.item = source.to_item(doc)
+
+    def __lt__(self, other: _Head) -> bool:
+        return (self.item["date"], self.item["id"]) > (other.item["date"], other.item["id"])
+
+
+async def read_timeline(
+    db: AsyncIOMotorDatabase,
+    owner: str,
+    before: Optional[tuple[date, str]],
+    limit: int,
+) -> dict[str, Any]:
+    """Page de la frise (`TimelinePage`) : au plus `limit` entrées antérieures à `before`."""
+    cursors = [
+        bounded(
+            db[source.collection]
+            .find(source.query(owner, before), source.projection())
+            .sort([(source.field, -1), ("id", -1)])
+            .limit(limit + 1)  # +1 : savoir s'il reste des entrées après la page
+            .batch_size(limit + 1)
+        )
+        for source in SOURCES
+    ]
+    try:
+        firsts = await asyncio.gather(*(anext(cursor, None) for cursor in cursors))
+        heap = [
+            _Head(source, cursor, doc)
+            for source, cursor, doc in zip(SOURCES, cursors, firsts)
+            if doc is not None
+        ]
+        heapq.heapify(heap)
+
+        items: list[dict[str, Any]] = []
+        while heap and len(items) < limit:
+            head = heap[0]
+            items.append(head.item)
+            doc = await anext(head.cursor, None)
+            if doc is None:
+                heapq.heappop(heap)
+            else:
+                heapq.heapreplace(heap, _Head(head.source, head.cursor, doc))
+    finally:
+        for cursor in cursors:
+            await cursor.close()
+
+    return {"items": items, "next": format_cursor(items[-1]) if heap else None}
@@ -0,0 +1,216 @@
+"""Statistiques matérialisées par profil — années et projets par technologie / compétence.
+
+Usage: python -m backend.scripts.analytics [--profile ID ...]   (recalcul après modification des données)
+
+Le seed appelle `refresh_analytics` après l'écriture dans MongoDB. Pour
+chaque profil, un document de la collection `analytics` contient :
+- par technologie / compétence : nombre de projets et d'expériences liés,
+  durée cumulée d'usage (intervalles de dates fusionnés : deux projets
+  simultanés ne comptent pas double), première et dernière utilisation ;
+- la matrice (creuse) des co-occurrences dans un même projet / une même expérience.
+Les liens suivent la règle des relations du graphe créées par le seed
+(`USES_TECHNOLOGY`, `REQUIRES_SKILL`, `APPLIED_SKILL`) : la description
+mentionne le nom. Les noms sont cherchés en un seul passage sur chaque
+description (trie des noms), quel que soit leur nombre.
+La route `/portfolio/analytics` lit ce document tel quel.
+
+Le document reste sous la limite de 16 Mo de MongoDB : seules les
+`analytics_max_items` entrées les plus utilisées et les `analytics_max_pairs`
+co-occurrences les plus fréquentes entre elles sont conservées.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import heapq
+from collections import Counter
+from datetime import date, datetime, timezone
+from itertools import combinations
+from typing import Any, Optional
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+
+from backend.core.config import get_settings
+from backend.db.mongo import ANALYTICS_COLLECTION, OWNER_FIELD, get_mongo_db
+from backend.scripts.ingest import to_bson
+
+DAYS_PER_YEAR = 365.25
+
+_END = ""  # clé des nœuds terminaux du trie (jamais un caractère du texte)
+
+
+def _as_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    return value if isinstance(value, date) else None
+
+
+def merged_days(intervals: list[tuple[date, date]]) -> int:
+    """Nombre de jours couverts par l'union des intervalles `[début, fin)` (tri puis balayage)."""
+    total = 0
+    current: Optional[tuple[date, date]] = None
+    for start, end in sorted(intervals):
+        if current is not None and start <= current[1]:
+            current = (current[0], max(current[1], end))
+            continue
+        if current is not None:
+            total += (current[1] - current[0]).days
+        current = (start, end)
+    if current is not None:
+        total += (current[1] - current[0]).days
+    return total
+
+
+class _NameMatcher:
+    """Trie des noms : tous les noms contenus dans un texte, en un passage (même règle que `nom in texte`)."""
+
+    def __init__(self, names: list[str]):
+        self._root: dict[str, Any] = {}
+        for i, name in enumerate(names):
+            if not name:
+                continue
+            node = self._root
+            for char in name:
+                node = node.setdefault(char, {})
+            node.setdefault(_END, []).append(i)
+
+    def find(self, text: str) -> list[int]:
+        found: set[int] = set()
+        root, size = self._root, len(text)
+        for start in range(size):
+            node = root.get(text[start])
+            pos = start + 1
+            while node is not None:
+                ids = node.get(_END)
+                if ids is not None:
+                    found.update(ids)
+                if pos == size:
+                    break
+                node = node.get(text[pos])
+                pos += 1
+        return sorted(found)
+
+
+class _Usage:
+    __slots__ = ("projects", "experiences", "intervals", "first", "last", "ongoing")
+
+    def __init__(self) -> None:
+        self.projects = 0
+        self.experiences = 0
+        self.intervals: list[tuple[date, date]] = []
+        self.first: Optional[date] = None
+        self.last: Optional[date] = None
+        self.ongoing = False
+
+    def add(self, start: Optional[date], end: Optional[date], today: date) -> None:
+        if start is None:
+            return
+        self.ongoing = self.ongoing or end is None
+        end = end or today
+        if end < start:
+            return
+        self.intervals.append((start, end))
+        self.first = start if self.first is None else min(self.first, start)
+        self.last = end if self.last is None else max(self.last, end)
+
+
+def compute_analytics(
+    projects: list[dict],
+    experiences: list[dict],
+    technologies: list[dict],
+    skills: list[dict],
+    today: Optional[date] = None,
+    max_items: Optional[int] = None,
+    max_pairs: Optional[int] = None,
+) -> dict[str, Any]:
+    """Document `PortfolioAnalytics` d'un profil (documents canoniques en entrée).
+
+    `max_items` / `max_pairs` bornent la taille du document (None : tout garder).
+    """
+    today = today or datetime.now(timezone.utc).date()
+    items = [
+        {"id": t["id"], "nom": t["nom"], "type": "technology", "category": ""} for t in technologies
+    ] + [
+        {"id": s["id"], "nom": s["nom"], "type": "skill", "category": s.get("category", "")} for s in skills
+    ]
+    matcher = _NameMatcher([item["nom"].lower() for item in items])
+    first_skill = len(technologies)
+    usages = [_Usage() for _ in items]
+    pairs: Counter[tuple[int, int]] = Counter()
+
+    def link(doc: dict, first: int) -> list[int]:
+        linked = [i for i in matcher.find(doc.get("description", "").lower()) if i >= first]
+        start, end = _as_date(doc.get("date_debut")), _as_date(doc.get("date_fin"))
+        for i in linked:
+            usages[i].add(start, end, today)
+        pairs.update(combinations(linked, 2))
+        return linked
+
+    for project in projects:  # USES_TECHNOLOGY + REQUIRES_SKILL
+        for i in link(project, 0):
+            usages[i].projects += 1
+    for experience in experiences:  # APPLIED_SKILL
+        for i in link(experience, first_skill):
+            usages[i].experiences += 1
+
+    for item, usage in zip(items, usages):
+        item.update(
+            projects=usage.projects,
+            experiences=usage.experiences,
+            years=round(merged_days(usage.intervals) / DAYS_PER_YEAR, 2),
+            first_used=usage.first,
+            last_used=usage.last,
+            ongoing=usage.ongoing,
+        )
+
+    # Les plus utilisées d'abord (les `max_items` premières) ; la matrice est réindexée selon cet ordre.
+    order = sorted(range(len(items)), key=lambda i: (-items[i]["years"], -items[i]["projects"], items[i]["nom"]))
+    order = order[:max_items]
+    position = {old: new for new, old in enumerate(order)}
+    kept = [
+        (*sorted((position[a], position[b])), count)
+        for (a, b), count in pairs.items()
+        if a in position and b in position
+    ]
+    if max_pairs is not None and len(kept) > max_pairs:
+        kept = heapq.nsmallest(max_pairs, kept, key=lambda entry: (-entry[2], entry[0], entry[1]))
+    return to_bson({
+        "computed_at": datetime.now(timezone.utc),
+        "total_items": len(items),
+        "items": [items[i] for i in order],
+        "cooccurrence": [list(entry) for entry in sorted(kept)],
+    })
+
+
+async def _owned(db: AsyncIOMotorDatabase, collection: str, owner: str, fields: tuple[str, ...]) -> list[dict]:
+    return await db[collection].find({OWNER_FIELD: owner}, {"_id": 0, **{f: 1 for f in fields}}).to_list()
+
+
+async def refresh_analytics(db: AsyncIOMotorDatabase, owners: Optional[list[str]] = None) -> int:
+    """Recalcule et remplace le document d'analytics de chaque profil (tous si `owners` est None)."""
+    settings = get_settings()
+    if owners is None:
+        owners = await db["personal_infos"].distinct("id")
+    for owner in owners:
+        projects, experiences, technologies, skills = await asyncio.gather(
+            _owned(db, "projects", owner, ("description", "date_debut", "date_fin")),
+            _owned(db, "experiences", owner, ("description", "date_debut", "date_fin")),
+            _owned(db, "technologies", owner, ("id", "nom")),
+            _owned(db, "skills", owner, ("id", "nom", "category")),
+        )
+        doc = compute_analytics(
+            projects, experiences, technologies, skills,
+            max_items=settings.analytics_max_items,
+            max_pairs=settings.analytics_max_pairs,
+        )
+        await db[ANALYTICS_COLLECTION].replace_one({OWNER_FIELD: owner}, {**doc, OWNER_FIELD: owner}, upsert=True)
+    return len(owners)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recalcule les statistiques matérialisées des profils.")
+    parser.add_argument("--profile", action="append", dest="profiles", help="Id de profil (défaut : tous)")
+    args = parser.parse_args()
+    count = asyncio.run(refresh_analytics(get_mongo_db(), args.profiles))
+    print(f"[analytics] {count} profil(s) recalculé(s)")
@@ -0,0 +1,122 @@
+"""Benchmark — sérialisation des listes : chemin historique vs TypeAdapter en bloc, puis formats.
+
+Usage: python -m backend.scripts.bench_serialization [--size 1000] [--repeat 50]
+
+Chemin historique : `Model.model_validate` en boucle, puis FastAPI revalide
+et sérialise la liste via `response_model` avant `json.dumps`.
+Chemin en bloc    : `TypeAdapter(list[Model])` valide les documents canoniques
+(tels que stockés par le seed) et les encode directement en octets JSON (`encode_list`).
+Formats : taille et temps d'encodage / décodage de JSON, MessagePack et CBOR
+(`encode_list(..., fmt)`, formats disponibles seulement), décodage côté client
+avec dates natives.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from backend.api.responses import CBOR, JSON, MEDIA_TYPES, MSGPACK, cbor2, encode_list, msgpack
+from backend.models import Certification, Experience, Hobby, ParcoursScolaire, Projet, Skill, Techno
+from backend.scripts.ingest import canonicalize
+
+DATASETS_DIR = Path(__file__).resolve().parents[4] / "datasets"
+
+CASES = {
+    "projets.jsonl": Projet,
+    "experiences.jsonl": Experience,
+    "parcours_scolaire.jsonl": ParcoursScolaire,
+    "certifications.jsonl": Certification,
+    "skills.jsonl": Skill,
+    "hobbies.jsonl": Hobby,
+    "technologies.jsonl": Techno,
+}
+
+
+def _load(filename: str, size: int) -> list[dict]:
+    with open(DATASETS_DIR / filename, encoding="utf-8") as f:
+        base = [json.loads(line) for line in f if line.strip()]
+    return [{**base[i % len(base)], "id": f"{i:08d}"} for i in range(size)]
+
+
+async def _legacy(model, field, docs: list[dict]) -> bytes:
+    items = [model.model_validate(doc) for doc in docs]
+    content = await serialize_response(field=field, response_content=items)
+    return JSONResponse(content).body
+
+
+async def _bulk(model, docs: list[dict], fmt: str = JSON) -> bytes:
+    return encode_list(model, docs, fmt)
+
+
+async def _timed(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def _run(size: int, repeat: int) -> None:
+    print(f"{'collection':<26}{'historique (ms)':>17}{'en bloc (ms)':>14}{'gain':>8}")
+    for filename, model in CASES.items():
+        docs = _load(filename, size)
+        canonical = [canonicalize(model, doc) for doc in docs]
+        field = create_model_field(name="response", type_=list[model], mode="serialization")
+        if json.loads(await _legacy(model, field, docs)) != json.loads(await _bulk(model, canonical)):
+            raise SystemExit(f"[bench] Sorties différentes pour {filename}")
+        legacy = await _timed(lambda: _legacy(model, field, docs), repeat)
+        bulk = await _timed(lambda: _bulk(model, canonical), repeat)
+        print(f"{filename:<26}{legacy:>17.2f}{bulk:>14.2f}{legacy / bulk:>7.1f}x")
+
+
+DECODERS = {
+    JSON: json.loads,
+    MSGPACK: lambda body: msgpack.unpackb(body, timestamp=3),  # timestamps → datetime
+    CBOR: lambda body: cbor2.loads(body),
+}
+
+
+def _decode_timed(decode, body: bytes, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(body)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+async def _run_formats(size: int, repeat: int) -> None:
+    formats = list(MEDIA_TYPES)
+    print(f"\n{'collection':<26}{'format':>9}{'taille (Ko)':>13}{'vs JSON':>9}{'encodage (ms)':>15}{'décodage (ms)':>15}")
+    for filename, model in CASES.items():
+        canonical = [canonicalize(model, doc) for doc in _load(filename, size)]
+        json_size = len(encode_list(model, canonical))
+        for fmt in formats:
+            body = encode_list(model, canonical, fmt)
+            encode = await _timed(lambda: _bulk(model, canonical, fmt), repeat)
+            decode = _decode_timed(DECODERS[fmt], body, repeat)
+            print(
+                f"{filename:<26}{fmt:>9}{len(body) / 1024:>13.1f}{len(body) / json_size:>8.0%}"
+                f"{encode:>15.2f}{decode:>15.2f}"
+            )
+    missing = [fmt for fmt in DECODERS if fmt not in formats]
+    if missing:
+        print(f"[bench] Formats indisponibles : {', '.join(missing)} (pip install 'backend[wire]')")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1000, help="documents par collection")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(_run(args.size, args.repeat))
+    asyncio.run(_run_formats(args.size, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Build des images — variantes optimisées et noms hashés.
+
+Usage: python -m backend.scripts.build_assets
+
+1. Relève toutes les images référencées dans les datasets (`image`, `images`).
+2. Copie chaque fichier trouvé dans `assets_source_dir` sous un nom hashé.
+3. Si Pillow est installé, génère pour les images matricielles des miniatures
+   (`assets_thumbnail_widths`) et des variantes WebP / AVIF.
+4. Écrit `manifest.json`, lu par l'API pour réécrire les URLs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+from pathlib import Path
+
+from backend.core.assets import MANIFEST_NAME, get_assets_dir
+from backend.core.config import get_settings
+
+try:
+    from PIL import Image, features
+except ImportError:  # Pillow est optionnel : sans lui, seules les copies hashées sont produites
+    Image = None
+    features = None
+
+DATASETS_DIR = Path(__file__).resolve().parents[4] / "datasets"
+
+RASTER_SUFFIXES = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".tiff", ".webp"}
+
+
+def referenced_images(datasets_dir: Path = DATASETS_DIR) -> set[str]:
+    """Noms d'images cités dans les champs `image` / `images` des datasets."""
+    names: set[str] = set()
+    for path in sorted(datasets_dir.glob("*.jsonl")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                doc = json.loads(line)
+                if isinstance(doc.get("image"), str):
+                    names.add(doc["image"])
+                names.update(name for name in doc.get("images") or [] if isinstance(name, str))
+    return names
+
+
+def _write_hashed(out_dir: Path, stem: str, suffix: str, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{stem}.{digest}{suffix}"
+    target = out_dir / filename
+    if not target.exists():
+        target.write_bytes(data)
+    return filename
+
+
+def _encode(image, fmt: str) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt.upper(), quality=80)
+    return buffer.getvalue()
+
+
+def _variants(source: Path, out_dir: Path, widths: list[int], formats: list[str]) -> dict[str, str]:
+    """Miniatures + formats modernes ; clés `webp`, `avif`, `160w.webp`..."""
+    formats = [fmt for fmt in formats if features.check(fmt)]
+    variants: dict[str, str] = {}
+    with Image.open(source) as original:
+        original.load()
+        if original.mode not in ("RGB", "RGBA"):
+            original = original.convert("RGBA")
+        for fmt in formats:
+            variants[fmt] = _write_hashed(out_dir, source.stem, f".{fmt}", _encode(original, fmt))
+        for width in widths:
+            if width >= original.width:
+                continue
+            height = round(original.height * width / original.width)
+            thumbnail = original.resize((width, height), Image.Resampling.LANCZOS)
+            for fmt in formats:
+                variants[f"{width}w.{fmt}"] = _write_hashed(
+                    out_dir, f"{source.stem}.{width}w", f".{fmt}", _encode(thumbnail, fmt),
+                )
+    return variants
+
+
+def build(source_dir: Path, out_dir: Path) -> dict[str, dict]:
+    settings = get_settings()
+    prefix = settings.assets_url_prefix.rstrip("/")
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    manifest: dict[str, dict] = {}
+    for name in sorted(referenced_images()):
+        source = source_dir / name
+        if not source.is_file():
+            print(f"[assets] ⚠️  Image référencée mais introuvable : {name}")
+            continue
+
+        filename = _write_hashed(out_dir, source.stem, source.suffix.lower(), source.read_bytes())
+        variants: dict[str, str] = {}
+        if Image is not None and source.suffix.lower() in RASTER_SUFFIXES:
+            variants = _variants(
+                source, out_dir, settings.assets_thumbnail_widths, settings.assets_formats,
+            )
+        manifest[name] = {
+            "url": f"{prefix}/{filename}",
+            "variants": {key: f"{prefix}/{value}" for key, value in variants.items()},
+        }
+
+    with open(out_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def main():
+    settings = get_settings()
+    if Image is None:
+        print("[assets] Pillow absent : copies hashées uniquement (pip install Pillow pour les variantes)")
+    manifest = build(Path(settings.assets_source_dir), get_assets_dir())
+    print(f"[assets] ✅ {len(manifest)} images dans {get_assets_dir() / MANIFEST_NAME}")
+
+
+if __name__ == "__main__":
+    main()
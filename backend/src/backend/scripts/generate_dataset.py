@@ -0,0 +1,311 @@
+"""Générateur de datasets synthétiques — tests de charge de 10^3 à 10^6 documents par collection.
+
+Usage: python -m backend.scripts.generate_dataset --out build/datasets --profiles 10 --records 100000
+
+- mêmes fichiers et mêmes formes que `datasets/*.jsonl` (clés alias comprises :
+  `Nom`, `Contact`, `date début`, `lien github`...), donc lisibles par le seed ;
+- déterministe : même `--seed` et mêmes options → fichiers identiques octet pour octet ;
+- chaque document est rattaché à un profil (`owner_id`), répartis en tourniquet ;
+- les descriptions de projets et d'expériences citent des technologies et
+  compétences du même profil (`--tech-mentions`, `--skill-mentions` : nombre
+  moyen de citations), ce que le seed transforme en relations Neo4j ;
+- écriture en flux, ligne par ligne : mémoire constante quel que soit le volume.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Fichiers générés (hors `infos_personnels.jsonl`, un document par profil).
+COLLECTIONS = (
+    "projets",
+    "experiences",
+    "parcours_scolaire",
+    "certifications",
+    "skills",
+    "hobbies",
+    "technologies",
+)
+
+TECHNOLOGIES = (
+    "Python", "FastAPI", "Django", "Node.js", "React.js", "Vue.js", "TypeScript", "Kafka",
+    "Docker", "Kubernetes", "MongoDB", "Neo4j", "PostgreSQL", "Redis", "Elasticsearch",
+    "TensorFlow", "PyTorch", "Spark", "Airflow", "Terraform", "AWS", "GCP", "Azure",
+    "GraphQL", "RabbitMQ", "Golang", "Rust", "Java", "Spring Boot", "Flutter",
+)
+
+SKILLS = (
+    ("Machine Learning", "Data"), ("Data Engineering", "Data"), ("Data Visualisation", "Data"),
+    ("SQL", "Base de données"), ("Modélisation NoSQL", "Base de données"),
+    ("Architecture microservices", "Architecture"), ("DevOps", "Architecture"),
+    ("Cybersécurité", "Sécurité"), ("Tests automatisés", "Qualité"),
+    ("Gestion de projet Agile", "Management"), ("Encadrement d'équipe", "Management"),
+    ("Développement web", "Développement"), ("Développement mobile", "Développement"),
+    ("Traitement du langage naturel", "Data"), ("Cloud computing", "Architecture"),
+)
+SKILL_NAMES = tuple(name for name, _ in SKILLS)
+
+FIRST_NAMES = ("Thomas", "Camille", "Léa", "Hugo", "Manon", "Lucas", "Chloé", "Nathan", "Inès", "Jules")
+LAST_NAMES = ("Bernard", "Martin", "Dubois", "Lefèvre", "Moreau", "Laurent", "Garnier", "Roux", "Fontaine", "Chevalier")
+COMPANIES = ("TechFlow", "EcoSystems", "Securitas IT", "DataCorp", "StartupIO", "Logistix", "MediCare", "UrbanLab")
+PROJECT_WORDS = (("Alpha", "Green", "Cyber", "Smart", "Cloud", "Data", "Quantum", "Health"),
+                 ("Stream", "Bot", "Shield", "Map", "Guard", "Viz", "Ledger", "Track"))
+PITCHES = (
+    "Plateforme de streaming temps réel",
+    "Outil de détection d'anomalies",
+    "Application de suivi de santé connectée",
+    "Moteur de recommandation e-commerce",
+    "Tableau de bord de données urbaines",
+)
+JOBS = (("Tech Lead Data", "Manager Technique"), ("Développeur Fullstack", "Développeur Senior"),
+        ("Data Scientist", "Data Scientist"), ("Ingénieur DevOps", "SRE"), ("Stagiaire Backend", "Stagiaire"))
+SCHOOLS = ("Université de Technologie de Compiègne", "INSA Lyon", "Université Paris-Saclay", "Lycée Henri IV")
+DEGREES = ("Diplôme d'Ingénieur", "Master Informatique", "Licence Informatique", "Baccalauréat Scientifique")
+GRADES = ("Mention Bien", "Mention Très Bien", "Mention Assez Bien", "Validé")
+CERTIFICATIONS = ("AWS Certified Solutions Architect", "Google Professional Data Engineer",
+                  "Certified Kubernetes Administrator", "Azure Fundamentals (AZ-900)", "MongoDB Developer")
+HOBBIES = ("Escalade de bloc", "Piano", "Échecs", "Course à pied", "Photographie", "Cuisine", "Randonnée")
+
+START = date(2010, 1, 1)
+
+
+class Generator:
+    def __init__(
+        self,
+        seed: int,
+        profiles: int,
+        counts: dict[str, int],
+        tech_mentions: float,
+        skill_mentions: float,
+    ):
+        self.seed = seed
+        self.profiles = profiles
+        self.counts = counts
+        self.tech_mentions = tech_mentions
+        self.skill_mentions = skill_mentions
+
+    # ── Identifiants et noms déterministes (sans état) ─────────
+
+    def uid(self, kind: str, index: int) -> str:
+        digest = hashlib.sha256(f"{self.seed}:{kind}:{index}".encode()).digest()
+        return str(uuid.UUID(bytes=digest[:16], version=4))
+
+    def owner(self, index: int) -> tuple[str, int]:
+        """Profil du document `index` (tourniquet) et son rang parmi les documents de ce profil."""
+        return self.uid("person", index % self.profiles), index // self.profiles
+
+    def owned_count(self, collection: str, profile: int) -> int:
+        total = self.counts[collection]
+        return total // self.profiles + (1 if profile < total % self.profiles else 0)
+
+    @staticmethod
+    def _numbered(names: tuple, rank: int) -> str:
+        base = names[rank % len(names)]
+        return base if rank < len(names) else f"{base} {rank // len(names) + 1}"
+
+    def technology_name(self, rank: int) -> str:
+        return self._numbered(TECHNOLOGIES, rank)
+
+    def skill_name(self, rank: int) -> str:
+        return self._numbered(SKILL_NAMES, rank)
+
+    # ── Descriptions avec citations ────────────────────────────
+
+    def _mentions(self, rng: random.Random, collection: str, profile: int, mean: float,
+                  name: Callable[[int], str]) -> list[str]:
+        available = self.owned_count(collection, profile)
+        k = min(available, rng.randint(0, round(2 * mean)))
+        return [name(rank) for rank in rng.sample(range(available), k)]
+
+    def _description(self, rng: random.Random, pitch: str, profile: int) -> str:
+        cited = (
+            self._mentions(rng, "technologies", profile, self.tech_mentions, self.technology_name)
+            + self._mentions(rng, "skills", profile, self.skill_mentions, self.skill_name)
+        )
+        if not cited:
+            return f"{pitch}."
+        if len(cited) == 1:
+            return f"{pitch} avec {cited[0]}."
+        return f"{pitch} avec {', '.join(cited[:-1])} et {cited[-1]}."
+
+    @staticmethod
+    def _period(rng: random.Random, max_days: int) -> tuple[date, date | None]:
+        start = START + timedelta(days=rng.randrange(5000))
+        if rng.random() < 0.2:
+            return start, None
+        return start, start + timedelta(days=rng.randint(30, max_days))
+
+    # ── Documents ──────────────────────────────────────────────
+
+    def personal_infos(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.profiles):
+            prenom, nom = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            slug = f"{prenom[0]}{nom}".lower()
+            yield {
+                "id": self.uid("person", i),
+                "Nom": nom,
+                "Prenom": prenom,
+                "Contact": {
+                    "liens linkedin": f"https://www.linkedin.com/in/{slug}-{i}",
+                    "numéro de téléphone": f"+33 6 {rng.randrange(10**8):08d}",
+                    "Adresse mail": f"{slug}.{i}@example.com",
+                },
+                "Description": f"{rng.choice(JOBS)[0]} spécialisé en {rng.choice(SKILLS)[0]}.",
+            }
+
+    def projets(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["projets"]):
+            owner, rank = self.owner(i)
+            start, end = self._period(rng, 400)
+            nom = f"{rng.choice(PROJECT_WORDS[0])} {rng.choice(PROJECT_WORDS[1])} {rank + 1}"
+            slug = nom.lower().replace(" ", "-")
+            yield {
+                "id": self.uid("projets", i),
+                "owner_id": owner,
+                "nom": nom,
+                "date début": start.isoformat(),
+                "date fin": end.isoformat() if end else None,
+                "description": self._description(rng, rng.choice(PITCHES), i % self.profiles),
+                "images": [f"{slug}-{n}.png" for n in range(rng.randint(0, 3))],
+                "entreprise": rng.choice(COMPANIES),
+                "collaborateurs": rng.sample(FIRST_NAMES, rng.randint(0, 3)),
+                "lien github": f"https://github.com/example/{slug}",
+                "status": "Terminé" if end else "En cours",
+            }
+
+    def experiences(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["experiences"]):
+            owner, _ = self.owner(i)
+            start, end = self._period(rng, 1500)
+            nom, role = rng.choice(JOBS)
+            company = rng.choice(COMPANIES)
+            yield {
+                "id": self.uid("experiences", i),
+                "owner_id": owner,
+                "nom": nom,
+                "description": self._description(rng, f"Poste chez {company}", i % self.profiles),
+                "image": f"logo_{company.lower().replace(' ', '_')}.png",
+                "company": company,
+                "type_de_poste": rng.choice(("CDI", "CDD", "Stage", "Freelance")),
+                "date_debut": start.isoformat(),
+                "date_fin": end.isoformat() if end else None,
+                "role": role,
+            }
+
+    def parcours_scolaire(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["parcours_scolaire"]):
+            owner, _ = self.owner(i)
+            start = rng.randint(2000, 2022)
+            yield {
+                "id": self.uid("parcours_scolaire", i),
+                "owner_id": owner,
+                "school_name": rng.choice(SCHOOLS),
+                "degree": rng.choice(DEGREES),
+                "description": f"Formation en {rng.choice(SKILLS)[0]}.",
+                "start_year": start,
+                "end_year": start + rng.randint(1, 5),
+                "grade": rng.choice(GRADES),
+            }
+
+    def certifications(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["certifications"]):
+            owner, _ = self.owner(i)
+            nom = rng.choice(CERTIFICATIONS)
+            yield {
+                "id": self.uid("certifications", i),
+                "owner_id": owner,
+                "nom": nom,
+                "image": f"{nom.split()[0].lower()}.png",
+                "description": f"Validation des compétences {rng.choice(SKILLS)[0]}.",
+                "obtention_date": (START + timedelta(days=rng.randrange(5000))).isoformat(),
+            }
+
+    def skills(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["skills"]):
+            owner, rank = self.owner(i)
+            yield {
+                "id": self.uid("skills", i),
+                "owner_id": owner,
+                "nom": self.skill_name(rank),
+                "category": SKILLS[rank % len(SKILLS)][1],
+                "description": f"Pratique de {rng.randint(1, 10)} ans.",
+            }
+
+    def hobbies(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["hobbies"]):
+            owner, _ = self.owner(i)
+            yield {
+                "id": self.uid("hobbies", i),
+                "owner_id": owner,
+                "nom": rng.choice(HOBBIES),
+                "description": f"Pratique hebdomadaire depuis {rng.randint(1, 15)} ans.",
+            }
+
+    def technologies(self, rng: random.Random) -> Iterator[dict]:
+        for i in range(self.counts["technologies"]):
+            owner, rank = self.owner(i)
+            nom = self.technology_name(rank)
+            yield {
+                "id": self.uid("technologies", i),
+                "owner_id": owner,
+                "nom": nom,
+                "image": f"icon_{nom.lower().replace(' ', '_').replace('.', '')}.png",
+            }
+
+    def write(self, out_dir: Path) -> dict[str, int]:
+        """Écrit les fichiers JSONL (une collection à la fois, document par document)."""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        files = {"infos_personnels": self.personal_infos, **{name: getattr(self, name) for name in COLLECTIONS}}
+        written: dict[str, int] = {}
+        for name, documents in files.items():
+            # Un générateur aléatoire par fichier : ajouter une collection ne change pas les autres.
+            rng = random.Random(f"{self.seed}:{name}")
+            count = 0
+            with open(out_dir / f"{name}.jsonl", "w", encoding="utf-8") as f:
+                for doc in documents(rng):
+                    f.write(json.dumps(doc, ensure_ascii=False))
+                    f.write("\n")
+                    count += 1
+            written[name] = count
+        return written
+
+
+def _parse_count(value: str) -> tuple[str, int]:
+    name, _, count = value.partition("=")
+    if name not in COLLECTIONS or not count.isdigit():
+        raise argparse.ArgumentTypeError(f"attendu COLLECTION=N avec COLLECTION parmi {', '.join(COLLECTIONS)}")
+    return name, int(count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Génère des datasets JSONL synthétiques et déterministes.")
+    parser.add_argument("--out", type=Path, default=Path("build/datasets"), help="Dossier de sortie")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--profiles", type=int, default=1, help="Nombre de profils (Person)")
+    parser.add_argument("--records", type=int, default=1000, help="Documents par collection (tous profils confondus)")
+    parser.add_argument("--count", type=_parse_count, action="append", default=[], metavar="COLLECTION=N",
+                        help="Volume d'une collection, prioritaire sur --records (répétable)")
+    parser.add_argument("--tech-mentions", type=float, default=2.0,
+                        help="Nombre moyen de technologies citées par description")
+    parser.add_argument("--skill-mentions", type=float, default=1.0,
+                        help="Nombre moyen de compétences citées par description")
+    args = parser.parse_args()
+    if args.profiles < 1:
+        parser.error("--profiles doit être ≥ 1")
+
+    counts = {name: args.records for name in COLLECTIONS}
+    counts.update(dict(args.count))
+    generator = Generator(args.seed, args.profiles, counts, args.tech_mentions, args.skill_mentions)
+    for name, count in generator.write(args.out).items():
+        print(f"[dataset] ✅ {count} documents dans {args.out / f'{name}.jsonl'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""Ingestion des datasets — validation en parallèle et documents canoniques (utilisé par le seed).
+
+Chaque ligne JSONL est validée contre le modèle `shared.schemas` de sa
+collection, par lots de lignes répartis sur un pool de processus. Les lignes
+invalides sont signalées avec leur fichier et leur numéro de ligne.
+
+Les résultats sont produits lot par lot (`ingest_batches`), au fil de la
+validation : au plus `window` lots sont en cours à la fois, la mémoire ne
+dépend donc pas de la taille des fichiers.
+
+Les documents produits sont canoniques :
+- noms de champs du modèle (`nom`, `contact.telephone`, `date_debut`,
+  `lien_github`...) au lieu des clés alias des fichiers (`Nom`, `date début`...) ;
+- dates converties en `datetime` (minuit UTC), stockées en dates BSON natives ;
+- valeurs par défaut du modèle appliquées aux champs absents.
+L'API n'a plus ni alias à résoudre ni dates à parser à la lecture.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time, timezone
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from backend.db.mongo import OWNER_FIELD
+from backend.models import (
+    Certification,
+    Experience,
+    Hobby,
+    ParcoursScolaire,
+    PersonalInfo,
+    Projet,
+    Skill,
+    Techno,
+)
+
+PERSONS_FILE = "infos_personnels.jsonl"
+
+# Modèle de validation de chaque fichier du dossier datasets.
+DATASET_MODELS: dict[str, type[BaseModel]] = {
+    PERSONS_FILE: PersonalInfo,
+    "projets.jsonl": Projet,
+    "experiences.jsonl": Experience,
+    "parcours_scolaire.jsonl": ParcoursScolaire,
+    "certifications.jsonl": Certification,
+    "skills.jsonl": Skill,
+    "hobbies.jsonl": Hobby,
+    "technologies.jsonl": Techno,
+}
+
+CHUNK_LINES = 5000
+
+
+@dataclass(frozen=True)
+class LineError:
+    path: str
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.line}: {self.message}"
+
+
+@dataclass(frozen=True)
+class Batch:
+    """Documents canoniques et erreurs d'un lot de lignes d'un fichier."""
+
+    filename: str
+    docs: list[dict]
+    errors: list[LineError]
+
+
+def to_bson(value: Any) -> Any:
+    """`date` → `datetime` à minuit UTC (BSON n'a pas de type date seule), récursivement."""
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime.combine(value, time(), tzinfo=timezone.utc)
+    if isinstance(value, dict):
+        return {k: to_bson(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [to_bson(v) for v in value]
+    return value
+
+
+def canonicalize(model: type[BaseModel], raw: dict) -> dict:
+    """Valide `raw` (clés alias ou noms de champs) et retourne le document canonique."""
+    return to_bson(model.model_validate(raw).model_dump())
+
+
+def _format_validation_error(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or '(document)'} : {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+def _created_at(raw: dict, now: datetime) -> datetime:
+    value = raw.get("created_at")
+    if isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return now
+
+
+def validate_chunk(
+    filename: str,
+    path: str,
+    first_line: int,
+    lines: list[str],
+    default_owner: Optional[str],
+) -> tuple[list[dict], list[LineError]]:
+    """Valide un lot de lignes (exécuté dans un processus du pool)."""
+    model = DATASET_MODELS[filename]
+    now = datetime.now(timezone.utc)
+    docs: list[dict] = []
+    errors: list[LineError] = []
+    for lineno, text in enumerate(lines, start=first_line):
+        if not text.strip():
+            continue
+        try:
+            raw = json.loads(text)
+        except json.JSONDecodeError as exc:
+            errors.append(LineError(path, lineno, f"JSON invalide : {exc.msg}"))
+            continue
+        if not isinstance(raw, dict):
+            errors.append(LineError(path, lineno, "objet JSON attendu"))
+            continue
+        try:
+            doc = canonicalize(model, raw)
+            doc["created_at"] = _created_at(raw, now)
+        except ValidationError as exc:
+            errors.append(LineError(path, lineno, _format_validation_error(exc)))
+            continue
+        except ValueError as exc:
+            errors.append(LineError(path, lineno, f"created_at : {exc}"))
+            continue
+
+        # Un profil est son propre propriétaire ; sinon `owner_id` du fichier ou profil par défaut.
+        owner = doc["id"] if filename == PERSONS_FILE else raw.get(OWNER_FIELD) or default_owner
+        if owner is None:
+            errors.append(LineError(path, lineno, f"{OWNER_FIELD} manquant et aucun profil par défaut"))
+            continue
+        doc[OWNER_FIELD] = owner
+        docs.append(doc)
+    return docs, errors
+
+
+def _chunks(path: Path, size: int) -> Iterator[tuple[int, list[str]]]:
+    """Découpe un fichier en lots de `size` lignes : (numéro de la première ligne, lignes)."""
+    with open(path, encoding="utf-8") as f:
+        chunk: list[str] = []
+        first = 1
+        for lineno, line in enumerate(f, start=1):
+            chunk.append(line)
+            if len(chunk) == size:
+                yield first, chunk
+                chunk, first = [], lineno + 1
+        if chunk:
+            yield first, chunk
+
+
+def _tasks(files: dict[str, Path], chunk_lines: int) -> Iterator[tuple[str, Path, int, list[str]]]:
+    for name, path in files.items():
+        for first, lines in _chunks(path, chunk_lines):
+            yield name, path, first, lines
+
+
+def _stream(
+    pool: Executor,
+    tasks: Iterable[tuple[str, Path, int, list[str]]],
+    default_owner: Optional[str],
+    window: int,
+) -> Iterator[Batch]:
+    """Soumet les lots au fil de l'eau, `window` au plus en attente ; résultats dans l'ordre des lignes."""
+    pending: deque[tuple[str, Future]] = deque()
+    for name, path, first, lines in tasks:
+        pending.append((name, pool.submit(validate_chunk, name, str(path), first, lines, default_owner)))
+        if len(pending) >= window:
+            name, future = pending.popleft()
+            yield Batch(name, *future.result())
+    while pending:
+        name, future = pending.popleft()
+        yield Batch(name, *future.result())
+
+
+def dataset_files(datasets_dir: Path) -> dict[str, Path]:
+    """Fichiers de datasets présents dans le dossier (les absents sont signalés)."""
+    existing = {name: datasets_dir / name for name in DATASET_MODELS if (datasets_dir / name).exists()}
+    for name in DATASET_MODELS.keys() - existing.keys():
+        print(f"[seed] ⚠️  Fichier ignoré (introuvable) : {name}")
+    return existing
+
+
+def ingest_batches(
+    files: dict[str, Path],
+    workers: Optional[int] = None,
+    chunk_lines: int = CHUNK_LINES,
+    window: Optional[int] = None,
+) -> Iterator[Batch]:
+    """Valide les datasets en parallèle et produit les résultats lot par lot.
+
+    Les profils sont validés d'abord : le premier sert de propriétaire par
+    défaut aux documents sans `owner_id`. Les lots des autres fichiers
+    partagent ensuite le même pool. Au plus `window` lots (défaut : 2 par
+    processus) sont soumis sans que leur résultat ait été consommé.
+    """
+    workers = workers or os.cpu_count() or 1
+    window = window or 2 * workers
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        default_owner = None
+        if PERSONS_FILE in files:
+            persons = {PERSONS_FILE: files[PERSONS_FILE]}
+            for batch in _stream(pool, _tasks(persons, chunk_lines), None, window):
+                if default_owner is None and batch.docs:
+                    default_owner = batch.docs[0]["id"]
+                yield batch
+
+        others = {name: path for name, path in files.items() if name != PERSONS_FILE}
+        yield from _stream(pool, _tasks(others, chunk_lines), default_owner, window)
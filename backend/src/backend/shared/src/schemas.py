@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -119,6 +119,58 @@ class Hobby(BaseModel):
     description: str = ""
 
 
+# ── Analytics ──────────────────────────────────────────────────
+
+class AnalyticsItem(BaseModel):
+    """Usage d'une technologie ou d'une compétence, déduit des projets et expériences datés."""
+    id: str
+    nom: str
+    type: Literal["technology", "skill"]
+    category: str = ""
+    projects: int = 0
+    experiences: int = 0
+    years: float = 0.0  # durée cumulée des périodes d'usage, chevauchements fusionnés
+    first_used: Optional[date] = None
+    last_used: Optional[date] = None
+    ongoing: bool = False  # utilisée dans un projet / une expérience en cours
+
+
+class PortfolioAnalytics(BaseModel):
+    """Vue matérialisée par profil (recalculée au seed)."""
+    computed_at: datetime
+    total_items: int = 0  # technologies + compétences du profil ; `items` ne garde que les plus utilisées
+    items: list[AnalyticsItem] = []
+    # Co-occurrences (matrice creuse) : [i, j, n] — items[i] et items[j] liés à n projets / expériences communs
+    cooccurrence: list[tuple[int, int, int]] = []
+
+
+# ── Timeline ───────────────────────────────────────────────────
+
+class TimelineItem(BaseModel):
+    """Entrée de la frise chronologique (expérience, projet, formation ou certification)."""
+    type: Literal["experience", "project", "education", "certification"]
+    id: str
+    date: date  # début / obtention ; 1er janvier de `start_year` pour une formation
+    end_date: Optional[date] = None
+    nom: str = ""
+    organisation: str = ""
+    description: str = ""
+
+
+class TimelinePage(BaseModel):
+    items: list[TimelineItem] = []
+    next: Optional[str] = None  # curseur `date|id` de la page suivante (None : fin de la frise)
+
+
+# ── Suggestions ────────────────────────────────────────────────
+
+class Suggestion(BaseModel):
+    id: str
+    nom: str
+    type: Literal["technology", "skill"]
+    category: str = ""
+
+
 # ── Cities (legacy) ────────────────────────────────────────────
 
 class City(BaseModel):
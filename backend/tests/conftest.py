@@ -0,0 +1,16 @@
+"""Fixtures partagées des tests du backend."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from backend.app import app
+
+
+@pytest.fixture
+async def client():
+    """Client HTTP branché directement sur l'application ASGI (sans serveur)."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as http:
+        yield http
+    app.dependency_overrides.clear()
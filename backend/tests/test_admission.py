@@ -0,0 +1,167 @@
+"""Contrôle d'admission — `RouteLimiter` et `TokenBucket`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from backend.core import admission
+from backend.core.admission import UNMATCHED, AdmissionMiddleware, RouteLimiter, TokenBucket
+from backend.core.config import Settings
+
+
+def _limiter(limit: int = 1, **overrides) -> RouteLimiter:
+    settings = Settings(**{
+        "admission_max_queue": 2,
+        "admission_max_queue_ms": 50,
+        "admission_target_queue_ms": 20,
+        "admission_shed_interval_ms": 500,
+        **overrides,
+    })
+    return RouteLimiter(limit, settings)
+
+
+# ── RouteLimiter ───────────────────────────────────────────────
+
+async def test_limit_then_fifo_handoff():
+    limiter = _limiter(limit=2)
+    assert await limiter.acquire()
+    assert await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not first.done() and not second.done()
+
+    limiter.release()
+    assert await first
+    assert not second.done()
+    limiter.release()
+    assert await second
+    assert limiter.active == 2
+
+    limiter.release()
+    limiter.release()
+    assert limiter.active == 0
+
+
+async def test_full_queue_is_rejected():
+    limiter = _limiter(admission_max_queue=1)
+    assert await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not await limiter.acquire()
+    limiter.release()
+    assert await waiting
+
+
+async def test_wait_times_out():
+    limiter = _limiter()
+    assert await limiter.acquire()
+    assert not await limiter.acquire()
+    limiter.release()
+    assert limiter.active == 0
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    limiter = _limiter()
+    assert await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    limiter.release()
+    assert limiter.active == 0
+
+
+async def test_slot_handed_over_as_the_wait_times_out():
+    limiter = _limiter()
+    assert await limiter.acquire()
+    waiting = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    time.sleep(0.1)  # la boucle est bloquée au-delà du délai d'attente
+    await asyncio.sleep(0)  # le timeout du client est planifié juste après ce tour
+    limiter.release()  # … mais le créneau lui est transmis avant qu'il ne s'exécute
+    acquired = await waiting
+    # Refusé ou admis, aucun créneau ne doit être perdu.
+    assert limiter.active == (1 if acquired else 0)
+
+
+async def test_sheds_after_persistent_queueing():
+    limiter = _limiter(admission_max_queue_ms=1000, admission_shed_interval_ms=0)
+    assert await limiter.acquire()
+    for _ in range(2):
+        waiting = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.03)  # au-dessus de la cible de 20 ms
+        limiter.release()
+        assert await waiting
+    assert limiter.shedding
+    assert not await limiter.acquire()  # refusé sans attendre
+
+
+# ── TokenBucket ────────────────────────────────────────────────
+
+def test_bucket_burst_then_wait():
+    bucket = TokenBucket(rate=10, burst=3)
+    assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait = bucket.take()
+    assert 0 < wait <= 0.1
+
+
+def test_bucket_refills_up_to_burst():
+    bucket = TokenBucket(rate=10, burst=3)
+    for _ in range(3):
+        bucket.take()
+    bucket.updated -= 10  # 10 s écoulées : 100 jetons, plafonnés au burst
+    assert [bucket.take() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.take() > 0
+
+
+# ── Middleware ─────────────────────────────────────────────────
+
+async def test_assets_skip_the_client_bucket(monkeypatch):
+    settings = Settings(admission_client_rate=0.001, admission_client_burst=1)
+    monkeypatch.setattr(admission, "get_settings", lambda: settings)
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware)
+
+    @app.get("/assets/{name}")
+    async def asset(name: str):
+        return name
+
+    @app.get("/portfolio")
+    async def portfolio():
+        return "ok"
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(5):
+            assert (await client.get("/assets/photo.webp")).status_code == 200
+        assert (await client.get("/portfolio")).status_code == 200
+        assert (await client.get("/portfolio")).status_code == 429
+
+
+async def test_unknown_paths_share_one_limiter(monkeypatch):
+    settings = Settings()
+    monkeypatch.setattr(admission, "get_settings", lambda: settings)
+    app = FastAPI()
+    app.add_middleware(AdmissionMiddleware)
+
+    @app.get("/portfolio/skills/{skill_id}")
+    async def skill(skill_id: str):
+        return skill_id
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for i in range(20):
+            assert (await client.get(f"/x/{i}")).status_code == 404
+            assert (await client.get(f"/portfolio/skills/{i}")).status_code == 200
+
+    middleware = app.middleware_stack
+    while not isinstance(middleware, AdmissionMiddleware):
+        middleware = middleware.app
+    assert set(middleware._limiters) == {UNMATCHED, "/portfolio/skills/{skill_id}"}
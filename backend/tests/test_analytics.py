@@ -0,0 +1,69 @@
+"""Statistiques matérialisées — fusion des périodes et calcul du document par profil."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from backend.scripts.analytics import compute_analytics, merged_days
+
+TODAY = date(2025, 1, 1)
+
+
+def test_merged_days():
+    assert merged_days([]) == 0
+    assert merged_days([(date(2020, 1, 1), date(2020, 1, 11))]) == 10
+    # Chevauchement et inclusion : la période commune ne compte qu'une fois.
+    assert merged_days([
+        (date(2020, 1, 5), date(2020, 1, 15)),
+        (date(2020, 1, 1), date(2020, 1, 10)),
+        (date(2020, 1, 6), date(2020, 1, 7)),
+    ]) == 14
+    # Périodes disjointes : additionnées.
+    assert merged_days([(date(2020, 1, 1), date(2020, 1, 3)), (date(2020, 2, 1), date(2020, 2, 4))]) == 5
+
+
+def _project(description: str, start: date, end: date | None = None) -> dict:
+    return {"description": description, "date_debut": start, "date_fin": end}
+
+
+TECHNOLOGIES = [{"id": "t1", "nom": "Java"}, {"id": "t2", "nom": "Docker"}, {"id": "t3", "nom": "Rust"}]
+SKILLS = [{"id": "s1", "nom": "SQL", "category": "Base de données"}]
+
+
+def test_compute_analytics():
+    projects = [
+        _project("API JavaScript sous docker", date(2020, 1, 1), date(2021, 1, 1)),
+        _project("Entrepôt SQL et Docker", date(2020, 7, 1), date(2022, 1, 1)),
+    ]
+    experiences = [_project("Java, SQL et Docker au quotidien", date(2023, 1, 1))]
+    doc = compute_analytics(projects, experiences, TECHNOLOGIES, SKILLS, today=TODAY)
+
+    items = {item["id"]: item for item in doc["items"]}
+    assert doc["total_items"] == 4
+    # Même règle que le graphe : le nom est contenu dans la description (« Java » dans « JavaScript »).
+    assert items["t1"]["projects"] == 1
+    # Les expériences ne sont liées qu'aux compétences.
+    assert (items["t2"]["projects"], items["t2"]["experiences"]) == (2, 0)
+    assert (items["s1"]["projects"], items["s1"]["experiences"]) == (1, 1)
+    assert items["t2"]["years"] == round(731 / 365.25, 2)  # 2020-01-01 → 2022-01-01, chevauchement fusionné
+    assert items["s1"]["ongoing"] and items["s1"]["last_used"].date() == TODAY
+    assert items["t3"]["projects"] == 0 and items["t3"]["first_used"] is None
+
+    ids = [item["id"] for item in doc["items"]]
+    assert ids == ["s1", "t2", "t1", "t3"]  # les plus utilisées d'abord (expérience en cours comprise)
+    pairs = {(ids[i], ids[j]): n for i, j, n in doc["cooccurrence"]}
+    assert pairs == {("s1", "t2"): 1, ("t2", "t1"): 1}
+
+
+def test_compute_analytics_is_bounded():
+    technologies = [{"id": f"t{i}", "nom": f"tech{i:03d}"} for i in range(100)]
+    projects = [
+        _project(" ".join(f"tech{j:03d}" for j in range(i, i + 5)), date(2020, 1, 1), date(2020, 1, 1 + i % 28))
+        for i in range(95)
+    ]
+    doc = compute_analytics(projects, [], technologies, [], today=TODAY, max_items=10, max_pairs=7)
+    assert doc["total_items"] == 100
+    assert len(doc["items"]) == 10
+    assert len(doc["cooccurrence"]) == 7
+    assert all(i < 10 and j < 10 for i, j, _ in doc["cooccurrence"])
+    assert doc["cooccurrence"] == sorted(doc["cooccurrence"])
@@ -0,0 +1,47 @@
+"""Deadlines de requête et single-flight."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+from fastapi import FastAPI, Request
+
+from backend.core.deadline import DeadlineExceeded, DeadlineMiddleware, deadline_response, remaining
+from backend.core.singleflight import coalesce
+
+
+def _app(seen: list[float]) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(DeadlineMiddleware)
+
+    @app.exception_handler(DeadlineExceeded)
+    async def on_deadline(request: Request, exc: DeadlineExceeded):
+        return deadline_response()
+
+    async def compute() -> dict:
+        seen.append(remaining())
+        await asyncio.sleep(0.2)
+        return {"ok": True}
+
+    @app.get("/slow")
+    async def slow(request: Request):
+        return await coalesce(request, compute)
+
+    return app
+
+
+async def test_short_client_deadline_does_not_fail_coalesced_requests():
+    seen: list[float] = []
+    transport = httpx.ASGITransport(app=_app(seen))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        short, default = await asyncio.gather(
+            client.get("/slow", headers={"X-Request-Timeout-Ms": "20"}),
+            client.get("/slow"),
+        )
+    assert short.status_code == 504
+    assert default.status_code == 200
+    assert default.json() == {"ok": True}
+    # Un seul calcul, avec le budget serveur de la route et non les 20 ms du client.
+    assert len(seen) == 1
+    assert seen[0] > 1
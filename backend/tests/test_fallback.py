@@ -0,0 +1,58 @@
+"""Magasin de repli — écritures regroupées hors boucle, taille bornée."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+
+from backend.core.fallback import LastGoodStore
+
+
+async def test_updates_are_batched_into_one_write(tmp_path, monkeypatch):
+    path = tmp_path / "fallback.json"
+    store = LastGoodStore(path, flush_delay=0.05)
+    writes = []
+    replace = os.replace
+
+    def counting_replace(src, dst):
+        writes.append(dst)
+        replace(src, dst)
+
+    monkeypatch.setattr("backend.core.fallback.os.replace", counting_replace)
+    for i in range(50):
+        store.update("owner:links", {f"id{i}": [i]})
+    assert not path.exists()  # rien d'écrit avant le délai
+    await asyncio.sleep(0.2)
+    assert len(writes) == 1
+    assert json.loads(path.read_text())["owner:links"]["id49"] == [49]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+async def test_unchanged_values_do_not_write(tmp_path):
+    store = LastGoodStore(tmp_path / "fallback.json", flush_delay=0)
+    store.update("ns", {"a": 1})
+    await store.flush()
+    mtime = (tmp_path / "fallback.json").stat().st_mtime_ns
+    store.update("ns", {"a": 1})
+    await asyncio.sleep(0.05)
+    assert (tmp_path / "fallback.json").stat().st_mtime_ns == mtime
+
+
+async def test_flush_then_reload(tmp_path):
+    path = tmp_path / "fallback.json"
+    store = LastGoodStore(path, flush_delay=60)
+    store.update("ns", {"a": [1, 2]})
+    await store.flush()
+    assert LastGoodStore(path).get("ns") == {"a": [1, 2]}
+
+
+def test_size_is_bounded():
+    store = LastGoodStore(None, max_namespaces=2, max_keys=3)
+    for i in range(5):
+        store.update("ns", {f"k{i}": i})
+    assert list(store.get("ns")) == ["k2", "k3", "k4"]
+    store.update("other", {"x": 1})
+    store.update("third", {"y": 1})
+    assert store.get("ns") == {}
+    assert store.get("third") == {"y": 1}
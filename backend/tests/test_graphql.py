@@ -0,0 +1,84 @@
+"""Route GraphQL — exécution synchrone (introspection) et asynchrone (loaders)."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.api.dependencies import get_loaders
+from backend.app import app
+from backend.repositories.loaders import Loaders
+
+SKILLS = {
+    "s1": {"id": "s1", "nom": "Python", "category": "Langage", "description": ""},
+    "s2": {"id": "s2", "nom": "SQL", "category": "Base de données", "description": ""},
+}
+
+
+class FakeLoaders(Loaders):
+    """Loaders sans base : les documents viennent de `SKILLS`, chaque lot est enregistré."""
+
+    def __init__(self):
+        super().__init__(db=None, driver=None, owner="owner")
+        self.batches: list[list[str]] = []
+
+    async def _find_by_ids(self, name: str, ids: list[str]) -> dict[str, dict]:
+        self.batches.append(sorted(ids))
+        return {key: SKILLS[key] for key in ids if key in SKILLS}
+
+
+@pytest.fixture(autouse=True)
+def loaders():
+    loaders = FakeLoaders()
+    app.dependency_overrides[get_loaders] = lambda: loaders
+    return loaders
+
+
+async def test_typename(client):
+    response = await client.post("/graphql", json={"query": "{ __typename }"})
+    assert response.status_code == 200
+    assert response.json() == {"data": {"__typename": "Query"}}
+
+
+async def test_introspection(client):
+    response = await client.post("/graphql", json={"query": "{ __schema { queryType { name } } }"})
+    assert response.status_code == 200
+    assert response.json() == {"data": {"__schema": {"queryType": {"name": "Query"}}}}
+
+
+async def test_query_through_loader(client, loaders):
+    query = '{ a: skill(id: "s1") { nom } b: skill(id: "s2") { nom } skills(ids: ["s1", "x"]) { id } }'
+    response = await client.post("/graphql", json={"query": query})
+    assert response.status_code == 200
+    assert response.json() == {
+        "data": {"a": {"nom": "Python"}, "b": {"nom": "SQL"}, "skills": [{"id": "s1"}]},
+    }
+    # Les trois champs sont résolus dans le même tick : une seule requête groupée.
+    assert loaders.batches == [["s1", "s2", "x"]]
+
+
+async def test_cyclic_fragments_are_rejected(client):
+    query = (
+        '{ skill(id: "s1") { ...A } } '
+        "fragment A on Skill { nom ...B } fragment B on Skill { id ...A }"
+    )
+    response = await client.post("/graphql", json={"query": query})
+    assert response.status_code == 400
+    assert response.json()["errors"]
+
+
+@pytest.mark.parametrize("body", [
+    {"query": "{ __typename }", "extensions": [1]},
+    {"query": "{ __typename }", "variables": "x"},
+    {"query": "{ __typename }", "extensions": {"persistedQuery": 5}},
+    {"query": 5},
+])
+async def test_malformed_parameters_are_rejected(client, body):
+    response = await client.post("/graphql", json=body)
+    assert response.status_code == 400
+    assert response.json()["errors"][0]["message"]
+
+
+async def test_malformed_get_parameters_are_rejected(client):
+    response = await client.get("/graphql", params={"query": "{ __typename }", "extensions": "5"})
+    assert response.status_code == 400
+    assert response.json()["errors"][0]["message"]
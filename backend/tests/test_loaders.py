@@ -0,0 +1,38 @@
+"""Loaders par lot — regroupement des clés et suivi des requêtes groupées."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+
+from backend.repositories.loaders import DataLoader
+
+
+async def test_keys_of_a_tick_are_batched_once():
+    batches: list[list[str]] = []
+
+    async def batch(keys: list[str]) -> dict[str, str]:
+        batches.append(keys)
+        return {key: key.upper() for key in keys if key != "x"}
+
+    loader = DataLoader(batch)
+    assert await loader.load_many(["a", "b", "a", "x"]) == ["A", "B", "A", None]
+    assert batches == [["a", "b", "x"]]
+
+
+async def test_batch_task_is_kept_until_done():
+    release = asyncio.Event()
+
+    async def batch(keys: list[str]) -> dict[str, str]:
+        await release.wait()
+        return {key: key for key in keys}
+
+    loader = DataLoader(batch)
+    future = loader.load("a")
+    await asyncio.sleep(0)  # lancement de la requête groupée
+    assert len(loader._tasks) == 1
+    gc.collect()
+    release.set()
+    assert await future == "a"
+    await asyncio.sleep(0)
+    assert not loader._tasks
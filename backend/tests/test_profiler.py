@@ -0,0 +1,40 @@
+"""Profilage à la demande — sauvegarde des profils hors de la boucle asyncio."""
+
+from __future__ import annotations
+
+import threading
+
+import httpx
+from fastapi import FastAPI
+
+from backend.core import profiler
+from backend.core.config import Settings
+from backend.core.profiler import PROFILE_ID_HEADER, ProfilerMiddleware, ProfileStore
+
+
+async def test_profile_is_saved_off_the_loop(monkeypatch, tmp_path):
+    settings = Settings(profiler_enabled=True, profiler_sample_rate=1.0, profiler_max_profiles=2)
+    monkeypatch.setattr(profiler, "get_settings", lambda: settings)
+    store = ProfileStore(tmp_path, settings.profiler_max_profiles)
+    monkeypatch.setattr(profiler, "_store", store)
+    saved_in: list[int] = []
+    save = store.save
+    monkeypatch.setattr(store, "save", lambda profile: saved_in.append(threading.get_ident()) or save(profile))
+
+    app = FastAPI()
+    app.add_middleware(ProfilerMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return "pong"
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        ids = [(await client.get("/ping")).headers[PROFILE_ID_HEADER.decode()] for _ in range(3)]
+
+    assert len(saved_in) == 3
+    assert threading.get_ident() not in saved_in
+    # Les plus anciens sont purgés : seuls `profiler_max_profiles` profils restent.
+    summaries = store.list()
+    assert len(summaries) == 2
+    assert {summary["id"] for summary in summaries} <= set(ids)
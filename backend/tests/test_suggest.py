@@ -0,0 +1,75 @@
+"""Autocomplétion — classement, fautes de frappe et reconstruction des index."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+from backend.repositories import suggest
+from backend.repositories.suggest import SuggestEntry, SuggestIndex, SuggestIndexes
+
+ENTRIES = [
+    SuggestEntry("t1", "Docker", "technology", "DevOps"),
+    SuggestEntry("t2", "React.js", "technology", "Frontend"),
+    SuggestEntry("s1", "Python", "skill", "Langage"),
+    SuggestEntry("s2", "Programmation réseau", "skill", "Système"),
+    SuggestEntry("s3", "Data engineering Python", "skill", "Data"),
+]
+
+
+def _ids(results: list[SuggestEntry]) -> list[str]:
+    return [entry.id for entry in results]
+
+
+def test_prefix_ranking():
+    index = SuggestIndex(ENTRIES)
+    # Préfixe du nom, puis d'un mot du nom.
+    assert _ids(index.search("pyt")) == ["s1", "s3"]
+    assert _ids(index.search("reactjs")) == ["t2"]
+    assert _ids(index.search("reseau")) == ["s2"]
+    assert _ids(index.search("dev")) == ["t1"]  # catégorie
+
+
+def test_typos_and_types():
+    index = SuggestIndex(ENTRIES)
+    assert _ids(index.search("dokcer")) == ["t1"]
+    assert _ids(index.search("dokcer", types={"skill"})) == []
+    assert _ids(index.search("pyhton", types={"skill"})) == ["s1", "s3"]
+
+
+def test_typos_skipped_when_prefixes_fill_the_page(monkeypatch):
+    entries = [SuggestEntry(f"e{i}", f"Python {i}", "skill") for i in range(50)]
+    index = SuggestIndex(entries)
+    calls = []
+    monkeypatch.setattr(index, "_typos", lambda *args: calls.append(args) or {})
+    results = index.search("pyth", limit=5)
+    assert _ids(results) == ["e0", "e1", "e2", "e3", "e4"]
+    assert calls == []
+
+
+async def test_stale_index_is_rebuilt_once_off_the_loop(monkeypatch):
+    loop_thread = threading.get_ident()
+    built_in: list[int] = []
+
+    class Index(SuggestIndex):
+        def __init__(self, entries):
+            built_in.append(threading.get_ident())
+            super().__init__(entries)
+
+    monkeypatch.setattr(suggest, "SuggestIndex", Index)
+    indexes = SuggestIndexes(max_age=0)
+
+    async def load() -> list[SuggestEntry]:
+        return ENTRIES
+
+    first = await indexes.get("owner", load)
+    await asyncio.sleep(0.01)
+    # Index périmé : servi tel quel, une seule reconstruction lancée pour plusieurs requêtes.
+    assert await indexes.get("owner", load) is first
+    assert await indexes.get("owner", load) is first
+    assert len(indexes._rebuilds) == 1
+    await asyncio.gather(*indexes._rebuilds.values())
+    await asyncio.sleep(0)
+    assert not indexes._rebuilds
+    assert len(built_in) == 2
+    assert loop_thread not in built_in
@@ -1,202 +1,242 @@
 """Script de seed — charge les datasets dans les bases de données.
 
-Usage: python -m backend.scripts.seed_all
+Usage: python main.py [--datasets DOSSIER] [--workers N] [--strict] (depuis la racine, package `backend` installé)
 
-TODO (optionnel — étudiants ou fourni) :
-1. Lire datasets/cities.csv et insérer dans PostgreSQL
-2. Lire datasets/scores.csv et insérer dans PostgreSQL
-3. Lire datasets/reviews.jsonl et insérer dans MongoDB
-4. Créer les nœuds et relations dans Neo4j
+`--datasets` permet de charger un jeu généré par `backend.scripts.generate_dataset`.
+
+Chaque ligne est validée contre `shared.schemas` dans un pool de processus
+(`backend.scripts.ingest`) : les lignes invalides sont signalées
+(`fichier:ligne: erreur`) et ignorées, ou bloquent tout le seed avec `--strict`
+(une première passe de validation seule précède alors l'écriture).
+Les documents sont stockés sous forme canonique (noms de champs du modèle,
+dates BSON natives).
+
+Le chargement est en flux : chaque lot validé est inséré dans MongoDB dès
+qu'il est prêt, puis Neo4j est alimenté par lots relus depuis MongoDB. La
+mémoire reste bornée quelle que soit la taille des datasets.
+
+Multi-profil : chaque document porte `owner_id`, l'id du `Person` (ligne de
+`infos_personnels.jsonl`) auquel il appartient. Un document sans `owner_id`
+est rattaché au premier profil du fichier. Seuls les profils présents dans
+les datasets sont remplacés : les autres portfolios hébergés restent intacts.
+
+Les statistiques de `/portfolio/analytics` sont recalculées pour ces profils
+(`backend.scripts.analytics`).
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
-import csv
-import json
-from datetime import datetime, timezone
+import sys
+from collections import Counter
+from datetime import datetime
 from pathlib import Path
+from typing import Iterable
+
+from bson.codec_options import CodecOptions
+
+from backend.db.mongo import OWNER_FIELD, ensure_indexes, get_mongo_db
+from backend.db.neo4j import PERSON_RELATIONS, ensure_graph_indexes, get_neo4j_driver
+from backend.scripts.analytics import refresh_analytics
+from backend.scripts.ingest import CHUNK_LINES, Batch, LineError, dataset_files, ingest_batches
+
+DATASETS_DIR = Path(__file__).resolve().parent / "datasets"
 
+# Mapping : "nom_du_fichier.jsonl" : ("nom_de_la_collection_mongo", "Label Neo4j")
+DATASETS = {
+    "infos_personnels.jsonl": ("personal_infos", "Person"),
+    "projets.jsonl": ("projects", "Project"),
+    "experiences.jsonl": ("experiences", "Experience"),
+    "parcours_scolaire.jsonl": ("educations", "Education"),
+    "certifications.jsonl": ("certifications", "Certification"),
+    "skills.jsonl": ("skills", "Skill"),
+    "hobbies.jsonl": ("hobbies", "Hobby"),
+    "technologies.jsonl": ("technologies", "Technology"),
+}
 
-from backend.src.backend.db.mongo import get_mongo_db
-from backend.src.backend.db.neo4j import get_neo4j_driver
 
+def report(errors: list[LineError]) -> None:
+    for error in errors:
+        print(f"[seed] ❌ {error}")
 
-async def seed_mongo():
-    """Charge toutes les collections JSONL dans MongoDB."""
+
+async def seed_mongo(files: Iterable[str], batches: Iterable[Batch]) -> tuple[list[str], int]:
+    """Remplace les documents des profils chargés, lot par lot.
+
+    Les documents d'un profil sont supprimés d'une collection juste avant
+    l'insertion de son premier lot ; à la fin, les profils chargés absents
+    d'un fichier sont aussi retirés de sa collection.
+    Retourne `(ids des profils chargés, nombre de lignes invalides)`.
+    """
     db = get_mongo_db()
-    
-    # Mapping : "nom_du_fichier.jsonl" : "nom_de_la_collection_mongo"
-    # Assurez-vous que les fichiers existent bien dans DATASETS_DIR
-    collections_map = {
-        "infos_personnels.jsonl": "personal_infos",
-        "projets.jsonl": "projects",
-        "experiences.jsonl": "experiences",
-        "parcours_scolaire.jsonl": "educations",
-        "certifications.jsonl": "certifications",
-        "skills.jsonl": "skills",
-        "hobbies.jsonl": "hobbies",
-        "technologies.jsonl": "technologies"
-    }
-
-    for filename, col_name in collections_map.items():
-        file_path = "datasets/" + filename
-        if not file_path.exists():
-            print(f"[seed] ⚠️  Fichier ignoré (introuvable) : {filename}")
+    await ensure_indexes(db)
+
+    # ✂️ SOLUTION START
+    owners: set[str] = set()
+    reset: dict[str, set[str]] = {}
+    inserted: Counter[str] = Counter()
+    invalid = 0
+    for batch in batches:
+        report(batch.errors)
+        invalid += len(batch.errors)
+        if not batch.docs:
             continue
-
-        print(f"[seed] Traitement de {col_name} depuis {filename}...")
-        
-        # ✂️ SOLUTION START
+        col_name, _ = DATASETS[batch.filename]
         collection = db[col_name]
-        await collection.delete_many({})  # Reset de la collection
-
-        docs = []
-        with open(file_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                try:
-                    doc = json.loads(line)
-                    # Conservation de votre logique de date
-                    if isinstance(doc.get("created_at"), str):
-                        doc["created_at"] = datetime.fromisoformat(doc["created_at"].replace("Z", "+00:00"))
-                    elif doc.get("created_at") is None:
-                        doc["created_at"] = datetime.now(timezone.utc)
-                    
-                    docs.append(doc)
-                except json.JSONDecodeError:
-                    print(f"[seed] Erreur de décodage JSON dans {filename}")
-
-        if docs:
-            await collection.insert_many(docs)
-            print(f"[seed] ✅ {len(docs)} insérés dans '{col_name}'")
-        # ✂️ SOLUTION END
+        batch_owners = {doc[OWNER_FIELD] for doc in batch.docs}
+        done = reset.setdefault(col_name, set())
+        if batch_owners - done:
+            await collection.delete_many({OWNER_FIELD: {"$in": sorted(batch_owners - done)}})  # Reset des profils chargés
+            done |= batch_owners
+        owners |= batch_owners
+
+        # Documents déjà validés et canoniques (created_at compris)
+        await collection.insert_many(batch.docs)
+        inserted[col_name] += len(batch.docs)
+
+    for filename in files:
+        col_name, _ = DATASETS[filename]
+        stale = owners - reset.get(col_name, set())
+        if stale:
+            await db[col_name].delete_many({OWNER_FIELD: {"$in": sorted(stale)}})
+        print(f"[seed] ✅ {inserted[col_name]} insérés dans '{col_name}'")
+    # ✂️ SOLUTION END
 
     print("[seed] MongoDB — Global OK")
-   
+    return sorted(owners), invalid
 
 
-async def seed_neo4j():
-    """Charge les données JSONL du portfolio dans Neo4j et crée les relations."""
+async def seed_neo4j(owners: list[str], batch_size: int = CHUNK_LINES):
+    """Charge les documents des profils (relus depuis MongoDB, par lots) dans Neo4j et crée les relations."""
+    db = get_mongo_db()
     driver = get_neo4j_driver()
-    
-    # Mapping: Fichier JSONL -> Label Neo4j
-    files_mapping = {
-        "infos_personnels.jsonl": "Person",
-        "projets.jsonl": "Project",
-        "experiences.jsonl": "Experience",
-        "parcours_scolaire.jsonl": "Education",
-        "certifications.jsonl": "Certification",
-        "skills.jsonl": "Skill",
-        "hobbies.jsonl": "Hobby",
-        "technologies.jsonl": "Technology"
-    }
+    await ensure_graph_indexes(driver)
 
     async with driver.session() as session:
-        print("[seed] Neo4j — Nettoyage du graphe...")
+        print("[seed] Neo4j — Nettoyage des profils chargés...")
         # ✂️ SOLUTION START
-        # 1. Reset complet
-        await session.run("MATCH (n) DETACH DELETE n")
-
-        # 2. Chargement des Nœuds
-        person_id = None # On gardera l'ID de l'utilisateur principal
-
-        for filename, label in files_mapping.items():
-            file_path = DATASETS_DIR / filename
-            if not file_path.exists():
-                continue
-
-            # Lecture du fichier JSONL
-            nodes_data = []
-            with open(file_path, encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        data = json.loads(line)
-                        # On retire les sous-structures complexes pour Neo4j (ex: listes d'objets)
-                        # On garde les types primitifs pour les propriétés du nœud
-                        flat_data = {k: v for k, v in data.items() if isinstance(v, (str, int, float, bool))}
-                        nodes_data.append(flat_data)
-                        
-                        # Si c'est la personne, on capture son ID pour les relations
-                        if label == "Person" and not person_id:
-                            person_id = data.get("id")
-
+        # 1. Reset des profils chargés (les autres profils ne sont pas touchés),
+        #    label par label pour passer par l'index (owner_id, id)
+        for label in PERSON_RELATIONS:
+            await session.run(f"""
+                MATCH (n:{label}) WHERE n.{OWNER_FIELD} IN $owners AND n.id IS NOT NULL
+                DETACH DELETE n
+            """, owners=owners)
+        await session.run("MATCH (p:Person) WHERE p.id IN $owners DETACH DELETE p", owners=owners)
+
+        # 2. Chargement des Nœuds (dates relues avec leur fuseau, comme à l'ingestion)
+        tz_aware = CodecOptions(tz_aware=True)
+        for col_name, label in DATASETS.values():
+            # Création en batch (UNWIND) ; un id n'est unique qu'au sein d'un profil
+            query = f"""
+            UNWIND $batch AS row
+            MERGE (n:{label} {{{OWNER_FIELD}: row.{OWNER_FIELD}, id: row.id}})
+            SET n += row
+            """
+            cursor = db[col_name].with_options(codec_options=tz_aware).find(
+                {OWNER_FIELD: {"$in": owners}}, {"_id": 0}, batch_size=batch_size,
+            )
+            nodes_data: list[dict] = []
+            created = 0
+            async for data in cursor:
+                # On retire les sous-structures complexes pour Neo4j (ex: listes d'objets)
+                # On garde les types primitifs (et les dates) pour les propriétés du nœud
+                nodes_data.append({k: v for k, v in data.items() if isinstance(v, (str, int, float, bool, datetime))})
+                if len(nodes_data) == batch_size:
+                    await session.run(query, batch=nodes_data)
+                    created += len(nodes_data)
+                    nodes_data = []
             if nodes_data:
-                # Création en batch (UNWIND)
-                query = f"""
-                UNWIND $batch AS row
-                MERGE (n:{label} {{id: row.id}})
-                SET n += row
-                """
                 await session.run(query, batch=nodes_data)
-                print(f"[seed] Neo4j — {len(nodes_data)} nœuds '{label}' créés.")
+                created += len(nodes_data)
+            if created:
+                print(f"[seed] Neo4j — {created} nœuds '{label}' créés.")
 
         # 3. Création des Relations (Tous les liens possibles)
-        if person_id:
-            print("[seed] Neo4j — Création des relations...")
-            
-            # A) Lier la Personne principale à TOUT le reste (Hub central)
-            # Relations sémantiques basées sur le Label du nœud cible
-            relations_map = {
-                "Project": "CREATED",
-                "Experience": "WORKED_AT",
-                "Education": "STUDIED_AT",
-                "Certification": "CERTIFIED_IN",
-                "Skill": "MASTER",
-                "Hobby": "PRACTICES",
-                "Technology": "KNOWS"
-            }
-            
-            for target_label, rel_type in relations_map.items():
-                await session.run(f"""
-                    MATCH (p:Person {{id: $pid}}), (t:{target_label})
-                    MERGE (p)-[:{rel_type}]->(t)
-                """, pid=person_id)
-
-            # B) Liens Intelligents : Project -> Technology / Skill
-            # Si la description du projet contient le nom de la techno ou du skill
-            
-            # Project USES Technology
-            await session.run("""
-                MATCH (p:Project), (t:Technology)
-                WHERE toLower(p.description) CONTAINS toLower(t.nom) 
-                   OR toLower(p.description) CONTAINS toLower(t.name)
-                MERGE (p)-[:USES]->(t)
-            """)
-            
-            # Project REQUIRES Skill
-            await session.run("""
-                MATCH (p:Project), (s:Skill)
-                WHERE toLower(p.description) CONTAINS toLower(s.nom)
-                   OR toLower(p.description) CONTAINS toLower(s.name)
-                MERGE (p)-[:REQUIRES]->(s)
-            """)
-
-            # C) Experience -> Skill (Si la description du poste mentionne le skill)
-            await session.run("""
-                MATCH (e:Experience), (s:Skill)
-                WHERE toLower(e.description) CONTAINS toLower(s.nom)
-                MERGE (e)-[:USED_SKILL]->(s)
-            """)
-
-            # D) Skill -> Category (Auto-organisation des skills entre eux si catégorie commune)
-            # Optionnel : créer des méta-liens si besoin, mais ici on reste sur les entités.
+        print("[seed] Neo4j — Création des relations...")
+
+        # A) Lier chaque Personne à tout ce qui lui appartient (hub du profil)
+        # Relations sémantiques basées sur le Label du nœud cible
+        for target_label, rel_type in PERSON_RELATIONS.items():
+            await session.run(f"""
+                MATCH (t:{target_label}) WHERE t.{OWNER_FIELD} IN $owners
+                MATCH (p:Person {{id: t.{OWNER_FIELD}}})
+                MERGE (p)-[:{rel_type}]->(t)
+            """, owners=owners)
+
+        # B) Liens Intelligents : Project -> Technology / Skill, au sein d'un même profil
+        # Si la description du projet contient le nom de la techno ou du skill
+
+        # Project USES_TECHNOLOGY Technology
+        await session.run("""
+            MATCH (o:Person)-[:CREATED]->(p:Project), (o)-[:KNOWS]->(t:Technology)
+            WHERE o.id IN $owners
+              AND (toLower(p.description) CONTAINS toLower(t.nom)
+                   OR toLower(p.description) CONTAINS toLower(t.name))
+            MERGE (p)-[:USES_TECHNOLOGY]->(t)
+        """, owners=owners)
+
+        # Project REQUIRES_SKILL Skill
+        await session.run("""
+            MATCH (o:Person)-[:CREATED]->(p:Project), (o)-[:MASTER]->(s:Skill)
+            WHERE o.id IN $owners
+              AND (toLower(p.description) CONTAINS toLower(s.nom)
+                   OR toLower(p.description) CONTAINS toLower(s.name))
+            MERGE (p)-[:REQUIRES_SKILL]->(s)
+        """, owners=owners)
+
+        # C) Experience -> Skill (Si la description du poste mentionne le skill)
+        await session.run("""
+            MATCH (o:Person)-[:WORKED_AT]->(e:Experience), (o)-[:MASTER]->(s:Skill)
+            WHERE o.id IN $owners AND toLower(e.description) CONTAINS toLower(s.nom)
+            MERGE (e)-[:APPLIED_SKILL]->(s)
+        """, owners=owners)
+
+        # D) Certification -> Skill (Si le nom ou la description de la certification mentionne le skill)
+        await session.run("""
+            MATCH (o:Person)-[:CERTIFIED_IN]->(c:Certification), (o)-[:MASTER]->(s:Skill)
+            WHERE o.id IN $owners
+              AND (toLower(c.nom) CONTAINS toLower(s.nom)
+                   OR toLower(c.description) CONTAINS toLower(s.nom))
+            MERGE (c)-[:VALIDATES_SKILL]->(s)
+        """, owners=owners)
+
+        # E) Skill -> Category (Auto-organisation des skills entre eux si catégorie commune)
+        # Optionnel : créer des méta-liens si besoin, mais ici on reste sur les entités.
 
         # ✂️ SOLUTION END
         print("[seed] Neo4j — OK (Graphe complet généré)")
 
 
-async def main():
+async def main(datasets_dir: Path = DATASETS_DIR, workers: int | None = None, strict: bool = False):
     print("=" * 50)
     print("SmartCity Explorer — Seed")
     print("=" * 50)
-    await seed_mongo()
-    await seed_neo4j()
+    files = dataset_files(datasets_dir)
+    if strict:
+        # Validation seule d'abord : rien n'est écrit si une ligne est invalide.
+        invalid = 0
+        for batch in ingest_batches(files, workers):
+            report(batch.errors)
+            invalid += len(batch.errors)
+        if invalid:
+            print(f"[seed] {invalid} ligne(s) invalide(s) — seed annulé (--strict)")
+            sys.exit(1)
+    owners, invalid = await seed_mongo(files, ingest_batches(files, workers))
+    if invalid:
+        print(f"[seed] {invalid} ligne(s) invalide(s) ignorée(s)")
+    print(f"[seed] {len(owners)} profil(s) : {', '.join(owners)}")
+    await refresh_analytics(get_mongo_db(), owners)
+    print("[seed] Analytics — OK")
+    await seed_neo4j(owners)
     print("[seed] Terminé.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Charge les datasets JSONL dans MongoDB et Neo4j.")
+    parser.add_argument("--datasets", type=Path, default=DATASETS_DIR, help="Dossier des fichiers JSONL")
+    parser.add_argument("--workers", type=int, default=None, help="Processus de validation (défaut : nombre de CPU)")
+    parser.add_argument("--strict", action="store_true", help="Annule le seed si une ligne est invalide")
+    args = parser.parse_args()
+    asyncio.run(main(args.datasets, args.workers, args.strict))